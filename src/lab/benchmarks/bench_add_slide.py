@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Time to give new slides the placeholders of their layout.
+
+Creates `slide_count` blank slides, cycling through the first six layouts of
+the default template, then times adding the layout placeholders to each,
+first cloning each layout placeholder as `Slides.add_slide()` did before,
+then with `SlideShapes.clone_layout_placeholders()`, which copies
+placeholders the layout part keeps ready. The time of `Slides.add_slide()`
+as a whole is reported for reference.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_add_slide.py [slide_count]`.
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+
+
+def blank_slides(prs, layouts, slide_count):
+    """Return (slide, layout) pairs of new slides not yet having shapes."""
+    return [
+        (prs.part.new_slide(layouts[idx % 6]).slide, layouts[idx % 6])
+        for idx in range(slide_count)
+    ]
+
+
+def clone_each(pairs):
+    for slide, layout in pairs:
+        for placeholder in layout.iter_cloneable_placeholders():
+            slide.shapes.clone_placeholder(placeholder)
+
+
+def copy_ready(pairs):
+    for slide, layout in pairs:
+        slide.shapes.clone_layout_placeholders(layout)
+
+
+def main(slide_count):
+    print("%d slides" % slide_count)
+    print("%-26s %10s %12s" % ("case", "ms", "us / slide"))
+    for name, add_placeholders in (
+        ("clone each placeholder", clone_each),
+        ("copy ready placeholders", copy_ready),
+    ):
+        prs = Presentation()
+        pairs = blank_slides(prs, list(prs.slide_layouts)[:6], slide_count)
+        seconds = timeit.timeit(lambda: add_placeholders(pairs), number=1)
+        print(
+            "%-26s %10.1f %12.1f" % (name, seconds * 1e3, seconds * 1e6 / slide_count)
+        )
+
+    prs = Presentation()
+    slides, layouts = prs.slides, list(prs.slide_layouts)[:6]
+
+    def add_slides():
+        for idx in range(slide_count):
+            slides.add_slide(layouts[idx % 6])
+
+    seconds = timeit.timeit(add_slides, number=1)
+    print(
+        "%-26s %10.1f %12.1f"
+        % ("Slides.add_slide()", seconds * 1e3, seconds * 1e6 / slide_count)
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]] or [2000])
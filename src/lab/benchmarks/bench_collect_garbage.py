@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Saved size and time of subsetting a deck with and without garbage collection.
+
+Builds a deck of slides each having notes and its own picture, keeps one
+slide in ten and saves it plainly and with `collect_garbage=True`.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_collect_garbage.py [slide_count]`.
+"""
+
+from __future__ import print_function
+
+import io
+import struct
+import sys
+import timeit
+import zlib
+
+from pptx import Presentation
+from pptx.util import Inches
+
+
+def png(seed):
+    """Return the bytes of a small, unique 64x64 grayscale PNG image."""
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(
+            ">I", zlib.crc32(body) & 0xFFFFFFFF
+        )
+
+    rows = b"".join(
+        b"\x00" + bytes(bytearray((seed * 7 + x * y) % 256 for x in range(64)))
+        for y in range(64)
+    )
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", 64, 64, 8, 0, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
+
+def subset_deck(slide_count):
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+    for idx in range(slide_count):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.add_picture(io.BytesIO(png(idx)), Inches(1), Inches(1))
+        slide.notes_slide.notes_text_frame.text = "notes %d" % idx
+    for slide in [s for idx, s in enumerate(prs.slides) if idx % 10]:
+        prs.slides.remove_slide(slide)
+    return prs
+
+
+def main(slide_count):
+    print("%d slides, keeping %d" % (slide_count, (slide_count + 9) // 10))
+    print("%-20s %10s %10s %10s" % ("case", "bytes", "save ms", "reclaimed"))
+    for name, collect_garbage in (("plain", False), ("collect_garbage", True)):
+        prs = subset_deck(slide_count)
+        stream = io.BytesIO()
+        result = []
+        seconds = timeit.timeit(
+            lambda: result.append(prs.save(stream, collect_garbage=collect_garbage)),
+            number=1,
+        )
+        reclaimed = sum((result[0].bytes_reclaimed or {}).values())
+        print(
+            "%-20s %10d %10.1f %10d"
+            % (name, len(stream.getvalue()), seconds * 1e3, reclaimed)
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
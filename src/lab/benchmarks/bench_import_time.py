@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Wall time of `import pptx` in a fresh interpreter.
+
+Each measurement runs a new Python process so module caches never carry over.
+Besides the plain import, times the import followed by importing every module
+having a lazily registered element class, which approximates the eager
+registration `pptx.oxml` did before, and the import followed by opening the
+default presentation.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_import_time.py [repeat]`.
+"""
+
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+
+TIMED = """
+import time
+start = time.perf_counter()
+%s
+print(time.perf_counter() - start)
+"""
+
+CASES = (
+    ("import pptx", "import pptx"),
+    (
+        "+ all oxml modules",
+        "import importlib, pptx, pptx.oxml\n"
+        "for module_name, _ in set(pptx.oxml._lazy_element_classes.values()):\n"
+        "    importlib.import_module(module_name)",
+    ),
+    ("+ Presentation()", "import pptx\npptx.Presentation()"),
+)
+
+
+def seconds(statement):
+    output = subprocess.check_output(
+        [sys.executable, "-c", TIMED % statement], env=dict(os.environ)
+    )
+    return float(output)
+
+
+def main(repeat):
+    print("%-20s %10s" % ("case", "best ms"))
+    for name, statement in CASES:
+        best = min(seconds(statement) for _ in range(repeat))
+        print("%-20s %10.1f" % (name, best * 1e3))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Time to drop the unused slide layouts of a large presentation.
+
+Builds a presentation having a master with 66 slide layouts and
+`slide_count` slides based on a few of them, then removes each layout no
+slide uses, first with the linear scans `SlideLayout.used_by_slides` and
+`SlideLayouts.index()` did before, then with the slide layout and slide
+indexes. Also times looking up each layout by name.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_layout_index.py [slide_count]`.
+"""
+
+from __future__ import print_function
+
+import io
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.slide import SlideLayout, SlideLayouts
+
+
+def build_deck(slide_count):
+    prs = Presentation()
+    for round_idx in range(5):
+        src = Presentation()
+        for idx, layout in enumerate(src.slide_layouts):
+            layout.name = "Layout %d-%d" % (round_idx, idx)
+            src.slides.add_slide(layout)
+        prs.slides.import_from(src)
+    for idx in range(len(prs.slides)):
+        prs.slides.remove_slide(0)
+    layouts = prs.slide_layouts
+    for idx in range(slide_count):
+        prs.slides.add_slide(layouts[idx % 4])
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream
+
+
+def scan_used_by_slides(self):
+    slides = self.part.package.presentation_part.presentation.slides
+    return tuple(s for s in slides if s.slide_layout == self)
+
+
+def scan_index(self, slide_layout):
+    for idx, this_layout in enumerate(self):
+        if slide_layout == this_layout:
+            return idx
+    raise ValueError("layout not in this SlideLayouts collection")
+
+
+def scan_get_by_name(self, name, default=None):
+    for slide_layout in self:
+        if slide_layout.name == name:
+            return slide_layout
+    return default
+
+
+def drop_unused_layouts(prs):
+    slide_layouts = prs.slide_layouts
+    for slide_layout in list(slide_layouts):
+        if not slide_layout.used_by_slides:
+            slide_layouts.remove(slide_layout)
+
+
+def find_each_by_name(prs):
+    slide_layouts = prs.slide_layouts
+    for name in [slide_layout.name for slide_layout in slide_layouts] * 20:
+        slide_layouts.get_by_name(name)
+
+
+def scanning(case):
+    def run(prs):
+        indexed = (
+            SlideLayout.used_by_slides,
+            SlideLayouts.index,
+            SlideLayouts.get_by_name,
+        )
+        SlideLayout.used_by_slides = property(scan_used_by_slides)
+        SlideLayouts.index = scan_index
+        SlideLayouts.get_by_name = scan_get_by_name
+        try:
+            case(prs)
+        finally:
+            (
+                SlideLayout.used_by_slides,
+                SlideLayouts.index,
+                SlideLayouts.get_by_name,
+            ) = indexed
+
+    return run
+
+
+def main(slide_count):
+    stream = build_deck(slide_count)
+    prs = Presentation(stream)
+    print(
+        "%d slides, %d slide layouts"
+        % (len(prs.slides), len(prs.slide_layouts))
+    )
+    print("%-32s %10s %10s" % ("case", "ms", "layouts"))
+    for name, case in (
+        ("drop unused layouts, scanning", scanning(drop_unused_layouts)),
+        ("drop unused layouts, indexed", drop_unused_layouts),
+        ("find each by name x20, scanning", scanning(find_each_by_name)),
+        ("find each by name x20, indexed", find_each_by_name),
+    ):
+        prs = Presentation(stream)
+        seconds = timeit.timeit(lambda: case(prs), number=1)
+        print(
+            "%-32s %10.1f %10d" % (name, seconds * 1e3, len(prs.slide_layouts))
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]] or [2000])
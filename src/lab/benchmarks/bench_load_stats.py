@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Load cost per part, as reported by `prs.package.stats()`.
+
+Opens the presentation named on the command line, or the default template,
+then prints the parts taking the longest to parse and those holding the most
+memory, along with the time `stats()` itself takes.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_load_stats.py [path.pptx] [n]`.
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+
+
+def print_parts(title, part_stats):
+    print(title)
+    print(
+        "%-40s %8s %8s %9s %9s %10s"
+        % ("partname", "read ms", "parse ms", "blob B", "elements", "approx B")
+    )
+    for s in part_stats:
+        print(
+            "%-40s %8.2f %8.2f %9d %9d %10d"
+            % (
+                s.partname,
+                s.read_ms,
+                s.parse_ms,
+                s.blob_bytes,
+                s.element_count,
+                s.approx_bytes,
+            )
+        )
+    print()
+
+
+def main(path, n):
+    prs = Presentation(path)
+    stats = prs.package.stats()
+    print_parts(
+        "slowest to parse", sorted(stats, key=lambda s: s.parse_ms, reverse=True)[:n]
+    )
+    print_parts(
+        "most memory", sorted(stats, key=lambda s: s.approx_bytes, reverse=True)[:n]
+    )
+    seconds = min(timeit.repeat(prs.package.stats, number=1, repeat=5))
+    print(
+        "%d parts, %.1f KB estimated, stats() takes %.1f ms"
+        % (len(stats), sum(s.approx_bytes for s in stats) / 1024.0, seconds * 1e3)
+    )
+
+
+if __name__ == "__main__":
+    main(
+        sys.argv[1] if len(sys.argv) > 1 else None,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+    )
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Peak memory of merging many decks, streamed or assembled in memory.
+
+Writes `deck_count` source decks to a temporary directory, each having
+`slides_per_deck` slides with text boxes, a picture unique to the slide and
+notes, then merges them in a fresh process for each case, reporting the time
+and the peak resident set size of that process:
+
+* `import then save` imports each deck with `Slides.import_from()` into one
+  presentation, which is saved at the end.
+* `pptx.merge()` opens the decks one at a time and writes the slides of each
+  to the output as soon as they're copied.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_merge.py [deck_count] [slides_per_deck]`.
+"""
+
+from __future__ import print_function
+
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+IMAGE = "tests/test_files/monty-truth.png"
+
+
+def write_source_decks(dirpath, deck_count, slides_per_deck):
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    with open(IMAGE, "rb") as f:
+        png = f.read()
+    paths = []
+    for deck_idx in range(deck_count):
+        prs = Presentation()
+        for idx in range(slides_per_deck):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            for shape_idx in range(20):
+                textbox = slide.shapes.add_textbox(
+                    Inches(shape_idx % 5), Inches(shape_idx // 5), Inches(1), 0
+                )
+                textbox.text_frame.text = "deck %d slide %d " % (deck_idx, idx) * 20
+            # ---bytes after the end of the PNG make each picture distinct---
+            unique_png = png + b"%d-%d" % (deck_idx, idx) + b"\0" * 20000
+            image_path = os.path.join(dirpath, "image.png")
+            with open(image_path, "wb") as f:
+                f.write(unique_png)
+            slide.shapes.add_picture(image_path, Inches(1), Inches(1))
+            slide.notes_slide.notes_text_frame.text = "notes %d" % idx
+        path = os.path.join(dirpath, "deck%d.pptx" % deck_idx)
+        prs.save(path)
+        paths.append(path)
+    return paths
+
+
+def import_then_save(paths, out):
+    from pptx import Presentation
+
+    prs = Presentation()
+    for path in paths:
+        prs.slides.import_from(Presentation(path))
+    prs.save(out)
+
+
+def streamed(paths, out):
+    from pptx import merge
+
+    merge(paths, out)
+
+
+def run_case(name, paths, out):
+    """Run one case in this process and print its measurements."""
+    case = {"import": import_then_save, "merge": streamed}[name]
+    seconds = timeit.timeit(lambda: case(paths, out), number=1)
+    # ---ru_maxrss is in kilobytes on Linux---
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    print(
+        "%-18s %10.1f %10.1f %10.1f"
+        % (
+            {"import": "import then save", "merge": "pptx.merge()"}[name],
+            seconds * 1e3,
+            peak_mb,
+            os.path.getsize(out) / 1e6,
+        )
+    )
+
+
+def main(deck_count, slides_per_deck):
+    dirpath = tempfile.mkdtemp()
+    try:
+        paths = write_source_decks(dirpath, deck_count, slides_per_deck)
+        print(
+            "%d decks of %d slides, %.1f MB"
+            % (
+                deck_count,
+                slides_per_deck,
+                sum(os.path.getsize(path) for path in paths) / 1e6,
+            )
+        )
+        print("%-18s %10s %10s %10s" % ("case", "ms", "peak MB", "out MB"))
+        out = os.path.join(dirpath, "out.pptx")
+        for name in ("import", "merge"):
+            subprocess.check_call(
+                [sys.executable, __file__, "--case", name, out] + paths
+            )
+    finally:
+        shutil.rmtree(dirpath)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--case"]:
+        run_case(sys.argv[2], sys.argv[4:], sys.argv[3])
+    else:
+        args = [int(arg) for arg in sys.argv[1:]]
+        main(*(args + [30, 40][len(args):]))
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+XPath and accessor hot spots of a typical generator, found with `pptx.oxml.trace`.
+
+Times building a deck of slides having placeholders and added shapes with
+tracing off and on, then prints the trace report of the traced build.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_oxml_trace.py [slide_count]`.
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import trace
+from pptx.util import Inches
+
+
+def build_deck(slide_count):
+    prs = Presentation()
+    for idx in range(slide_count):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = "Slide %d" % idx
+        for n in range(5):
+            slide.shapes.add_shape(
+                MSO_SHAPE.RECTANGLE, Inches(n), Inches(5), Inches(1), Inches(1)
+            )
+        len(slide.shapes)
+
+
+def main(slide_count):
+    build_deck(1)  # ---import lazily registered classes before timing---
+    seconds = min(timeit.repeat(lambda: build_deck(slide_count), number=1, repeat=3))
+    trace.enable()
+    traced_seconds = min(
+        timeit.repeat(lambda: build_deck(slide_count), number=1, repeat=3)
+    )
+    trace.disable()
+    print(
+        "%d slides: %.1f ms untraced, %.1f ms traced\n"
+        % (slide_count, seconds * 1e3, traced_seconds * 1e3)
+    )
+    trace.report(n=10, file=sys.stdout)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
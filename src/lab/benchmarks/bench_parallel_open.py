@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Load time of `Presentation(pptx, workers=N)` for a generated many-slide deck.
+
+Builds a deck of text-and-table slides in memory, then opens it serially and
+with thread pools of increasing size, checking that each parallel load
+produces the same parts, in the same order, with the same XML as the serial
+load.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_parallel_open.py [slide_count]`.
+"""
+
+from __future__ import print_function
+
+import io
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.util import Inches
+
+
+def build_deck(slide_count):
+    prs = Presentation()
+    for idx in range(slide_count):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = "Slide %d" % idx
+        table = slide.shapes.add_table(
+            12, 6, Inches(0.5), Inches(1.5), Inches(9), Inches(5)
+        ).table
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = "r%d" % idx
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def part_xml(blob, workers):
+    prs = Presentation(io.BytesIO(blob), workers=workers)
+    return [(part.partname, part.blob) for part in prs.part.package.iter_parts()]
+
+
+def main(slide_count):
+    blob = build_deck(slide_count)
+    expected = part_xml(blob, None)
+    print("%d slides, %d parts" % (slide_count, len(expected)))
+    print("%-10s %10s" % ("workers", "load ms"))
+    for workers in (None, 2, 4, 8):
+        assert part_xml(blob, workers) == expected
+        seconds = min(
+            timeit.repeat(
+                lambda: Presentation(io.BytesIO(blob), workers=workers),
+                number=1,
+                repeat=5,
+            )
+        )
+        print("%-10s %10.1f" % (workers or 1, seconds * 1e3))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Time to read the effective geometry of every placeholder of many slides.
+
+Adds `slide_count` slides cycling through the first six layouts of the
+default template, then reads `left`, `top`, `width` and `height` of each
+placeholder of each slide three ways: with the linear scans of layout and
+master placeholders the lookups did before, with the cached lookups, and in
+bulk with `resolve_geometry()`.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_placeholder_geometry.py [slide_count]`.
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.shapes.placeholder import resolve_geometry
+from pptx.shapes.shapetree import LayoutPlaceholders, MasterPlaceholders
+
+
+def scan_layout_placeholders(self, idx, default=None):
+    for placeholder in self:
+        if placeholder.element.ph_idx == idx:
+            return placeholder
+    return default
+
+
+def scan_master_placeholders(self, ph_type, default=None):
+    for placeholder in self:
+        if placeholder.ph_type == ph_type:
+            return placeholder
+    return default
+
+
+def read_properties(slides):
+    return [
+        dict(
+            (ph.placeholder_format.idx, (ph.left, ph.top, ph.width, ph.height))
+            for ph in slide.placeholders
+        )
+        for slide in slides
+    ]
+
+
+def read_scanning(slides):
+    cached_gets = LayoutPlaceholders.get, MasterPlaceholders.get
+    LayoutPlaceholders.get = scan_layout_placeholders
+    MasterPlaceholders.get = scan_master_placeholders
+    try:
+        return read_properties(slides)
+    finally:
+        LayoutPlaceholders.get, MasterPlaceholders.get = cached_gets
+
+
+def main(slide_count):
+    prs = Presentation()
+    layouts = list(prs.slide_layouts)[:6]
+    for idx in range(slide_count):
+        prs.slides.add_slide(layouts[idx % 6])
+    slides = list(prs.slides)
+    print("%d slides" % slide_count)
+    print("%-24s %10s" % ("case", "ms"))
+    results = []
+    for name, read in (
+        ("scanning lookups", read_scanning),
+        ("cached lookups", read_properties),
+        ("resolve_geometry()", resolve_geometry),
+    ):
+        seconds = timeit.timeit(lambda: results.append(read(slides)), number=1)
+        print("%-24s %10.1f" % (name, seconds * 1e3))
+    assert results[0] == results[1] == results[2]
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]] or [2000])
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Package size and save time of `Presentation.save(optimize=True)`.
+
+Builds a deck of text-and-table slides, with the top edge of every table cell
+set so each cell carries its default edge lines, then saves it with and
+without optimization. Checks that the optimized package opens again with the same
+slide text and that saving did not change the presentation in memory.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_save_optimize.py [slide_count]`.
+"""
+
+from __future__ import print_function
+
+import io
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.util import Inches
+
+
+def build_deck(slide_count):
+    prs = Presentation()
+    for idx in range(slide_count):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = "Slide %d" % idx
+        table = slide.shapes.add_table(
+            8, 5, Inches(0.5), Inches(1.5), Inches(9), Inches(5)
+        ).table
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = "r%d" % idx
+                cell.edge.top.solid(0, 0, 0)
+    return prs
+
+
+def saved(prs, optimize):
+    stream = io.BytesIO()
+    report = prs.save(stream, optimize=optimize)
+    return stream.getvalue(), report.bytes_saved
+
+
+def slide_text(blob):
+    prs = Presentation(io.BytesIO(blob))
+    return [
+        [shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+        for slide in prs.slides
+    ]
+
+
+def main(slide_count):
+    prs = build_deck(slide_count)
+    xml_before = [part.blob for part in prs.part.package.iter_parts()]
+
+    plain, _ = saved(prs, False)
+    optimized, bytes_saved = saved(prs, True)
+    assert [part.blob for part in prs.part.package.iter_parts()] == xml_before
+    assert slide_text(optimized) == slide_text(plain)
+
+    print("%d slides" % slide_count)
+    print("XML bytes saved  %10d" % sum(bytes_saved.values()))
+    print("%-16s %10s %10s" % ("save", "pkg bytes", "ms"))
+    for name, optimize, blob in (
+        ("plain", False, plain),
+        ("optimize=True", True, optimized),
+    ):
+        seconds = min(
+            timeit.repeat(lambda: saved(prs, optimize), number=1, repeat=5)
+        )
+        print("%-16s %10d %10.1f" % (name, len(blob), seconds * 1e3))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
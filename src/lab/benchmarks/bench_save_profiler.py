@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Overhead of passing a profiler to `Presentation.save()`.
+
+Builds a deck of text-and-table slides, times saving it with and without a
+`TopPartsProfiler`, then prints the profiler's report of the costliest parts
+of the last save.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_save_profiler.py [slide_count]`.
+"""
+
+from __future__ import print_function
+
+import io
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.instrument import TopPartsProfiler
+from pptx.util import Inches
+
+
+def build_deck(slide_count):
+    prs = Presentation()
+    for idx in range(slide_count):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = "Slide %d" % idx
+        table = slide.shapes.add_table(
+            8, 5, Inches(0.5), Inches(1.5), Inches(9), Inches(5)
+        ).table
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = "r%d" % idx
+    return prs
+
+
+def main(slide_count):
+    prs = build_deck(slide_count)
+    print("%-16s %10s" % ("save", "ms"))
+    for name, make_profiler in (
+        ("plain", lambda: None),
+        ("profiled", TopPartsProfiler),
+    ):
+        seconds = min(
+            timeit.repeat(
+                lambda: prs.save(io.BytesIO(), profiler=make_profiler()),
+                number=1,
+                repeat=7,
+            )
+        )
+        print("%-16s %10.1f" % (name, seconds * 1e3))
+
+    profiler = TopPartsProfiler()
+    prs.save(io.BytesIO(), profiler=profiler)
+    print()
+    profiler.print_report(n=5)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
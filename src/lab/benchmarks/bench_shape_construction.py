@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Per-shape construction cost of the oxml `new_*` constructors.
+
+Compares formatting and parsing the XML template on every call, which is
+what the constructors did before prototype caching, with the current
+constructors, which deep-copy a prototype parsed once and set the variable
+attributes. Also times `SlideShapes.add_shape()` end to end.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_shape_construction.py [number]`.
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
+from pptx.oxml.shapes.picture import CT_Picture
+from pptx.oxml.table import CT_Table, CT_TableCell
+from pptx.util import Inches
+
+
+def reparse_autoshape():
+    tmpl = CT_Shape._autoshape_sp_tmpl()
+    return parse_xml(tmpl % (42, "Shape 41", 1, 2, 3, 4, "rect"))
+
+
+def reparse_textbox():
+    tmpl = CT_Shape._textbox_sp_tmpl()
+    return parse_xml(tmpl % (42, "TextBox 41", 1, 2, 3, 4))
+
+
+def reparse_graphicFrame():
+    tmpl = CT_GraphicalObjectFrame._graphicFrame_tmpl()
+    return parse_xml(tmpl % (42, "Table 41", 1, 2, 3, 4))
+
+
+def reparse_pic():
+    tmpl = CT_Picture._pic_tmpl()
+    return parse_xml(tmpl % (42, "Picture 41", "image.png", "rId2", 1, 2, 3, 4))
+
+
+def reparse_tc():
+    return parse_xml(CT_TableCell._tc_tmpl())
+
+
+CASES = (
+    (
+        "new_autoshape_sp",
+        reparse_autoshape,
+        lambda: CT_Shape.new_autoshape_sp(42, "Shape 41", "rect", 1, 2, 3, 4),
+    ),
+    (
+        "new_textbox_sp",
+        reparse_textbox,
+        lambda: CT_Shape.new_textbox_sp(42, "TextBox 41", 1, 2, 3, 4),
+    ),
+    (
+        "new_graphicFrame",
+        reparse_graphicFrame,
+        lambda: CT_GraphicalObjectFrame.new_graphicFrame(42, "Table 41", 1, 2, 3, 4),
+    ),
+    (
+        "new_pic",
+        reparse_pic,
+        lambda: CT_Picture.new_pic(42, "Picture 41", "image.png", "rId2", 1, 2, 3, 4),
+    ),
+    ("CT_TableCell.new", reparse_tc, CT_TableCell.new),
+)
+
+
+def usec_per_call(func, number):
+    return min(timeit.repeat(func, number=number, repeat=7)) / number * 1e6
+
+
+def main(number):
+    print("%-20s %12s %12s %8s" % ("constructor", "reparse us", "copy us", "speedup"))
+    for name, before, after in CASES:
+        t_before = usec_per_call(before, number)
+        t_after = usec_per_call(after, number)
+        print(
+            "%-20s %12.2f %12.2f %7.1fx"
+            % (name, t_before, t_after, t_before / t_after)
+        )
+
+    table_number = max(number // 100, 1)
+    t_tbl = usec_per_call(
+        lambda: CT_Table.new_tbl(20, 10, 9144000, 5143500), table_number
+    )
+    print("%-20s %12s %12.2f" % ("new_tbl 20x10", "", t_tbl))
+
+    # ---shape-id allocation scans the slide, so keep the shape count small---
+    prs = Presentation()
+    shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+    t_add = usec_per_call(
+        lambda: shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, Inches(1), Inches(1)),
+        100,
+    )
+    print("%-20s %12s %12.2f" % ("add_shape", "", t_add))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
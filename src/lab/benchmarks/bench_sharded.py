@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Time to generate a large deck in one process or sharded over several.
+
+Each slide gets a title, a bulleted body, a 4x4 table and one of a handful
+of pictures, so media is shared between shards. Cases:
+
+* `one process` builds all slides in this process.
+* `build_sharded(N)` builds them with `pptx.build_sharded()` on N worker
+  processes; the time includes starting the workers and assembling the
+  shards in this process.
+
+Each case ends by saving the deck to memory. The assembled decks are checked
+to have the same slide XML in the same order.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_sharded.py [slide_count] [max_processes]`.
+"""
+
+from __future__ import print_function
+
+import io
+import os
+import sys
+import timeit
+
+from pptx import Presentation, build_sharded
+from pptx.util import Inches
+
+IMAGE = "tests/test_files/monty-truth.png"
+
+
+def image_streams():
+    with open(IMAGE, "rb") as f:
+        png = f.read()
+    # ---bytes after the end of the PNG make each picture distinct---
+    return [png + b"%d" % idx for idx in range(5)]
+
+
+def build_slides(prs, start, stop):
+    images = image_streams()
+    layout = prs.slide_layouts[1]
+    for idx in range(start, stop):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = "Slide %d" % idx
+        text_frame = slide.placeholders[1].text_frame
+        text_frame.text = "first point of slide %d" % idx
+        for point_idx in range(4):
+            text_frame.add_paragraph().text = "point %d" % point_idx
+        table = slide.shapes.add_table(
+            4, 4, Inches(1), Inches(5), Inches(6), Inches(2)
+        ).table
+        for row_idx in range(4):
+            for col_idx in range(4):
+                table.cell(row_idx, col_idx).text = "%d.%d" % (row_idx, col_idx)
+        slide.shapes.add_picture(
+            io.BytesIO(images[idx % len(images)]), Inches(7), Inches(1)
+        )
+
+
+def one_process(slide_count):
+    prs = Presentation()
+    build_slides(prs, 0, slide_count)
+    return prs
+
+
+def sharded(slide_count, processes):
+    return lambda: saved(build_sharded(build_slides, slide_count, processes=processes))
+
+
+def saved(prs):
+    prs.save(io.BytesIO())
+    return prs
+
+
+def main(slide_count, max_processes):
+    print("%d slides, %d CPUs" % (slide_count, os.cpu_count()))
+    print("%-20s %10s %10s" % ("case", "ms", "speedup"))
+    cases = [("one process", lambda: saved(one_process(slide_count)))]
+    processes = 2
+    while processes <= max_processes:
+        cases.append(("build_sharded(%d)" % processes, sharded(slide_count, processes)))
+        processes *= 2
+    baseline = None
+    expected_xml = None
+    for name, case in cases:
+        result = []
+        seconds = timeit.timeit(lambda: result.append(case()), number=1)
+        baseline = seconds if baseline is None else baseline
+        print("%-20s %10.1f %10.2f" % (name, seconds * 1e3, baseline / seconds))
+        slides_xml = [slide.part.blob for slide in result[0].slides]
+        if expected_xml is None:
+            expected_xml = slides_xml
+        assert slides_xml == expected_xml, "%s built different slides" % name
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [5000, os.cpu_count() or 1][len(args):]))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Cost of simple-type conversion on the hot coordinate attributes.
+
+Compares the full conversion path, `convert_from_xml()` and validation
+followed by `convert_to_xml()`, with the cached `from_xml()` and fast-path
+`to_xml()`. Also compares reading a shape's position and size one property
+at a time with reading them in one `get_xfrm_values()` call.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_simpletypes.py [number]`.
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml.simpletypes import BaseSimpleType, ST_Coordinate
+from pptx.util import Emu, Inches
+
+
+def full_to_xml(value):
+    return BaseSimpleType.to_xml.__func__(ST_Coordinate, value)
+
+
+def main(number):
+    prs = Presentation()
+    shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+    sp = shapes.add_shape(
+        MSO_SHAPE.RECTANGLE, Inches(1), Inches(1), Inches(2), Inches(1)
+    )._element
+
+    cases = (
+        (
+            "ST_Coordinate from_xml",
+            lambda: ST_Coordinate.convert_from_xml("914400"),
+            lambda: ST_Coordinate.from_xml("914400"),
+        ),
+        (
+            "ST_Coordinate to_xml",
+            lambda: full_to_xml(Emu(914400)),
+            lambda: ST_Coordinate.to_xml(Emu(914400)),
+        ),
+        (
+            "x, y, cx, cy",
+            lambda: (sp.x, sp.y, sp.cx, sp.cy),
+            lambda: sp.get_xfrm_values("x", "y", "cx", "cy"),
+        ),
+    )
+
+    print("%-24s %10s %10s %8s" % ("case", "before us", "after us", "speedup"))
+    for name, before, after in cases:
+        t_before = min(timeit.repeat(before, number=number, repeat=7))
+        t_after = min(timeit.repeat(after, number=number, repeat=7))
+        print(
+            "%-24s %10.2f %10.2f %7.1fx"
+            % (
+                name,
+                t_before / number * 1e6,
+                t_after / number * 1e6,
+                t_before / t_after,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
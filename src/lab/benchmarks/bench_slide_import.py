@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Time to assemble a deck from slides of many source decks.
+
+Builds `deck_count` source decks from the default template, each having
+slides with a picture and notes, then imports `slide_count` slides into a new
+deck, first one slide per `Slides.import_from()` call and then one call per
+source deck. Reports the time and the number of parts in the result, which is
+the same both ways because layouts, masters and pictures are shared.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_slide_import.py [deck_count] [slide_count]`.
+"""
+
+from __future__ import print_function
+
+import io
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.util import Inches
+
+IMAGE = "tests/test_files/monty-truth.png"
+
+
+def source_decks(deck_count, slides_per_deck):
+    decks = []
+    for deck_idx in range(deck_count):
+        prs = Presentation()
+        for idx in range(slides_per_deck):
+            slide = prs.slides.add_slide(prs.slide_layouts[idx % 6])
+            slide.shapes.add_picture(IMAGE, Inches(1), Inches(1))
+            slide.notes_slide.notes_text_frame.text = "deck %d" % deck_idx
+        stream = io.BytesIO()
+        prs.save(stream)
+        decks.append(Presentation(stream))
+    return decks
+
+
+def one_at_a_time(decks, slides_per_deck):
+    prs = Presentation()
+    for src in decks:
+        for idx in range(slides_per_deck):
+            prs.slides.import_from(src, [idx])
+    return prs
+
+
+def one_call_per_deck(decks, slides_per_deck):
+    prs = Presentation()
+    for src in decks:
+        prs.slides.import_from(src, range(slides_per_deck))
+    return prs
+
+
+def main(deck_count, slide_count):
+    slides_per_deck = -(-slide_count // deck_count)
+    decks = source_decks(deck_count, slides_per_deck)
+    print("%d slides from %d decks" % (slides_per_deck * deck_count, deck_count))
+    print("%-20s %10s %8s" % ("case", "ms", "parts"))
+    for name, assemble in (
+        ("one at a time", one_at_a_time),
+        ("one call per deck", one_call_per_deck),
+    ):
+        result = []
+        seconds = timeit.timeit(
+            lambda: result.append(assemble(decks, slides_per_deck)), number=1
+        )
+        print(
+            "%-20s %10.1f %8d"
+            % (name, seconds * 1e3, len(result[0].part.package.parts))
+        )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [40, 300][len(args):]))
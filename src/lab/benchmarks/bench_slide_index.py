@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Cost of slide lookups in a large presentation.
+
+Times `Slides.index()`, `Slides.get()` and `PresentationPart.slide_id()` for
+the last slide of a presentation, using the slide index, against the linear
+scan of `p:sldIdLst` they each did before.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_slide_index.py [slide_count]`.
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+
+
+def main(slide_count):
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+    for _ in range(slide_count):
+        prs.slides.add_slide(layout)
+    slides, prs_part = prs.slides, prs.part
+    last = slides[-1]
+    last_id = last.slide_id
+
+    def scan_index():
+        for idx, sldId in enumerate(prs_part._element.sldIdLst):
+            if prs_part.related_parts[sldId.rId] is last.part:
+                return idx
+
+    def scan_get():
+        for sldId in prs_part._element.sldIdLst:
+            if sldId.id == last_id:
+                return prs_part.related_parts[sldId.rId].slide
+
+    cases = (
+        ("Slides.index()", scan_index, lambda: slides.index(last)),
+        ("Slides.get()", scan_get, lambda: slides.get(last_id)),
+        ("slide_id()", scan_index, lambda: prs_part.slide_id(last.part)),
+    )
+
+    number = 200
+    print("%d slides" % slide_count)
+    print("%-16s %10s %10s %8s" % ("case", "scan us", "index us", "speedup"))
+    for name, before, after in cases:
+        t_before = min(timeit.repeat(before, number=number, repeat=5))
+        t_after = min(timeit.repeat(after, number=number, repeat=5))
+        print(
+            "%-16s %10.2f %10.2f %7.1fx"
+            % (
+                name,
+                t_before / number * 1e6,
+                t_after / number * 1e6,
+                t_before / t_after,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1500)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Cost of sorting the slides of a large presentation.
+
+Compares `Slides.reorder()` with moving one `p:sldId` element at a time and
+renaming the slide parts after each move, which is what rearranging slides
+amounted to before. Both sort the slides by a key read from each slide, as
+when grouping slides by section.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_slide_reorder.py [slide_count]`.
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+
+
+def build(slide_count):
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+    for idx in range(slide_count):
+        prs.slides.add_slide(layout).name = "section %d" % (idx * 7919 % 13)
+    return prs
+
+
+def sort_one_at_a_time(prs):
+    slides = prs.slides
+    sldIdLst = slides._sldIdLst
+    keys = [slide.name for slide in slides]
+    sldIds = list(sldIdLst)
+    for dst, src in enumerate(sorted(range(len(keys)), key=keys.__getitem__)):
+        sldIdLst.insert(dst, sldIds[src])
+        prs.part.rename_slide_parts([sldId.rId for sldId in sldIdLst])
+
+
+def sort_reorder(prs):
+    slides = prs.slides
+    keys = [slide.name for slide in slides]
+    slides.reorder(sorted(range(len(keys)), key=keys.__getitem__))
+
+
+def main(slide_count):
+    print("%d slides" % slide_count)
+    print("%-20s %10s" % ("case", "ms"))
+    for name, sort in (
+        ("one at a time", sort_one_at_a_time),
+        ("reorder()", sort_reorder),
+    ):
+        prs = build(slide_count)
+        seconds = timeit.timeit(lambda: sort(prs), number=1)
+        print("%-20s %10.1f" % (name, seconds * 1e3))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
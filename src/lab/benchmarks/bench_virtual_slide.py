@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Time to build many slides, each with a filled-in title and body placeholder.
+
+Cases:
+
+* `add_slide` adds each slide to the presentation with `Slides.add_slide()`
+  and fills it in.
+* `new_slide (before)` builds each slide apart from the presentation the way
+  a virtual slide was built before skeletons, with `Slides.new_slide()` on the
+  private presentation, and fills it in.
+* `virtual Slide` creates each virtual slide from the skeleton of its layout
+  and fills it in.
+* `virtual + append_slides` does the same and then adds all of the slides to
+  a presentation with one `append_slides()` call.
+* `... on N threads` builds the virtual slides on N worker threads before
+  adding them.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_virtual_slide.py [slide_count] [thread_count]`.
+"""
+
+from __future__ import print_function
+
+import sys
+import threading
+import timeit
+
+from pptx import Presentation
+from pptx.virtual.slide import Slide, append_slides
+
+
+def fill(slide, idx):
+    slide.shapes.title.text = "Slide %d" % idx
+    slide.placeholders[1].text_frame.text = "body text of slide %d" % idx
+
+
+def add_slide(slide_count):
+    prs = Presentation()
+    layout = prs.slide_layouts[1]
+    for idx in range(slide_count):
+        fill(prs.slides.add_slide(layout), idx)
+
+
+def new_slide(slide_count):
+    prs = Slide._false_package
+    layout = prs.slide_layouts[1]
+    for idx in range(slide_count):
+        fill(prs.slides.new_slide(layout), idx)
+
+
+def virtual_slides(slide_count):
+    slides = []
+    for idx in range(slide_count):
+        slide = Slide(1)
+        fill(slide, idx)
+        slides.append(slide)
+    return slides
+
+
+def virtual_appended(slide_count):
+    append_slides(Presentation(), virtual_slides(slide_count))
+
+
+def threaded_appended(slide_count, thread_count):
+    results = [None] * thread_count
+    share = slide_count // thread_count
+
+    def work(n):
+        results[n] = virtual_slides(share)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    append_slides(Presentation(), [slide for slides in results for slide in slides])
+
+
+def main(slide_count, thread_count):
+    Slide(1)  # ---build the skeletons before timing---
+    cases = (
+        ("add_slide", lambda: add_slide(slide_count)),
+        ("new_slide (before)", lambda: new_slide(slide_count)),
+        ("virtual Slide", lambda: virtual_slides(slide_count)),
+        ("virtual + append_slides", lambda: virtual_appended(slide_count)),
+        (
+            "... on %d threads" % thread_count,
+            lambda: threaded_appended(slide_count, thread_count),
+        ),
+    )
+    print("%d slides" % slide_count)
+    print("%-26s %10s %12s" % ("case", "ms", "us/slide"))
+    for name, case in cases:
+        seconds = min(timeit.repeat(case, number=1, repeat=3))
+        print(
+            "%-26s %10.1f %12.1f"
+            % (name, seconds * 1e3, seconds * 1e6 / slide_count)
+        )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [2000, 4][len(args):]))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Per-call cost of the xmlchemy-generated accessors and `BaseOxmlElement.xpath()`.
+
+Compares computing the Clark name (and compiling the XPath expression) on
+every call, which is what the accessors did before caching, with the current
+accessors, which bind the Clark name when the class is created and reuse a
+compiled `etree.XPath` per expression.
+
+Run from the repository root with `PYTHONPATH=src python
+src/lab/benchmarks/bench_xmlchemy_accessors.py [number]`.
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from lxml import etree
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import NamespacePrefixedTag, _nsmap, nsdecls
+from pptx.oxml.simpletypes import ST_Coordinate
+
+SP_XML = (
+    "<p:sp %s>\n"
+    "  <p:nvSpPr>\n"
+    '    <p:cNvPr id="2" name="Shape 1"/>\n'
+    "    <p:cNvSpPr/>\n"
+    "    <p:nvPr/>\n"
+    "  </p:nvSpPr>\n"
+    "  <p:spPr>\n"
+    "    <a:xfrm>\n"
+    '      <a:off x="1" y="2"/>\n'
+    '      <a:ext cx="3" cy="4"/>\n'
+    "    </a:xfrm>\n"
+    "  </p:spPr>\n"
+    "</p:sp>" % nsdecls("a", "p")
+)
+
+
+def main(number):
+    sp = parse_xml(SP_XML)
+    off = sp.spPr.xfrm.off
+    xpath_str = "./p:nvSpPr/p:cNvPr/@id"
+
+    def uncached_child():
+        return sp.find(NamespacePrefixedTag("p:spPr").clark_name)
+
+    def uncached_attr():
+        return ST_Coordinate.from_xml(off.get("x"))
+
+    def uncached_xpath():
+        return etree.ElementBase.xpath(sp, xpath_str, namespaces=_nsmap)
+
+    cases = (
+        ("child getter", uncached_child, lambda: sp.spPr),
+        ("attribute getter", uncached_attr, lambda: off.x),
+        ("xpath()", uncached_xpath, lambda: sp.xpath(xpath_str)),
+    )
+
+    print("%-20s %12s %12s %8s" % ("accessor", "uncached us", "cached us", "speedup"))
+    for name, before, after in cases:
+        t_before = min(timeit.repeat(before, number=number, repeat=7))
+        t_after = min(timeit.repeat(after, number=number, repeat=7))
+        print(
+            "%-20s %12.2f %12.2f %7.1fx"
+            % (
+                name,
+                t_before / number * 1e6,
+                t_after / number * 1e6,
+                t_before / t_after,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -9,23 +9,37 @@ be named as internal (leading underscore).
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import gc
+import io
 import os
 
 from .opc.constants import CONTENT_TYPE as CT
+from .opc.pkgwriter import StreamingPackageWriter
 from .package import Package
+from .parts.importer import SlideShard
 
 
-def Presentation(pptx=None):
+def Presentation(pptx=None, workers=None):
     """
     Return a |Presentation| object loaded from *pptx*, where *pptx* can be
     either a path to a ``.pptx`` file (a string) or a file-like object. If
     *pptx* is missing or ``None``, the built-in default presentation
     "template" is loaded.
+
+    When *workers* is an integer greater than 1, the XML parts of the
+    package are parsed by a pool of that many threads, which can shorten
+    loading of presentations having many slides, layouts, or charts. The
+    loaded presentation is the same either way.
+
+    Presentations may be loaded, built, and saved concurrently from several
+    threads, each parsing with its own XML parser. A single presentation and
+    the objects obtained from it are not thread-safe however, and must be used
+    by one thread at a time.
     """
     if pptx is None:
         pptx = _default_pptx_path()
 
-    presentation_part = Package.open(pptx).main_document_part
+    presentation_part = Package.open(pptx, workers=workers).main_document_part
 
     if not _is_pptx_package(presentation_part):
         tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
@@ -34,6 +48,91 @@ def Presentation(pptx=None):
     return presentation_part.presentation
 
 
+def merge(pptx_files, out, template=None):
+    """
+    Write to *out* a presentation having the slides of each presentation in
+    *pptx_files*, in that order, following any slides of *template*. *out*
+    and each item of *pptx_files* can be a path or a file-like object, and
+    *template* is loaded like the argument to :func:`Presentation`.
+
+    Slides are copied as by :meth:`.Slides.import_from`. Source
+    presentations are opened one at a time and the slides of each, along
+    with their notes, charts and pictures, are written to *out* as soon as
+    they're copied, so memory use stays near that of the largest source
+    presentation plus the slide layouts and masters of the result, however
+    many presentations are merged.
+    """
+    prs = Presentation(template)
+    prs_part = prs.part
+    pkg_writer = StreamingPackageWriter(out)
+    for pptx_file in pptx_files:
+        src_prs = Presentation(pptx_file)
+        slide_parts = [slide.part for slide in prs.slides.import_from(src_prs)]
+        del src_prs
+        prs_part.stream_slides(slide_parts, pkg_writer)
+        del slide_parts
+        # ---parts refer to their package and to each other, so are only
+        # ---released by the cycle collector---
+        gc.collect()
+    prs_part.package.finish_streaming(pkg_writer)
+
+
+def build_sharded(
+    build_slides, slide_count, template=None, processes=None, shard_size=None
+):
+    """
+    Return a |Presentation| loaded from *template* with *slide_count* slides
+    added by *build_slides*, run in a pool of *processes* worker processes,
+    as many as there are CPUs when *processes* is |None|. *template* is
+    loaded like the argument to :func:`Presentation`.
+
+    The slides are split into consecutive ranges of *shard_size* slides, by
+    default small enough for each worker to get several. For each range,
+    a worker loads *template* and calls `build_slides(prs, start, stop)`,
+    which must add the slides at positions *start* up to but not including
+    *stop* at the end of the slides of *prs*. The new slides are returned to
+    this process as a |SlideShard| and appended in order, so the result
+    doesn't depend on which worker built which range. *build_slides* must
+    be picklable, like a function defined at the top level of a module.
+
+    Slides can use the slide layouts of *template* but should not change
+    them. Pictures and media used by slides of several ranges are stored
+    once. A hyperlink to a slide built by another worker is removed.
+    """
+    # ---imported here, concurrent.futures adds noticeably to import time---
+    from concurrent.futures import ProcessPoolExecutor
+
+    template_blob = _template_blob(template)
+    prs = Presentation(io.BytesIO(template_blob))
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if shard_size is None:
+        shard_size = max(1, -(-slide_count // (processes * 4)))
+    starts = list(range(0, slide_count, shard_size))
+    stops = [min(start + shard_size, slide_count) for start in starts]
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_init_shard_worker,
+        initargs=(template_blob,),
+    ) as executor:
+        shards = executor.map(
+            _build_shard, [build_slides] * len(starts), starts, stops
+        )
+        prs.slides.import_shards(shards)
+    return prs
+
+
+def _build_shard(build_slides, start, stop):
+    """
+    Return a |SlideShard| holding the slides *build_slides* adds to a new
+    presentation loaded from the template of this worker process.
+    """
+    prs = Presentation(io.BytesIO(_shard_template_blob))
+    slide_count = len(prs.slides)
+    build_slides(prs, start, stop)
+    return SlideShard([slide.part for slide in list(prs.slides)[slide_count:]])
+
+
 def _default_pptx_path():
     """
     Return the path to the built-in default .pptx package.
@@ -42,6 +141,11 @@ def _default_pptx_path():
     return os.path.join(_thisdir, "templates", "default.pptx")
 
 
+def _init_shard_worker(template_blob):
+    global _shard_template_blob
+    _shard_template_blob = template_blob
+
+
 def _is_pptx_package(prs_part):
     """
     Return |True| if *prs_part* is a valid main document part, |False|
@@ -49,3 +153,20 @@ def _is_pptx_package(prs_part):
     """
     valid_content_types = (CT.PML_PRESENTATION_MAIN, CT.PML_PRES_MACRO_MAIN)
     return prs_part.content_type in valid_content_types
+
+
+def _template_blob(template):
+    """
+    Return the bytes of the .pptx package *template*, a path, a file-like
+    object or |None| for the built-in default presentation.
+    """
+    if template is None:
+        template = _default_pptx_path()
+    if hasattr(template, "read"):
+        return template.read()
+    with open(template, "rb") as f:
+        return f.read()
+
+
+# ---bytes of the template a shard worker process builds slides against---
+_shard_template_blob = None
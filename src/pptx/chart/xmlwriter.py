@@ -7,7 +7,7 @@ Composers for default chart XML for various chart types.
 from __future__ import absolute_import, print_function, unicode_literals
 
 from copy import deepcopy
-from xml.sax.saxutils import escape
+from html import escape
 
 from ..compat import to_unicode
 from ..enum.chart import XL_CHART_TYPE
@@ -120,7 +120,7 @@ class _BaseSeriesXmlWriter(object):
         """
         The XML-escaped name for this series.
         """
-        return escape(self._series.name)
+        return escape(self._series.name, quote=False)
 
     def numRef_xml(self, wksht_ref, number_format, values):
         """
@@ -1530,7 +1530,10 @@ class _CategorySeriesXmlWriter(_BaseSeriesXmlWriter):
                 "                  <c:v>{cat_label}</c:v>\n"
                 "                </c:pt>\n"
             ).format(
-                **{"cat_idx": idx, "cat_label": escape(to_unicode(category.label))}
+                **{
+                    "cat_idx": idx,
+                    "cat_label": escape(to_unicode(category.label), quote=False),
+                }
             )
         return xml
 
@@ -1565,7 +1568,7 @@ class _CategorySeriesXmlWriter(_BaseSeriesXmlWriter):
                     '                  <c:pt idx="%d">\n'
                     "                    <c:v>%s</c:v>\n"
                     "                  </c:pt>\n"
-                ) % (idx, escape("%s" % name))
+                ) % (idx, escape("%s" % name, quote=False))
             return xml
 
         xml = ""
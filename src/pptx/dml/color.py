@@ -310,3 +310,16 @@ class RGBColor(tuple):
         g = int(rgb_hex_str[2:4], 16)
         b = int(rgb_hex_str[4:], 16)
         return cls(r, g, b)
+
+
+def rgb_hex(color):
+    """Hex RGB str of |RGBColor| or hex str *color*.
+
+    Raises |ValueError| when a str is not a valid hex RGB value, so it never
+    reaches the XML.
+    """
+    if not isinstance(color, RGBColor):
+        if len(color) != 6:
+            raise ValueError("expected six-digit hex RGB str, got %r" % color)
+        color = RGBColor.from_string(color)
+    return str(color)
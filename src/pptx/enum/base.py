@@ -122,9 +122,16 @@ class MetaEnumeration(type):
     def __new__(meta, clsname, bases, clsdict):
         meta._add_enum_members(clsdict)
         meta._collect_valid_settings(clsdict)
-        meta._generate_docs_page(clsname, clsdict)
         return type.__new__(meta, clsname, bases, clsdict)
 
+    @property
+    def __docs_rst__(cls):
+        """
+        The RST documentation page for the enumeration, generated when
+        accessed rather than when the enumeration class is defined.
+        """
+        return _DocsPageFormatter(cls.__name__, cls.__dict__).page_str
+
     @classmethod
     def _add_enum_members(meta, clsdict):
         """
@@ -148,13 +155,6 @@ class MetaEnumeration(type):
             valid_settings.extend(member.valid_settings)
         clsdict["_valid_settings"] = valid_settings
 
-    @classmethod
-    def _generate_docs_page(meta, clsname, clsdict):
-        """
-        Return the RST documentation page for the enumeration.
-        """
-        clsdict["__docs_rst__"] = _DocsPageFormatter(clsname, clsdict).page_str
-
 
 class EnumerationBase(object):
     """
@@ -0,0 +1,255 @@
+# encoding: utf-8
+
+"""
+Measurements of where time and memory go in loading and saving a presentation.
+
+After a presentation is opened, :meth:`.OpcPackage.stats` returns a
+|PartLoadStats| object for each part, giving the time taken to read and parse
+it and an estimate of the memory it holds::
+
+    prs = Presentation("template.pptx")
+    for part_stats in prs.package.stats():
+        print(part_stats.partname, part_stats.parse_ms, part_stats.approx_bytes)
+
+For saving, an object passed as the *profiler* argument of
+:meth:`.Presentation.save` is notified once for each part written, with a
+|PartSaveEvent|, and once when the whole package has been written, with a
+|PackageSaveEvent|. Subclass |SaveProfiler| and override either or both
+methods to forward these to a metrics system. |TopPartsProfiler| is a
+ready-made profiler that reports the costliest parts of a save::
+
+    profiler = TopPartsProfiler()
+    prs.save("deck.pptx", profiler=profiler)
+    profiler.print_report(n=10)
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import sys
+
+from timeit import default_timer
+
+
+class PartSaveEvent(object):
+    """
+    Measurements for one part written by a profiled save.
+
+    *raw_bytes* is the length of the part blob and *compressed_bytes* the size
+    of its zip member. *serialize_ms* is the time taken to produce the blob,
+    which for an XML part is mostly serializing its XML, and *compress_ms* the
+    time taken to deflate the blob and write it to the zip archive; the two
+    can't be told apart as the zip module does both in one call.
+    """
+
+    __slots__ = (
+        "partname",
+        "content_type",
+        "raw_bytes",
+        "compressed_bytes",
+        "serialize_ms",
+        "compress_ms",
+    )
+
+    def __init__(
+        self,
+        partname,
+        content_type,
+        raw_bytes,
+        compressed_bytes,
+        serialize_ms,
+        compress_ms,
+    ):
+        self.partname = partname
+        self.content_type = content_type
+        self.raw_bytes = raw_bytes
+        self.compressed_bytes = compressed_bytes
+        self.serialize_ms = serialize_ms
+        self.compress_ms = compress_ms
+
+    @property
+    def total_ms(self):
+        """Time spent on this part, serializing and compressing."""
+        return self.serialize_ms + self.compress_ms
+
+
+class PackageSaveEvent(object):
+    """
+    Measurements for a profiled save as a whole.
+
+    *marshal_ms* is the time spent in the `before_marshal()` step of all
+    parts and *total_ms* the time taken by the whole save, including writing
+    the content-types and relationship items, which aren't reported as parts.
+    """
+
+    __slots__ = ("part_count", "marshal_ms", "total_ms")
+
+    def __init__(self, part_count, marshal_ms, total_ms):
+        self.part_count = part_count
+        self.marshal_ms = marshal_ms
+        self.total_ms = total_ms
+
+
+class SaveReport(object):
+    """
+    What a save left out of the package, returned by :meth:`.OpcPackage.save`.
+
+    *bytes_saved* maps the partname of each part written to the bytes the
+    output-size optimization saved on it, and is |None| unless the save was
+    optimized. *bytes_reclaimed* maps the partname of each part discarded by
+    garbage collection to its size in bytes, and is |None| unless garbage was
+    collected. A partname in *bytes_reclaimed* is the one the part had when
+    it was discarded; the save may then renumber the remaining slide parts,
+    so the saved package can hold a different part under that name.
+    """
+
+    __slots__ = ("bytes_saved", "bytes_reclaimed")
+
+    def __init__(self, bytes_saved, bytes_reclaimed):
+        self.bytes_saved = bytes_saved
+        self.bytes_reclaimed = bytes_reclaimed
+
+
+class SaveProfiler(object):
+    """
+    Base class for save profilers, ignoring each event.
+
+    Both methods are called from the thread doing the save and add to its
+    duration, so should return quickly.
+    """
+
+    def part_saved(self, event):
+        """Called with a |PartSaveEvent| after each part is written."""
+
+    def package_saved(self, event):
+        """Called with a |PackageSaveEvent| after the package is written."""
+
+
+class TopPartsProfiler(SaveProfiler):
+    """
+    Profiler collecting the events of one or more saves for reporting.
+    """
+
+    def __init__(self):
+        self.part_events = []
+        self.package_events = []
+
+    def part_saved(self, event):
+        self.part_events.append(event)
+
+    def package_saved(self, event):
+        self.package_events.append(event)
+
+    def print_report(self, n=10, file=None):
+        """
+        Print the *n* parts taking the most time to save, costliest first,
+        followed by the totals, to *file*, `sys.stdout` by default.
+        """
+        file = sys.stdout if file is None else file
+        print(
+            "%-40s %9s %9s %9s %9s"
+            % ("partname", "raw B", "zip B", "ser ms", "zip ms"),
+            file=file,
+        )
+        for event in self.top(n):
+            print(
+                "%-40s %9d %9d %9.2f %9.2f"
+                % (
+                    event.partname,
+                    event.raw_bytes,
+                    event.compressed_bytes,
+                    event.serialize_ms,
+                    event.compress_ms,
+                ),
+                file=file,
+            )
+        print(
+            "%d parts in %d saves, %.1f ms marshal, %.1f ms total"
+            % (
+                len(self.part_events),
+                len(self.package_events),
+                sum(event.marshal_ms for event in self.package_events),
+                sum(event.total_ms for event in self.package_events),
+            ),
+            file=file,
+        )
+
+    def top(self, n=10):
+        """
+        Return the *n* |PartSaveEvent| objects having the largest `total_ms`,
+        largest first.
+        """
+        return sorted(self.part_events, key=lambda e: e.total_ms, reverse=True)[:n]
+
+
+class PartLoadStats(object):
+    """
+    Load cost and memory estimate for one part of an opened package.
+
+    *read_ms* is the time taken to read the part and its relationships from
+    the zip archive, *parse_ms* the time taken to construct the part object,
+    which for an XML part is mostly parsing its XML, and *blob_bytes* the
+    size of the part as stored in the package. These three are |None| for a
+    part added after the package was opened.
+
+    *element_count* and *approx_bytes* describe the part as it is when
+    :meth:`.OpcPackage.stats` is called. *approx_bytes* is a rough estimate
+    of the memory the part holds, counting the libxml2 structures of an XML
+    part or the blob of a binary one.
+    """
+
+    __slots__ = (
+        "partname",
+        "content_type",
+        "read_ms",
+        "parse_ms",
+        "blob_bytes",
+        "element_count",
+        "approx_bytes",
+    )
+
+    def __init__(
+        self,
+        partname,
+        content_type,
+        read_ms,
+        parse_ms,
+        blob_bytes,
+        element_count,
+        approx_bytes,
+    ):
+        self.partname = partname
+        self.content_type = content_type
+        self.read_ms = read_ms
+        self.parse_ms = parse_ms
+        self.blob_bytes = blob_bytes
+        self.element_count = element_count
+        self.approx_bytes = approx_bytes
+
+
+# ---approximate size of a libxml2 node (xmlNode) and of an attribute, being an
+# ---xmlAttr with the text node holding its value, on a 64-bit build---
+_NODE_BYTES = 120
+_ATTR_BYTES = 216
+
+
+def tree_memory_estimate(element):
+    """
+    Return an `(element_count, approx_bytes)` pair for the XML tree rooted at
+    *element*. Counting is done by XPath so no Python element proxies are
+    created along the way.
+    """
+    element_count = int(element.xpath("count(descendant-or-self::*)"))
+    text_count = int(element.xpath("count(descendant::text())"))
+    attr_count = int(element.xpath("count(descendant-or-self::*/@*)"))
+    text_chars = int(element.xpath("string-length(.)"))
+    approx_bytes = (
+        (element_count + text_count) * _NODE_BYTES
+        + attr_count * _ATTR_BYTES
+        + text_chars
+    )
+    return element_count, approx_bytes
+
+
+def milliseconds_since(start):
+    """Return milliseconds elapsed since *start*, a `default_timer()` value."""
+    return (default_timer() - start) * 1000.0
@@ -7,11 +7,21 @@ writing presentations to and from a .pptx file.
 
 from __future__ import absolute_import
 
+from timeit import default_timer
+
+from pptx.instrument import (
+    PackageSaveEvent,
+    PartLoadStats,
+    SaveReport,
+    milliseconds_since,
+    tree_memory_estimate,
+)
 from pptx.util import lazyproperty
 
 from .constants import RELATIONSHIP_TYPE as RT
 from .oxml import CT_Relationships, serialize_part_xml
 from ..oxml import parse_xml
+from ..oxml.optimize import optimized_copy
 from .packuri import PACKAGE_URI, PackURI
 from .pkgreader import PackageReader
 from .pkgwriter import PackageWriter
@@ -26,6 +36,10 @@ class OpcPackage(object):
 
     def __init__(self):
         super(OpcPackage, self).__init__()
+        # ---(read_ms, parse_ms, blob_bytes) keyed by part, for each part loaded
+        # ---from the package file; created here rather than lazily as parts
+        # ---can be loaded by several threads at once---
+        self._part_load_times = {}
 
     def after_unmarshal(self):
         """
@@ -36,20 +50,44 @@ class OpcPackage(object):
         """
         pass
 
+    def collect_garbage(self):
+        """
+        Discard the parts no longer reachable from the package relationships.
+
+        First each part drops relationships its XML no longer refers to, such
+        as those to slides removed from the presentation, then any part that
+        can't be reached by following relationships from the package is
+        discarded along with its load statistics. Return a dict of the blob
+        size in bytes of each discarded part, keyed by partname. Slide parts
+        are renumbered when the package is next saved, so a partname in the
+        report may by then belong to a different slide.
+        """
+        parts = self.parts
+        for part in parts:
+            part.drop_unreferenced_rels()
+        reachable = set(self.iter_parts())
+        bytes_reclaimed = {}
+        for part in parts:
+            if part in reachable:
+                continue
+            bytes_reclaimed[part.partname] = len(part.blob)
+            self._part_load_times.pop(part, None)
+        return bytes_reclaimed
+
     def iter_parts(self):
         """
         Generate exactly one reference to each of the parts in the package by
         performing a depth-first traversal of the rels graph.
         """
 
-        def walk_parts(source, visited=list()):
+        def walk_parts(source, visited=set()):
             for rel in source.rels.values():
                 if rel.is_external:
                     continue
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 yield part
                 new_source = part
                 for part in walk_parts(new_source, visited):
@@ -58,6 +96,16 @@ class OpcPackage(object):
         for part in walk_parts(self):
             yield part
 
+    def finish_streaming(self, pkg_writer):
+        """
+        Write the parts of this package not yet written to *pkg_writer*, a
+        |StreamingPackageWriter|, followed by the package relationships,
+        and close it.
+        """
+        for part in self.parts:
+            part.before_marshal()
+        pkg_writer.close(self.rels, self.parts)
+
     def iter_rels(self):
         """
         Generate exactly one reference to each relationship in the package by
@@ -65,7 +113,7 @@ class OpcPackage(object):
         """
 
         def walk_rels(source, visited=None):
-            visited = [] if visited is None else visited
+            visited = set() if visited is None else visited
             for rel in source.rels.values():
                 yield rel
                 if rel.is_external:
@@ -73,7 +121,7 @@ class OpcPackage(object):
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 new_source = part
                 for rel in walk_rels(new_source, visited):
                     yield rel
@@ -117,14 +165,15 @@ class OpcPackage(object):
         raise Exception("ProgrammingError: ran out of candidate_partnames")
 
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, workers=None):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
+        *pkg_file*. When *workers* is greater than 1, part blobs are parsed
+        by a pool of that many threads.
         """
         pkg_reader = PackageReader.from_file(pkg_file)
         package = cls()
-        Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        Unmarshaller.unmarshal(pkg_reader, package, PartFactory, workers=workers)
         return package
 
     def part_related_by(self, reltype):
@@ -143,6 +192,13 @@ class OpcPackage(object):
         """
         return [part for part in self.iter_parts()]
 
+    def record_part_load(self, part, read_ms, parse_ms, blob_bytes):
+        """
+        Remember the load cost of *part*, reported by :meth:`stats`. Called
+        by the unmarshaller for each part it loads.
+        """
+        self._part_load_times[part] = (read_ms, parse_ms, blob_bytes)
+
     def relate_to(self, part, reltype):
         """
         Return rId key of relationship to *part*, from the existing
@@ -159,14 +215,55 @@ class OpcPackage(object):
         """
         return RelationshipCollection(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, optimize=False, profiler=None, collect_garbage=False):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
-        """
+        a file (a string) or a file-like object, and return a |SaveReport|.
+        When *optimize* is True, redundant markup is left out of each XML
+        part and the bytes saved on each are reported. *profiler*, when not
+        |None|, is notified of the cost of each part written and of the save
+        as a whole, as described in :mod:`pptx.instrument`. When
+        *collect_garbage* is True, :meth:`collect_garbage` is called before
+        anything is written and the parts it discarded are reported.
+        """
+        bytes_reclaimed = self.collect_garbage() if collect_garbage else None
+        start = default_timer()
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        marshal_ms = milliseconds_since(start)
+        parts = self.parts
+        bytes_saved = PackageWriter.write(
+            pkg_file, self.rels, parts, optimize, profiler
+        )
+        if profiler is not None:
+            profiler.package_saved(
+                PackageSaveEvent(len(parts), marshal_ms, milliseconds_since(start))
+            )
+        return SaveReport(bytes_saved, bytes_reclaimed)
+
+    def stats(self):
+        """
+        Return a list containing a |PartLoadStats| object for each part in
+        this package, in :meth:`iter_parts` order, reporting the time taken
+        to load the part and an estimate of the memory it holds now.
+        """
+        load_times = self._part_load_times
+        stats = []
+        for part in self.iter_parts():
+            read_ms, parse_ms, blob_bytes = load_times.get(part, (None, None, None))
+            element_count, approx_bytes = part.memory_estimate
+            stats.append(
+                PartLoadStats(
+                    part.partname,
+                    part.content_type,
+                    read_ms,
+                    parse_ms,
+                    blob_bytes,
+                    element_count,
+                    approx_bytes,
+                )
+            )
+        return stats
 
 
 class Part(object):
@@ -176,6 +273,10 @@ class Part(object):
     behaviors.
     """
 
+    # ---types of relationship always referred to by rId from the part XML,
+    # ---so one of these not referred to any more can be dropped---
+    _explicit_reltypes = ()
+
     def __init__(self, partname, content_type, blob=None, package=None):
         super(Part, self).__init__()
         self._partname = partname
@@ -234,6 +335,30 @@ class Part(object):
     def load(cls, partname, content_type, blob, package):
         return cls(partname, content_type, blob, package)
 
+    @property
+    def memory_estimate(self):
+        """
+        `(element_count, approx_bytes)` pair estimating the memory held by
+        this part. A binary part holds no XML elements, just its blob.
+        """
+        return 0, len(self.blob)
+
+    @property
+    def optimized_blob(self):
+        """
+        Contents of this part as written by an optimizing save. Same as
+        :attr:`blob` unless overridden by a subclass.
+        """
+        return self.blob
+
+    @property
+    def optimized_blob_and_size(self):
+        """
+        `(optimized_blob, blob_size)` pair, where *blob_size* is the length
+        of :attr:`blob`, for an optimizing save reporting the bytes saved.
+        """
+        return self.optimized_blob, len(self.blob)
+
     def load_rel(self, reltype, target, rId, is_external=False):
         """
         Return newly added |_Relationship| instance of *reltype* between this
@@ -278,6 +403,21 @@ class Part(object):
         if self._rel_ref_count(rId) < 2:
             del self.rels[rId]
 
+    def drop_unreferenced_rels(self):
+        """
+        Remove each relationship of a type in `_explicit_reltypes` no longer
+        referred to from this part's XML, like the one to a picture whose
+        shape was deleted. Implicit relationships are never removed.
+        """
+        if not self._explicit_reltypes:
+            return
+        referenced_rIds = set(self._element.xpath("//@r:*"))
+        for rId, rel in list(self.rels.items()):
+            if rel.is_external or rel.reltype not in self._explicit_reltypes:
+                continue
+            if rId not in referenced_rIds:
+                del self.rels[rId]
+
     def part_related_by(self, reltype):
         """
         Return part to which this part has a relationship of *reltype*.
@@ -353,6 +493,34 @@ class XmlPart(Part):
         element = parse_xml(blob)
         return cls(partname, content_type, element, package)
 
+    @property
+    def memory_estimate(self):
+        """
+        `(element_count, approx_bytes)` pair estimating the memory held by
+        the XML tree of this part.
+        """
+        return tree_memory_estimate(self._element)
+
+    @property
+    def optimized_blob(self):
+        """
+        XML of this part serialized without redundant markup, such as
+        attributes set to their default value. The part XML itself is not
+        changed.
+        """
+        return serialize_part_xml(optimized_copy(self._element))
+
+    @property
+    def optimized_blob_and_size(self):
+        """
+        `(optimized_blob, blob_size)` pair, where *blob_size* is the length
+        of :attr:`blob`. The unoptimized XML is what the optimizer scans for
+        namespace declarations, so measuring it costs no extra serialization.
+        """
+        blob = serialize_part_xml(self._element)
+        optimized = optimized_copy(self._element, blob.decode("utf-8"))
+        return serialize_part_xml(optimized), len(blob)
+
     @property
     def part(self):
         """
@@ -363,6 +531,43 @@ class XmlPart(Part):
         return self
 
 
+class WrittenPart(Part):
+    """
+    Stand-in for a part already written by a |StreamingPackageWriter|,
+    keeping the partname, content type and relationships of the part but not
+    its content, so the memory that held can be released.
+
+    *sha1* is the hash of the content of an image or media part, so it can
+    still be found by content. A written part can't be renamed.
+    """
+
+    def __init__(self, partname, content_type, package=None, sha1=None):
+        super(WrittenPart, self).__init__(partname, content_type, package=package)
+        self.sha1 = sha1
+
+    @classmethod
+    def replacing(cls, part):
+        """
+        Return a new |WrittenPart| standing in for *part*, not yet having
+        relationships.
+        """
+        return cls(
+            part.partname,
+            part.content_type,
+            part.package,
+            getattr(part, "sha1", None),
+        )
+
+    @property
+    def partname(self):
+        return self._partname
+
+    @partname.setter
+    def partname(self, partname):
+        if partname != self._partname:
+            raise ValueError("part %s is already written" % self._partname)
+
+
 class PartFactory(object):
     """
     Provides a way for client code to specify a subclass of |Part| to be
@@ -398,6 +603,10 @@ class RelationshipCollection(dict):
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
 
+    def __delitem__(self, rId):
+        super(RelationshipCollection, self).__delitem__(rId)
+        self._target_parts_by_rId.pop(rId, None)
+
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
         Return a newly added |_Relationship| instance.
@@ -408,6 +617,24 @@ class RelationshipCollection(dict):
             self._target_parts_by_rId[rId] = target
         return rel
 
+    def add_relationships(self, reltype, target_parts):
+        """
+        Return a list of rIds, one for each new relationship of *reltype*
+        added to a part in *target_parts*, in order. Unlike :meth:`get_or_add`
+        no existing relationship is looked for, so none of *target_parts*
+        should already be a target of this collection.
+        """
+        rIds = []
+        n = 0
+        for target_part in target_parts:
+            n += 1
+            while "rId%d" % n in self:
+                n += 1
+            rId = "rId%d" % n
+            self.add_relationship(reltype, target_part, rId)
+            rIds.append(rId)
+        return rIds
+
     def get_or_add(self, reltype, target_part):
         """
         Return relationship of *reltype* to *target_part*, newly added if not
@@ -513,29 +740,58 @@ class Unmarshaller(object):
     """
 
     @staticmethod
-    def unmarshal(pkg_reader, package, part_factory):
+    def unmarshal(pkg_reader, package, part_factory, workers=None):
         """
         Construct graph of parts and realized relationships based on the
         contents of *pkg_reader*, delegating construction of each part to
-        *part_factory*. Package relationships are added to *pkg*.
+        *part_factory*. Package relationships are added to *pkg*. Parts are
+        constructed on *workers* threads when *workers* is greater than 1;
+        relationships are always wired serially afterward.
         """
-        parts = Unmarshaller._unmarshal_parts(pkg_reader, package, part_factory)
+        parts = Unmarshaller._unmarshal_parts(
+            pkg_reader, package, part_factory, workers
+        )
         Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
         for part in parts.values():
             part.after_unmarshal()
         package.after_unmarshal()
 
     @staticmethod
-    def _unmarshal_parts(pkg_reader, package, part_factory):
+    def _unmarshal_parts(pkg_reader, package, part_factory, workers=None):
         """
         Return a dictionary of |Part| instances unmarshalled from
         *pkg_reader*, keyed by partname. Side-effect is that each part in
         *pkg_reader* is constructed using *part_factory*.
-        """
-        parts = {}
-        for partname, content_type, blob in pkg_reader.iter_sparts():
-            parts[partname] = part_factory(partname, content_type, blob, package)
-        return parts
+
+        When *workers* is greater than 1, parts are constructed (and so their
+        XML parsed) on a pool of that many threads. lxml releases the GIL
+        while parsing, so large packages load on several cores. The
+        dictionary is populated in package order either way.
+        """
+        def load_part(partname, content_type, blob, package):
+            start = default_timer()
+            part = part_factory(partname, content_type, blob, package)
+            parse_ms = milliseconds_since(start)
+            read_ms, blob_bytes = pkg_reader.read_stats_for(partname)
+            package.record_part_load(part, read_ms, parse_ms, blob_bytes)
+            return part
+
+        sparts = list(pkg_reader.iter_sparts())
+        if workers is None or workers < 2 or len(sparts) < 2:
+            return dict(
+                (partname, load_part(partname, content_type, blob, package))
+                for partname, content_type, blob in sparts
+            )
+
+        # ---imported here, concurrent.futures adds noticeably to import time---
+        from concurrent.futures import ThreadPoolExecutor
+
+        partnames, content_types, blobs = zip(*sparts)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parts = executor.map(
+                load_part, partnames, content_types, blobs, [package] * len(sparts)
+            )
+            return dict(zip(partnames, parts))
 
     @staticmethod
     def _unmarshal_relationships(pkg_reader, package, parts):
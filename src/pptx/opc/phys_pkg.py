@@ -151,6 +151,13 @@ class _ZipPkgWriter(PhysPkgWriter):
         """
         self._zipf.close()
 
+    def compressed_size(self, pack_uri):
+        """
+        Size in bytes of the already-written member corresponding to
+        *pack_uri*, after compression.
+        """
+        return self._zipf.getinfo(pack_uri.membername).compress_size
+
     def write(self, pack_uri, blob):
         """
         Write *blob* to this zip package with the membername corresponding to
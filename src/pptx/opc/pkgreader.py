@@ -7,6 +7,10 @@ Provides a low-level, read-only API to a serialized Open Packaging Convention
 
 from __future__ import absolute_import
 
+from timeit import default_timer
+
+from ..instrument import milliseconds_since
+from ..util import lazyproperty
 from .constants import RELATIONSHIP_TARGET_MODE as RTM
 from .oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
@@ -47,6 +51,14 @@ class PackageReader(object):
         for spart in self._sparts:
             yield (spart.partname, spart.content_type, spart.blob)
 
+    def read_stats_for(self, partname):
+        """
+        Return a `(read_ms, blob_bytes)` pair for the part *partname*, the
+        milliseconds taken to read it and its relationships from the physical
+        package, and the size of its blob.
+        """
+        return self._read_stats[partname]
+
     def iter_srels(self):
         """
         Generate a 2-tuple `(source_uri, srel)` for each of the relationships
@@ -67,12 +79,27 @@ class PackageReader(object):
         """
         sparts = []
         part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
+        # ---the walker reads each part just before generating it, so the time
+        # ---between one part and the next is the time spent reading it---
+        start = default_timer()
         for partname, blob, srels in part_walker:
+            read_ms = milliseconds_since(start)
             content_type = content_types[partname]
-            spart = _SerializedPart(partname, content_type, blob, srels)
+            spart = _SerializedPart(partname, content_type, blob, srels, read_ms)
             sparts.append(spart)
+            start = default_timer()
         return tuple(sparts)
 
+    @lazyproperty
+    def _read_stats(self):
+        """
+        dict of `(read_ms, blob_bytes)` pairs keyed by partname.
+        """
+        return dict(
+            (spart.partname, (spart.read_ms, len(spart.blob)))
+            for spart in self._sparts
+        )
+
     @staticmethod
     def _srels_for(phys_reader, source_uri):
         """
@@ -169,12 +196,13 @@ class _SerializedPart(object):
     content type, blob, and serialized relationships for the part.
     """
 
-    def __init__(self, partname, content_type, blob, srels):
+    def __init__(self, partname, content_type, blob, srels, read_ms=None):
         super(_SerializedPart, self).__init__()
         self._partname = partname
         self._content_type = content_type
         self._blob = blob
         self._srels = srels
+        self._read_ms = read_ms
 
     @property
     def partname(self):
@@ -188,6 +216,10 @@ class _SerializedPart(object):
     def blob(self):
         return self._blob
 
+    @property
+    def read_ms(self):
+        return self._read_ms
+
     @property
     def srels(self):
         return self._srels
@@ -7,6 +7,10 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+import weakref
+from timeit import default_timer
+
+from ..instrument import PartSaveEvent, milliseconds_since
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
@@ -24,17 +28,25 @@ class PackageWriter(object):
     """
 
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, optimize=False, profiler=None):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
         content types of the parts.
+
+        When *optimize* is True, each part is written as its
+        `optimized_blob` and a dict mapping each partname to the number of
+        bytes saved on that part is returned. |None| is returned otherwise.
+        *profiler*, when not |None|, receives a |PartSaveEvent| for each part.
         """
         phys_writer = PhysPkgWriter(pkg_file)
         PackageWriter._write_content_types_stream(phys_writer, parts)
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
+        bytes_saved = PackageWriter._write_parts(
+            phys_writer, parts, optimize, profiler
+        )
         phys_writer.close()
+        return bytes_saved
 
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
@@ -46,15 +58,40 @@ class PackageWriter(object):
         phys_writer.write(CONTENT_TYPES_URI, content_types_blob)
 
     @staticmethod
-    def _write_parts(phys_writer, parts):
+    def _write_parts(phys_writer, parts, optimize=False, profiler=None):
         """
         Write the blob of each part in *parts* to the package, along with a
-        rels item for its relationships if and only if it has any.
+        rels item for its relationships if and only if it has any. Return a
+        dict of bytes saved by partname when *optimize* is True, |None|
+        otherwise. Notify *profiler*, if there is one, of each part written.
         """
+        bytes_saved = {} if optimize else None
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            start = default_timer()
+            if optimize:
+                blob, blob_size = part.optimized_blob_and_size
+                bytes_saved[part.partname] = blob_size - len(blob)
+            else:
+                blob = part.blob
+            if profiler is None:
+                phys_writer.write(part.partname, blob)
+            else:
+                serialize_ms = milliseconds_since(start)
+                start = default_timer()
+                phys_writer.write(part.partname, blob)
+                profiler.part_saved(
+                    PartSaveEvent(
+                        part.partname,
+                        part.content_type,
+                        len(blob),
+                        phys_writer.compressed_size(part.partname),
+                        serialize_ms,
+                        milliseconds_since(start),
+                    )
+                )
             if len(part._rels):
                 phys_writer.write(part.partname.rels_uri, part._rels.xml)
+        return bytes_saved
 
     @staticmethod
     def _write_pkg_rels(phys_writer, pkg_rels):
@@ -65,6 +102,62 @@ class PackageWriter(object):
         phys_writer.write(PACKAGE_URI.rels_uri, pkg_rels.xml)
 
 
+class StreamingPackageWriter(object):
+    """
+    Writes a zip-format OPC package to *pkg_file* a part at a time, so each
+    part can be written as soon as it's finished and the memory it holds
+    released, rather than all at once when the package is saved.
+
+    Call :meth:`write_part` for each part as it's finished and
+    :meth:`close` once the package is complete.
+    """
+
+    def __init__(self, pkg_file):
+        self._phys_writer = PhysPkgWriter(pkg_file)
+        # ---(partname, content_type) of each part written so far---
+        self._written = []
+        # ---weak reference to the part written under each partname, so parts
+        # ---written can still be released---
+        self._part_refs = {}
+
+    def close(self, pkg_rels, parts):
+        """
+        Write each of *parts* not already written, then the content types
+        item, covering every part written, and *pkg_rels*, and close the
+        package file.
+        """
+        for part in parts:
+            self.write_part(part)
+        content_types_blob = serialize_part_xml(
+            _ContentTypesItem.xml_for_items(self._written)
+        )
+        self._phys_writer.write(CONTENT_TYPES_URI, content_types_blob)
+        PackageWriter._write_pkg_rels(self._phys_writer, pkg_rels)
+        self._phys_writer.close()
+
+    def write_part(self, part):
+        """
+        Write the blob of *part*, and its rels item if it has relationships,
+        unless *part*, or the |WrittenPart| standing in for it, was written
+        already. Raises |ValueError| when a different part having the same
+        partname was written, as one of them would be missing from the
+        package otherwise.
+        """
+        from .package import WrittenPart
+
+        partname = part.partname
+        part_ref = self._part_refs.get(partname)
+        if part_ref is not None:
+            if part_ref() is part or isinstance(part, WrittenPart):
+                return
+            raise ValueError("a different part named %s was already written" % partname)
+        self._phys_writer.write(partname, part.blob)
+        if len(part.rels):
+            self._phys_writer.write(partname.rels_uri, part.rels.xml)
+        self._part_refs[partname] = weakref.ref(part)
+        self._written.append((partname, part.content_type))
+
+
 class _ContentTypesItem(object):
     """
     Service class that composes a content types item ([Content_Types].xml)
@@ -84,11 +177,19 @@ class _ContentTypesItem(object):
         appropriate content type and suitable for storage as
         ``[Content_Types].xml`` in an OPC package.
         """
+        return cls.xml_for_items((part.partname, part.content_type) for part in parts)
+
+    @classmethod
+    def xml_for_items(cls, items):
+        """
+        Return content types XML like :meth:`xml_for` for the parts described
+        by *items*, a sequence of `(partname, content_type)` pairs.
+        """
         cti = cls()
         cti._defaults["rels"] = CT.OPC_RELATIONSHIPS
         cti._defaults["xml"] = CT.XML
-        for part in parts:
-            cti._add_content_type(part.partname, part.content_type)
+        for partname, content_type in items:
+            cti._add_content_type(partname, content_type)
         return cti._xml()
 
     def _add_content_type(self, partname, content_type):
@@ -135,5 +135,13 @@ def qn(namespace_prefixed_tag):
     *qualified name*. As an example, ``qn('p:cSld')`` returns
     ``'{http://schemas.../main}cSld'``.
     """
-    nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
-    return nsptag.clark_name
+    try:
+        return _qn_cache[namespace_prefixed_tag]
+    except KeyError:
+        clark_name = NamespacePrefixedTag(namespace_prefixed_tag).clark_name
+        _qn_cache[namespace_prefixed_tag] = clark_name
+        return clark_name
+
+
+# ---namespace-prefixed tag to Clark name, filled as qn() is called---
+_qn_cache = {}
@@ -0,0 +1,155 @@
+# encoding: utf-8
+
+"""
+Save-time size optimization of part XML.
+
+Removes markup that has no effect on how the document is interpreted:
+namespace declarations repeated on subtree roots, attributes explicitly set
+to the value the schema defines for their absence, and optional property
+elements having neither attributes nor children. Only rules whose result is
+equivalent for PowerPoint are applied; in particular, attributes whose
+absence means "inherit" rather than a fixed default are never removed.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import copy
+import re
+
+from lxml import etree
+
+from .ns import qn
+
+_XMLNS_DECL = re.compile(r'xmlns:([^=\s]+)="([^"]*)"')
+
+# ---attributes naming namespace prefixes in their value, per ECMA-376 Part 3;
+# ---`Requires` is unqualified on `mc:Choice`---
+_PREFIX_LIST_ATTR = re.compile(
+    r'[\s:](?:Ignorable|MustUnderstand|PreserveAttributes|ProcessContent'
+    r'|Requires)="([^"]*)"'
+)
+
+_FALSE = ("0", "false")
+
+# ---schema default of each attribute, by element tag, as the set of XML
+# ---values equivalent to leaving the attribute off---
+_DEFAULT_ATTR_VALUES = {
+    qn("a:tblPr"): {
+        "bandCol": _FALSE,
+        "bandRow": _FALSE,
+        "firstCol": _FALSE,
+        "firstRow": _FALSE,
+        "lastCol": _FALSE,
+        "lastRow": _FALSE,
+        "rtl": _FALSE,
+    },
+    qn("a:tc"): {
+        "gridSpan": ("1",),
+        "hMerge": _FALSE,
+        "rowSpan": ("1",),
+        "vMerge": _FALSE,
+    },
+    qn("a:tcPr"): {
+        "anchor": ("t",),
+        "anchorCtr": _FALSE,
+        "horzOverflow": ("clip",),
+        "marB": ("45720",),
+        "marL": ("91440",),
+        "marR": ("91440",),
+        "marT": ("45720",),
+        "vert": ("horz",),
+    },
+    qn("a:xfrm"): {"flipH": _FALSE, "flipV": _FALSE, "rot": ("0",)},
+    qn("p:cNvPr"): {"hidden": _FALSE},
+    qn("p:ph"): {
+        "hasCustomPrompt": _FALSE,
+        "idx": ("0",),
+        "orient": ("horz",),
+        "sz": ("full",),
+        "type": ("obj",),
+    },
+    qn("p:xfrm"): {"flipH": _FALSE, "flipV": _FALSE, "rot": ("0",)},
+}
+
+# ---optional elements an empty occurrence of which is equivalent to none---
+_EMPTY_REMOVABLE_TAGS = frozenset(
+    qn(nsptagname)
+    for nsptagname in (
+        "a:avLst",
+        "a:endParaRPr",
+        "a:extLst",
+        "a:lstStyle",
+        "a:pPr",
+        "a:rPr",
+        "a:tcPr",
+        "p:extLst",
+    )
+)
+
+
+def optimized_copy(element, xml=None):
+    """
+    Return a copy of *element* with redundant markup removed.
+
+    *element* itself is not changed, so the document being saved can go on
+    being edited afterward. *xml* is *element* serialized, when the caller
+    has already done that; it is scanned for namespace declarations rather
+    than serializing *element* again.
+    """
+    if xml is None:
+        xml = etree.tostring(element, encoding="unicode")
+    element = copy.deepcopy(element)
+    _remove_default_attrs(element)
+    _remove_empty_elements(element)
+    _hoist_namespace_declarations(element, xml)
+    return element
+
+
+def _hoist_namespace_declarations(root, xml):
+    """
+    Declare each namespace used in the tree below *root* once, on *root*.
+
+    Declarations are found by scanning *xml*, the tree serialized before any
+    markup was removed, which is much faster than visiting each element from
+    Python. A declaration only removed markup used is left out anyway, as
+    no element or attribute then uses it. Prefixes named in
+    markup-compatibility attributes are kept even when no element or
+    attribute uses them, as consumers resolve those by prefix.
+    """
+    nsmap, conflicting = {}, set()
+    for pfx, uri in _XMLNS_DECL.findall(xml):
+        if nsmap.setdefault(pfx, uri) != uri:
+            conflicting.add(pfx)
+    keep_prefixes = set(pfx for pfx in root.nsmap if pfx)
+    for prefix_list in _PREFIX_LIST_ATTR.findall(xml):
+        keep_prefixes.update(prefix_list.split())
+
+    top_nsmap = dict(
+        (pfx, uri) for pfx, uri in nsmap.items() if pfx not in conflicting
+    )
+    etree.cleanup_namespaces(
+        root, top_nsmap=top_nsmap, keep_ns_prefixes=sorted(keep_prefixes)
+    )
+
+
+def _remove_default_attrs(root):
+    """Remove attributes set to the value their absence implies."""
+    for element in root.iter(*_DEFAULT_ATTR_VALUES):
+        attrib = element.attrib
+        for attr_name, values in _DEFAULT_ATTR_VALUES[element.tag].items():
+            if attrib.get(attr_name) in values:
+                del attrib[attr_name]
+
+
+def _remove_empty_elements(root):
+    """Remove removable elements having no attributes and no children."""
+    empty = [
+        element
+        for element in root.iter(*_EMPTY_REMOVABLE_TAGS)
+        if len(element) == 0
+        and not element.attrib
+        and not element.text
+        and not (element.tail and element.tail.strip())
+    ]
+    for element in empty:
+        element.getparent().remove(element)
@@ -6,8 +6,19 @@ Custom element classes for presentation-related XML elements.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from .simpletypes import ST_SlideId, ST_SlideSizeCoordinate, XsdString
-from .xmlchemy import BaseOxmlElement, RequiredAttribute, ZeroOrOne, ZeroOrMore
+from .simpletypes import (
+    ST_SlideId,
+    ST_SlideMasterId,
+    ST_SlideSizeCoordinate,
+    XsdString,
+)
+from .xmlchemy import (
+    BaseOxmlElement,
+    OptionalAttribute,
+    RequiredAttribute,
+    ZeroOrOne,
+    ZeroOrMore,
+)
 
 
 class CT_Presentation(BaseOxmlElement):
@@ -55,6 +66,26 @@ class CT_SlideIdList(BaseOxmlElement):
         """
         return self._add_sldId(id=self._next_id, rId=rId)
 
+    def add_sldIds(self, rIds):
+        """
+        Return a list of newly created <p:sldId> child elements, one for each
+        of *rIds* in order, having consecutive ids.
+        """
+        next_id = self._next_id
+        return [
+            self._add_sldId(id=next_id + offset, rId=rId)
+            for offset, rId in enumerate(rIds)
+        ]
+
+    def reorder(self, order):
+        """
+        Rearrange the `p:sldId` children in one operation so the one now at
+        position `order[i]` becomes the i-th. *order* must be a permutation
+        of their positions.
+        """
+        sldIds = self.sldId_lst
+        self[: len(sldIds)] = [sldIds[idx] for idx in order]
+
     @property
     def _next_id(self):
         """
@@ -82,6 +113,7 @@ class CT_SlideMasterIdListEntry(BaseOxmlElement):
     a reference to a slide master.
     """
 
+    id = OptionalAttribute("id", ST_SlideMasterId)
     rId = RequiredAttribute("r:id", XsdString)
 
 
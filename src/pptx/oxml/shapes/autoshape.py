@@ -7,7 +7,7 @@ lxml custom element classes for shape-related XML elements.
 from __future__ import absolute_import
 
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, PP_PLACEHOLDER
-from pptx.oxml import parse_xml
+from pptx.oxml import ElementPrototype
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.simpletypes import (
@@ -174,6 +174,28 @@ class CT_Shape(BaseShapeElement):
     spPr = OneAndOnlyOne("p:spPr")
     txBody = ZeroOrOne("p:txBody", successors=("p:extLst",))
 
+    # ---p:sp/(p:nvSpPr/p:cNvPr, p:spPr/(a:xfrm/(a:off, a:ext), a:prstGeom))---
+    _autoshape_sp_proto = ElementPrototype(
+        lambda: CT_Shape._autoshape_sp_tmpl() % (0, "", 0, 0, 0, 0, "rect"),
+        (0, 0),
+        (1, 0, 0),
+        (1, 0, 1),
+        (1, 1),
+    )
+    _freeform_sp_proto = ElementPrototype(
+        lambda: CT_Shape._freeform_sp_tmpl() % (0, "", 0, 0, 0, 0),
+        (0, 0),
+        (1, 0, 0),
+        (1, 0, 1),
+    )
+    _ph_sp_proto = ElementPrototype(lambda: CT_Shape._ph_sp_tmpl() % (0, ""), (0, 0))
+    _textbox_sp_proto = ElementPrototype(
+        lambda: CT_Shape._textbox_sp_tmpl() % (0, "", 0, 0, 0, 0),
+        (0, 0),
+        (1, 0, 0),
+        (1, 0, 1),
+    )
+
     def add_path(self, w, h):
         """Reference to `a:custGeom` descendant or |None| if not present."""
         custGeom = self.spPr.custGeom
@@ -234,10 +256,12 @@ class CT_Shape(BaseShapeElement):
         """
         Return a new ``<p:sp>`` element tree configured as a base auto shape.
         """
-        tmpl = CT_Shape._autoshape_sp_tmpl()
-        xml = tmpl % (id_, name, left, top, width, height, prst)
-        sp = parse_xml(xml)
-        return sp
+        return CT_Shape._autoshape_sp_proto.new(
+            {"id": "%d" % id_, "name": "%s" % name},
+            {"x": "%d" % left, "y": "%d" % top},
+            {"cx": "%d" % width, "cy": "%d" % height},
+            {"prst": "%s" % prst},
+        )
 
     @staticmethod
     def new_freeform_sp(shape_id, name, x, y, cx, cy):
@@ -246,10 +270,11 @@ class CT_Shape(BaseShapeElement):
         The returned shape has a `a:custGeom` subtree but no paths in its
         path list.
         """
-        tmpl = CT_Shape._freeform_sp_tmpl()
-        xml = tmpl % (shape_id, name, x, y, cx, cy)
-        sp = parse_xml(xml)
-        return sp
+        return CT_Shape._freeform_sp_proto.new(
+            {"id": "%d" % shape_id, "name": "%s" % name},
+            {"x": "%d" % x, "y": "%d" % y},
+            {"cx": "%d" % cx, "cy": "%d" % cy},
+        )
 
     @staticmethod
     def new_placeholder_sp(id_, name, ph_type, orient, sz, idx):
@@ -257,9 +282,7 @@ class CT_Shape(BaseShapeElement):
         Return a new ``<p:sp>`` element tree configured as a placeholder
         shape.
         """
-        tmpl = CT_Shape._ph_sp_tmpl()
-        xml = tmpl % (id_, name)
-        sp = parse_xml(xml)
+        sp = CT_Shape._ph_sp_proto.new({"id": "%d" % id_, "name": "%s" % name})
 
         ph = sp.nvSpPr.nvPr.get_or_add_ph()
         ph.type = ph_type
@@ -286,10 +309,11 @@ class CT_Shape(BaseShapeElement):
         Return a new ``<p:sp>`` element tree configured as a base textbox
         shape.
         """
-        tmpl = CT_Shape._textbox_sp_tmpl()
-        xml = tmpl % (id_, name, left, top, width, height)
-        sp = parse_xml(xml)
-        return sp
+        return CT_Shape._textbox_sp_proto.new(
+            {"id": "%d" % id_, "name": "%s" % name},
+            {"x": "%d" % left, "y": "%d" % top},
+            {"cx": "%d" % width, "cy": "%d" % height},
+        )
 
     @property
     def prst(self):
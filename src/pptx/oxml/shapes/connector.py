@@ -6,7 +6,7 @@ lxml custom element classes for shape-related XML elements.
 
 from __future__ import absolute_import
 
-from .. import parse_xml
+from .. import ElementPrototype
 from ..ns import nsdecls
 from .shared import BaseShapeElement
 from ..simpletypes import ST_DrawingElementId, XsdUnsignedInt
@@ -33,28 +33,39 @@ class CT_Connector(BaseShapeElement):
     spPr = OneAndOnlyOne("p:spPr")
     del _tag_seq
 
+    # ---p:cxnSp/(p:nvCxnSpPr/p:cNvPr, p:spPr/(a:xfrm/(a:off, a:ext), a:prstGeom))---
+    _cxnSp_proto = ElementPrototype(
+        lambda: CT_Connector._cxnSp_tmpl().format(
+            nsdecls=nsdecls("a", "p"),
+            id=0,
+            name="",
+            x=0,
+            y=0,
+            cx=0,
+            cy=0,
+            prst="line",
+            flip="",
+        ),
+        (0, 0),
+        (1, 0),
+        (1, 0, 0),
+        (1, 0, 1),
+        (1, 1),
+    )
+
     @classmethod
     def new_cxnSp(cls, id_, name, prst, x, y, cx, cy, flipH, flipV):
         """
         Return a new ``<p:cxnSp>`` element tree configured as a base
         connector.
         """
-        tmpl = cls._cxnSp_tmpl()
-        flip = (' flipH="1"' if flipH else "") + (' flipV="1"' if flipV else "")
-        xml = tmpl.format(
-            **{
-                "nsdecls": nsdecls("a", "p"),
-                "id": id_,
-                "name": name,
-                "x": x,
-                "y": y,
-                "cx": cx,
-                "cy": cy,
-                "prst": prst,
-                "flip": flip,
-            }
+        return cls._cxnSp_proto.new(
+            {"id": "%d" % id_, "name": "%s" % name},
+            {"flipH": "1" if flipH else None, "flipV": "1" if flipV else None},
+            {"x": "%s" % x, "y": "%s" % y},
+            {"cx": "%s" % cx, "cy": "%s" % cy},
+            {"prst": "%s" % prst},
         )
-        return parse_xml(xml)
 
     @staticmethod
     def _cxnSp_tmpl():
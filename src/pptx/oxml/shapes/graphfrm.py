@@ -6,7 +6,7 @@ lxml custom element class for CT_GraphicalObjectFrame XML element.
 
 from __future__ import absolute_import
 
-from .. import parse_xml
+from .. import ElementPrototype
 from ..chart.chart import CT_Chart
 from ..ns import nsdecls
 from .shared import BaseShapeElement
@@ -53,6 +53,14 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
     xfrm = OneAndOnlyOne("p:xfrm")
     graphic = OneAndOnlyOne("a:graphic")
 
+    # ---p:graphicFrame/(p:nvGraphicFramePr/p:cNvPr, p:xfrm/(a:off, a:ext))---
+    _graphicFrame_proto = ElementPrototype(
+        lambda: CT_GraphicalObjectFrame._graphicFrame_tmpl() % (0, "", 0, 0, 0, 0),
+        (0, 0),
+        (1, 0),
+        (1, 1),
+    )
+
     @property
     def chart(self):
         """
@@ -111,9 +119,11 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
         containing a table or chart. Note that a graphicFrame element is not
         a valid shape until it contains a graphical object such as a table.
         """
-        xml = cls._graphicFrame_tmpl() % (id_, name, x, y, cx, cy)
-        graphicFrame = parse_xml(xml)
-        return graphicFrame
+        return cls._graphicFrame_proto.new(
+            {"id": "%d" % id_, "name": "%s" % name},
+            {"x": "%d" % x, "y": "%d" % y},
+            {"cx": "%d" % cx, "cy": "%d" % cy},
+        )
 
     @classmethod
     def new_table_graphicFrame(cls, id_, name, rows, cols, x, y, cx, cy):
@@ -5,7 +5,7 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from pptx.enum.shapes import MSO_CONNECTOR_TYPE
-from pptx.oxml import parse_xml
+from pptx.oxml import ElementPrototype
 from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.connector import CT_Connector
@@ -34,6 +34,9 @@ class CT_GroupShape(BaseShapeElement):
         qn("p:contentPart"),
     )
 
+    # ---p:grpSp/p:nvGrpSpPr/p:cNvPr---
+    _grpSp_proto = ElementPrototype(lambda: CT_GroupShape._grpSp_tmpl(), (0, 0))
+
     def add_autoshape(self, id_, name, prst, x, y, cx, cy):
         """
         Append a new ``<p:sp>`` shape to the group/shapetree having the
@@ -160,28 +163,23 @@ class CT_GroupShape(BaseShapeElement):
         used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
         return max(used_ids) if used_ids else 0
 
+    @property
+    def ph_signature(self):
+        """
+        Value equal to an earlier one only when no placeholder shape has been
+        added to or removed from this shape tree, and no attribute of the
+        `p:ph` element of one changed, in between. Used to tell when lookups
+        derived from the placeholders need rebuilding.
+        """
+        return tuple(
+            (ph, tuple(ph.attrib.items()))
+            for ph in self.xpath("./*/*[1]/p:nvPr/p:ph")
+        )
+
     @classmethod
     def new_grpSp(cls, id_, name):
         """Return new "loose" `p:grpSp` element having *id_* and *name*."""
-        xml = (
-            "<p:grpSp %s>\n"
-            "  <p:nvGrpSpPr>\n"
-            '    <p:cNvPr id="%%d" name="%%s"/>\n'
-            "    <p:cNvGrpSpPr/>\n"
-            "    <p:nvPr/>\n"
-            "  </p:nvGrpSpPr>\n"
-            "  <p:grpSpPr>\n"
-            "    <a:xfrm>\n"
-            '      <a:off x="0" y="0"/>\n'
-            '      <a:ext cx="0" cy="0"/>\n'
-            '      <a:chOff x="0" y="0"/>\n'
-            '      <a:chExt cx="0" cy="0"/>\n'
-            "    </a:xfrm>\n"
-            "  </p:grpSpPr>\n"
-            "</p:grpSp>" % nsdecls("a", "p", "r")
-        ) % (id_, name)
-        grpSp = parse_xml(xml)
-        return grpSp
+        return cls._grpSp_proto.new({"id": "%d" % id_, "name": "%s" % name})
 
     def recalculate_extents(self):
         """Adjust x, y, cx, and cy to incorporate all contained shapes.
@@ -221,10 +219,13 @@ class CT_GroupShape(BaseShapeElement):
         if not child_shape_elms:
             return Emu(0), Emu(0), Emu(0), Emu(0)
 
-        min_x = min([xSp.x for xSp in child_shape_elms])
-        min_y = min([xSp.y for xSp in child_shape_elms])
-        max_x = max([(xSp.x + xSp.cx) for xSp in child_shape_elms])
-        max_y = max([(xSp.y + xSp.cy) for xSp in child_shape_elms])
+        extents = [
+            xSp.get_xfrm_values("x", "y", "cx", "cy") for xSp in child_shape_elms
+        ]
+        min_x = min([x for x, y, cx, cy in extents])
+        min_y = min([y for x, y, cx, cy in extents])
+        max_x = max([(x + cx) for x, y, cx, cy in extents])
+        max_y = max([(y + cy) for x, y, cx, cy in extents])
 
         x = min_x
         y = min_y
@@ -233,6 +234,26 @@ class CT_GroupShape(BaseShapeElement):
 
         return x, y, cx, cy
 
+    @staticmethod
+    def _grpSp_tmpl():
+        return (
+            "<p:grpSp %s>\n"
+            "  <p:nvGrpSpPr>\n"
+            '    <p:cNvPr id="%%d" name="%%s"/>\n'
+            "    <p:cNvGrpSpPr/>\n"
+            "    <p:nvPr/>\n"
+            "  </p:nvGrpSpPr>\n"
+            "  <p:grpSpPr>\n"
+            "    <a:xfrm>\n"
+            '      <a:off x="0" y="0"/>\n'
+            '      <a:ext cx="0" cy="0"/>\n'
+            '      <a:chOff x="0" y="0"/>\n'
+            '      <a:chExt cx="0" cy="0"/>\n'
+            "    </a:xfrm>\n"
+            "  </p:grpSpPr>\n"
+            "</p:grpSp>" % nsdecls("a", "p", "r")
+        ) % (0, "")
+
     @property
     def _next_shape_id(self):
         """Return unique shape id suitable for use with a new shape element.
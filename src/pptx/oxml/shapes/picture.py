@@ -4,8 +4,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from .. import parse_xml
-from ..ns import nsdecls
+from .. import ElementPrototype, parse_xml
+from ..ns import nsdecls, qn
 from .shared import BaseShapeElement
 from ..xmlchemy import BaseOxmlElement, OneAndOnlyOne
 
@@ -20,6 +20,15 @@ class CT_Picture(BaseShapeElement):
     blipFill = OneAndOnlyOne("p:blipFill")
     spPr = OneAndOnlyOne("p:spPr")
 
+    # ---p:pic/(p:nvPicPr/p:cNvPr, p:blipFill/a:blip, p:spPr/a:xfrm/(a:off, a:ext))---
+    _pic_proto = ElementPrototype(
+        lambda: CT_Picture._pic_tmpl() % (0, "", "", "", 0, 0, 0, 0),
+        (0, 0),
+        (1, 0),
+        (2, 0, 0),
+        (2, 0, 1),
+    )
+
     @property
     def blip_rId(self):
         """Value of `p:blipFill/a:blip/@r:embed`.
@@ -66,9 +75,12 @@ class CT_Picture(BaseShapeElement):
         Return a new ``<p:pic>`` element tree configured with the supplied
         parameters.
         """
-        xml = cls._pic_tmpl() % (id_, name, desc, rId, left, top, width, height)
-        pic = parse_xml(xml)
-        return pic
+        return cls._pic_proto.new(
+            {"id": "%d" % id_, "name": "%s" % name, "descr": "%s" % desc},
+            {qn("r:embed"): "%s" % rId},
+            {"x": "%d" % left, "y": "%d" % top},
+            {"cx": "%d" % width, "cy": "%d" % height},
+        )
 
     @classmethod
     def new_video_pic(
@@ -77,6 +77,20 @@ class BaseShapeElement(BaseOxmlElement):
         """
         return self.spPr.get_or_add_xfrm()
 
+    def get_xfrm_values(self, *names):
+        """
+        Return a tuple containing the transform value named by each of
+        *names*, any of "x", "y", "cx", "cy", "rot", "flipH", and "flipV".
+
+        Equivalent to reading each named property in turn, but the transform
+        is located once rather than once per value. Each item is |None| when
+        the shape has no transform.
+        """
+        xfrm = self.xfrm
+        if xfrm is None:
+            return (None,) * len(names)
+        return xfrm.get_values(*names)
+
     @property
     def has_ph_elm(self):
         """
@@ -208,6 +222,14 @@ class BaseShapeElement(BaseOxmlElement):
         """
         return self.xpath("./*[1]")[0]
 
+    def set_xfrm_values(self, **values):
+        """
+        Assign each transform value named by a keyword in *values*, e.g.
+        `sp.set_xfrm_values(x=Emu(0), y=Emu(0))`, locating or adding the
+        transform once for all of them.
+        """
+        self.get_or_add_xfrm().set_values(**values)
+
     def _get_xfrm_attr(self, name):
         xfrm = self.xfrm
         if xfrm is None:
@@ -307,15 +329,43 @@ class CT_NonVisualDrawingProps(BaseOxmlElement):
     del _tag_seq
 
 
+class _PlaceholderKeyAttribute(OptionalAttribute):
+    """Attribute of `p:ph` placeholders are looked up by, counting assignments.
+
+    `.generation` changes whenever the type or idx of any placeholder is
+    assigned, so a cached placeholder lookup can tell in constant time that
+    it may no longer be current.
+    """
+
+    generation = 0
+
+    @property
+    def _setter(self):
+        set_attr_value = super(_PlaceholderKeyAttribute, self)._setter
+
+        def set_key_attr_value(obj, value):
+            set_attr_value(obj, value)
+            _PlaceholderKeyAttribute.generation += 1
+
+        return set_key_attr_value
+
+
 class CT_Placeholder(BaseOxmlElement):
     """
     ``<p:ph>`` custom element class.
     """
 
-    type = OptionalAttribute("type", PP_PLACEHOLDER, default=PP_PLACEHOLDER.OBJECT)
+    type = _PlaceholderKeyAttribute(
+        "type", PP_PLACEHOLDER, default=PP_PLACEHOLDER.OBJECT
+    )
     orient = OptionalAttribute("orient", ST_Direction, default=ST_Direction.HORZ)
     sz = OptionalAttribute("sz", ST_PlaceholderSize, default=ST_PlaceholderSize.FULL)
-    idx = OptionalAttribute("idx", XsdUnsignedInt, default=0)
+    idx = _PlaceholderKeyAttribute("idx", XsdUnsignedInt, default=0)
+
+    @staticmethod
+    def key_generation():
+        """Value that changes whenever the type or idx of any `p:ph` is assigned."""
+        return _PlaceholderKeyAttribute.generation
 
 
 class CT_Point2D(BaseOxmlElement):
@@ -490,6 +540,48 @@ class CT_Transform2D(BaseOxmlElement):
         ext = self.get_or_add_ext()
         ext.cy = value
 
+    def get_values(self, *names):
+        """
+        Return a tuple containing the value named by each of *names*, any of
+        "x", "y", "cx", "cy", "rot", "flipH", and "flipV".
+
+        The `a:off` and `a:ext` children are each located once however many
+        of their values are named.
+        """
+        off, ext = self.off, self.ext
+        values = []
+        for name in names:
+            if name in ("x", "y"):
+                values.append(None if off is None else getattr(off, name))
+            elif name in ("cx", "cy"):
+                values.append(None if ext is None else getattr(ext, name))
+            else:
+                values.append(getattr(self, self._checked_value_name(name)))
+        return tuple(values)
+
+    def set_values(self, **values):
+        """
+        Assign each value named by a keyword in *values*, adding the `a:off`
+        or `a:ext` child, once, when a value belonging on it is assigned.
+        """
+        off = ext = None
+        for name, value in values.items():
+            if name in ("x", "y"):
+                off = self.get_or_add_off() if off is None else off
+                setattr(off, name, value)
+            elif name in ("cx", "cy"):
+                ext = self.get_or_add_ext() if ext is None else ext
+                setattr(ext, name, value)
+            else:
+                setattr(self, self._checked_value_name(name), value)
+
+    @staticmethod
+    def _checked_value_name(name):
+        """Return *name*, after checking it names a transform attribute."""
+        if name not in ("rot", "flipH", "flipV"):
+            raise AttributeError("a:xfrm has no value named '%s'" % name)
+        return name
+
     def _new_ext(self):
         ext = OxmlElement("a:ext")
         ext.cx = 0
@@ -11,14 +11,33 @@ from __future__ import absolute_import, print_function
 import numbers
 
 from pptx.exc import InvalidXmlError
-from pptx.util import Centipoints, Emu
+from pptx.util import Centipoints, Cm, Emu, Inches, Length, Mm, Pt
 
+# ---exact types accepted by the integer fast paths; anything else, including
+# ---bool, goes through full validation---
+_INT_TYPES = frozenset((int, Length, Centipoints, Cm, Emu, Inches, Mm, Pt))
+
+# ---most distinct attribute strings a single type will cache---
+_FROM_XML_CACHE_LIMIT = 4096
 
 
 class BaseSimpleType(object):
+    # ---a type converting to immutable values can set this to a dict of its
+    # ---own, so the value converted from each XML string is reused---
+    _from_xml_cache = None
+
     @classmethod
     def from_xml(cls, str_value):
-        return cls.convert_from_xml(str_value)
+        cache = cls._from_xml_cache
+        if cache is None:
+            return cls.convert_from_xml(str_value)
+        try:
+            return cache[str_value]
+        except KeyError:
+            value = cls.convert_from_xml(str_value)
+            if len(cache) < _FROM_XML_CACHE_LIMIT:
+                cache[str_value] = value
+            return value
 
     @classmethod
     def to_xml(cls, value):
@@ -334,6 +353,14 @@ class ST_ContentType(XsdString):
 
 
 class ST_Coordinate(BaseSimpleType):
+    _from_xml_cache = {}
+
+    @classmethod
+    def to_xml(cls, value):
+        if type(value) in _INT_TYPES and -27273042329600 <= value <= 27273042316900:
+            return str(value)
+        return super(ST_Coordinate, cls).to_xml(value)
+
     @classmethod
     def convert_from_xml(cls, str_value):
         if "i" in str_value or "m" in str_value or "p" in str_value:
@@ -354,6 +381,14 @@ class ST_Coordinate32(BaseSimpleType):
     xsd:union of ST_Coordinate32Unqualified, ST_UniversalMeasure
     """
 
+    _from_xml_cache = {}
+
+    @classmethod
+    def to_xml(cls, value):
+        if type(value) in _INT_TYPES and -2147483648 <= value <= 2147483647:
+            return str(value)
+        return super(ST_Coordinate32, cls).to_xml(value)
+
     @classmethod
     def convert_from_xml(cls, str_value):
         if "i" in str_value or "m" in str_value or "p" in str_value:
@@ -393,7 +428,13 @@ class ST_Direction(XsdTokenEnumeration):
 
 
 class ST_DrawingElementId(XsdUnsignedInt):
-    pass
+    _from_xml_cache = {}
+
+    @classmethod
+    def to_xml(cls, value):
+        if type(value) is int and 0 <= value <= 4294967295:
+            return str(value)
+        return super(ST_DrawingElementId, cls).to_xml(value)
 
 
 class ST_Extension(XsdString):
@@ -573,6 +614,14 @@ class ST_PlaceholderSize(XsdTokenEnumeration):
 
 
 class ST_PositiveCoordinate(XsdLong):
+    _from_xml_cache = {}
+
+    @classmethod
+    def to_xml(cls, value):
+        if type(value) in _INT_TYPES and 0 <= value <= 27273042316900:
+            return str(value)
+        return super(ST_PositiveCoordinate, cls).to_xml(value)
+
     @classmethod
     def convert_from_xml(cls, str_value):
         int_value = super(ST_PositiveCoordinate, cls).convert_from_xml(str_value)
@@ -629,6 +678,18 @@ class ST_SlideId(XsdUnsignedInt):
         cls.validate_int_in_range(value, 256, 2147483647)
 
 
+class ST_SlideLayoutId(XsdUnsignedInt):
+    @classmethod
+    def validate(cls, value):
+        cls.validate_int_in_range(value, 2147483648, 4294967295)
+
+
+class ST_SlideMasterId(XsdUnsignedInt):
+    @classmethod
+    def validate(cls, value):
+        cls.validate_int_in_range(value, 2147483648, 4294967295)
+
+
 class ST_SlideSizeCoordinate(BaseIntType):
     @classmethod
     def convert_from_xml(cls, str_value):
@@ -4,12 +4,18 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import copy
+import weakref
+from array import array
+
+from lxml import etree
+
 from pptx.enum.text import MSO_VERTICAL_ANCHOR
-from pptx.oxml import parse_xml
+from pptx.oxml import ElementPrototype, parse_xml
 from pptx.oxml.dml.fill import CT_GradientFillProperties,CT_SolidColorFillProperties
-from pptx.oxml.ns import nsdecls
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.simpletypes import ST_Coordinate, ST_Coordinate32, XsdBoolean, XsdInt
-from pptx.oxml.text import CT_TextBody
+from pptx.oxml.text import CT_RegularTextRun, CT_TextBody
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement,
     Choice,
@@ -31,6 +37,8 @@ class CT_Table(BaseOxmlElement):
     tr = ZeroOrMore("a:tr", successors=_tag_seq[3:])
     del _tag_seq
 
+    _tbl_proto = ElementPrototype(lambda: CT_Table._tbl_tmpl() % "")
+
     def add_tr(self, height):
         """
         Return a reference to a newly created <a:tr> child element having its
@@ -38,6 +46,41 @@ class CT_Table(BaseOxmlElement):
         """
         return self._add_tr(h=height)
 
+    def add_trs(self, rows, height):
+        """Append an `a:tr` element for each sequence of cell values in *rows*.
+
+        Each row is a deep copy of a single prototype `a:tr` having *height*
+        and one `a:tc` per grid column, so no XML is parsed per row or cell.
+        Cell values are converted with `str()`; |None| and empty values leave
+        the cell empty. Raises |ValueError| when a row has more values than the
+        table has columns. Returns the list of new `a:tr` elements.
+        """
+        col_count = len(self.tblGrid.gridCol_lst)
+        tr_proto = CT_TableRow.new(height)
+        for _ in range(col_count):
+            tr_proto.add_tc()
+        r_proto = parse_xml("<a:r %s><a:t/></a:r>" % nsdecls("a"))
+
+        trs = []
+        for values in rows:
+            values = tuple(values)
+            if len(values) > col_count:
+                raise ValueError(
+                    "row has %d values, table has %d columns" % (len(values), col_count)
+                )
+            tr = tr_proto.__copy__()
+            for tc, value in zip(tr, values):
+                if value is None:
+                    continue
+                text = value if isinstance(value, str) else str(value)
+                if text:
+                    tc._set_new_text(text, r_proto)
+            trs.append(tr)
+
+        # ---a:tr elements are the last children of a:tbl---
+        self.extend(trs)
+        return trs
+
     @property
     def bandCol(self):
         return self._get_boolean_property("bandCol")
@@ -100,8 +143,9 @@ class CT_Table(BaseOxmlElement):
         if tableStyleId is None:
             tableStyleId = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
 
-        xml = cls._tbl_tmpl() % (tableStyleId)
-        tbl = parse_xml(xml)
+        tbl = cls._tbl_proto.new()
+        # ---a:tbl/a:tblPr/a:tableStyleId---
+        tbl[0][0].text = tableStyleId
 
         # add specified number of rows and columns
         rowheight = height // rows
@@ -113,13 +157,20 @@ class CT_Table(BaseOxmlElement):
                 colwidth = width - ((cols - 1) * colwidth)
             tbl.tblGrid.add_gridCol(width=colwidth)
 
+        first_tr = None
         for row in range(rows):
             # adjust height of last row to absorb any div error
             if row == rows - 1:
                 rowheight = height - ((rows - 1) * rowheight)
-            tr = tbl.add_tr(height=rowheight)
-            for col in range(cols):
-                tr.add_tc()
+            if first_tr is None:
+                tr = first_tr = tbl.add_tr(height=rowheight)
+                for col in range(cols):
+                    tr.add_tc()
+                continue
+            # ---later rows are copies of the first; a:tr is last in a:tbl---
+            tr = copy.deepcopy(first_tr)
+            tr.h = rowheight
+            tbl.append(tr)
 
         return tbl
 
@@ -166,6 +217,27 @@ class CT_Table(BaseOxmlElement):
             "</a:tbl>" % (nsdecls("a"), "%s")
         )
 
+class _MergeAttribute(OptionalAttribute):
+    """Span or merge attribute of `a:tc` whose assignment marks its table changed.
+
+    Assigning one notifies |TcSpanMap| through `TcSpanMap.table_changed()`, so
+    span maps of the containing table become stale in constant time.
+    """
+
+    @property
+    def _setter(self):
+        set_attr_value = super(_MergeAttribute, self)._setter
+
+        def set_merge_attr_value(obj, value):
+            set_attr_value(obj, value)
+            tr = obj.getparent()
+            tbl = None if tr is None else tr.getparent()
+            if tbl is not None:
+                TcSpanMap.table_changed(tbl)
+
+        return set_merge_attr_value
+
+
 class CT_TableCell(BaseOxmlElement):
     """`a:tc` custom element class"""
 
@@ -174,10 +246,12 @@ class CT_TableCell(BaseOxmlElement):
     tcPr = ZeroOrOne("a:tcPr", successors=_tag_seq[2:])
     del _tag_seq
 
-    gridSpan = OptionalAttribute("gridSpan", XsdInt, default=1)
-    rowSpan = OptionalAttribute("rowSpan", XsdInt, default=1)
-    hMerge = OptionalAttribute("hMerge", XsdBoolean, default=False)
-    vMerge = OptionalAttribute("vMerge", XsdBoolean, default=False)
+    gridSpan = _MergeAttribute("gridSpan", XsdInt, default=1)
+    rowSpan = _MergeAttribute("rowSpan", XsdInt, default=1)
+    hMerge = _MergeAttribute("hMerge", XsdBoolean, default=False)
+    vMerge = _MergeAttribute("vMerge", XsdBoolean, default=False)
+
+    _tc_proto = ElementPrototype(lambda: CT_TableCell._tc_tmpl())
 
     @property
     def anchor(self):
@@ -298,9 +372,7 @@ class CT_TableCell(BaseOxmlElement):
     @classmethod
     def new(cls):
         """Return a new `a:tc` element subtree."""
-        xml = cls._tc_tmpl()
-        tc = parse_xml(xml)
-        return tc
+        return cls._tc_proto.new()
 
     @property
     def row_idx(self):
@@ -343,6 +415,24 @@ class CT_TableCell(BaseOxmlElement):
         tcPr = self.get_or_add_tcPr()
         setattr(tcPr, marX, value)
 
+    def _set_new_text(self, text, r_proto):
+        """Place *text* in the single empty paragraph of a newly created cell.
+
+        Text without paragraph or line breaks becomes a deep copy of the
+        `a:r` element *r_proto*; other text takes the general path used by
+        `TextFrame.text`.
+        """
+        # ---new cell is a:tc/(a:txBody/(a:bodyPr,a:lstStyle,a:p),a:tcPr)---
+        txBody = self[0]
+        if "\n" not in text and "\v" not in text:
+            r = r_proto.__copy__()
+            r[0].text = CT_RegularTextRun._escape_ctrl_chars(text)
+            txBody[-1].append(r)
+            return
+        txBody.clear_content()
+        for p_text in text.split("\n"):
+            txBody.add_p().append_text(p_text)
+
     @classmethod
     def _tc_tmpl(cls):
         return (
@@ -360,6 +450,27 @@ class CT_TableCell(BaseOxmlElement):
 class CT_TableCellProperties(BaseOxmlElement):
     """`a:tcPr` custom element class"""
 
+    _tag_seq = (
+        "a:lnL",
+        "a:lnR",
+        "a:lnT",
+        "a:lnB",
+        "a:lnTlToBr",
+        "a:lnBlToTr",
+        "a:cell3D",
+        "a:noFill",
+        "a:solidFill",
+        "a:gradFill",
+        "a:blipFill",
+        "a:pattFill",
+        "a:grpFill",
+        "a:headers",
+        "a:extLst",
+    )
+    lnL = ZeroOrOne(_tag_seq[0], successors=_tag_seq[1:])
+    lnR = ZeroOrOne(_tag_seq[1], successors=_tag_seq[2:])
+    lnT = ZeroOrOne(_tag_seq[2], successors=_tag_seq[3:])
+    lnB = ZeroOrOne(_tag_seq[3], successors=_tag_seq[4:])
     eg_fillProperties = ZeroOrOneChoice(
         (
             Choice("a:noFill"),
@@ -369,13 +480,8 @@ class CT_TableCellProperties(BaseOxmlElement):
             Choice("a:pattFill"),
             Choice("a:grpFill"),
         ),
-        successors=("a:headers", "a:extLst"),
+        successors=_tag_seq[13:],
     )
-    _tag_seq = ('a:lnL', 'a:lnR', 'a:lnT', 'a:lnB', 'a:solidFill')
-    lnL = ZeroOrOne(nsptagname=_tag_seq[0],successors=_tag_seq[1:])
-    lnR = ZeroOrOne(nsptagname=_tag_seq[1],successors=_tag_seq[2:])
-    lnT = ZeroOrOne(nsptagname=_tag_seq[2],successors=_tag_seq[3:])
-    lnB = ZeroOrOne(nsptagname=_tag_seq[3],successors=_tag_seq[4:])
     del _tag_seq
 
     anchor = OptionalAttribute("anchor", MSO_VERTICAL_ANCHOR)
@@ -384,10 +490,42 @@ class CT_TableCellProperties(BaseOxmlElement):
     marT = OptionalAttribute("marT", ST_Coordinate32)
     marB = OptionalAttribute("marB", ST_Coordinate32)
 
+    _ln_protos = {}
+
+    @classmethod
+    def new_ln(cls, side, w, rgb_hex, alpha=None):
+        """Return a new solid `a:ln{side}` cell-edge element.
+
+        *side* is one of 'L', 'R', 'T' or 'B'. The element is a deep copy of
+        a prototype parsed once per distinct set of arguments.
+        """
+        key = (side, w, rgb_hex, alpha)
+        proto = cls._ln_protos.get(key)
+        if proto is None:
+            alpha_xml = (
+                "" if alpha is None else '<a:alpha val="%d"/>' % (alpha * 100000)
+            )
+            xml = cls._ln_tmpl() % (side, nsdecls("a"), w, rgb_hex, alpha_xml, side)
+            proto = cls._ln_protos[key] = parse_xml(xml)
+        return copy.deepcopy(proto)
 
     def _new_gradFill(self):
         return CT_GradientFillProperties.new_gradFill()
 
+    @classmethod
+    def _ln_tmpl(cls):
+        return (
+            '<a:ln%s %s w="%d" cap="flat" cmpd="sng" algn="ctr">\n'
+            "  <a:solidFill>\n"
+            '    <a:srgbClr val="%s">%s</a:srgbClr>\n'
+            "  </a:solidFill>\n"
+            '  <a:prstDash val="solid"/>\n'
+            "  <a:round/>\n"
+            '  <a:headEnd type="none" w="med" len="med"/>\n'
+            '  <a:tailEnd type="none" w="med" len="med"/>\n'
+            "</a:ln%s>"
+        )
+
 
 class CT_TableCol(BaseOxmlElement):
     """
@@ -433,6 +571,8 @@ class CT_TableRow(BaseOxmlElement):
     tc = ZeroOrMore("a:tc", successors=("a:extLst",))
     h = RequiredAttribute("h", ST_Coordinate)
 
+    _tr_proto = ElementPrototype(lambda: '<a:tr %s h="0"/>' % nsdecls("a"), ())
+
     def add_tc(self):
         """
         Return a reference to a newly added minimal valid ``<a:tc>`` child
@@ -440,6 +580,11 @@ class CT_TableRow(BaseOxmlElement):
         """
         return self._add_tc()
 
+    @classmethod
+    def new(cls, height):
+        """Return a new `a:tr` element having *height* and no cells."""
+        return cls._tr_proto.new({"h": "%d" % height})
+
     @property
     def row_idx(self):
         """Offset of this row in its table."""
@@ -448,6 +593,95 @@ class CT_TableRow(BaseOxmlElement):
     def _new_tc(self):
         return CT_TableCell.new()
 
+
+class TcFormatStamp(object):
+    """Cell formatting built once and stamped onto any number of `a:tc` elements.
+
+    *fill* is a hex RGB str for a solid cell fill and *ln* a `(width, rgb_hex)`
+    pair for solid cell edges; either may be |None|. *rPr_attrs* is a dict of
+    `a:rPr` attribute values and *rPr_fill* a hex RGB str, applied to every text
+    run in a stamped cell.
+
+    The `a:tcPr` content for each distinct combination of bordered edges is
+    parsed once; stamping a cell costs a deep copy of the prebuilt fragment.
+    """
+
+    def __init__(self, fill=None, ln=None, rPr_attrs=None, rPr_fill=None):
+        super(TcFormatStamp, self).__init__()
+        self._fill = fill
+        self._ln = ln
+        self._rPr_attrs = rPr_attrs or {}
+        self._rPr_fill = rPr_fill
+        self._tcPr_protos = {}
+
+    def apply(self, tc, edges=(True, True, True, True)):
+        """Stamp this formatting onto *tc*.
+
+        *edges* is a `(left, right, top, bottom)` tuple of bools selecting which
+        cell edges get a border line; it is ignored when no *ln* was specified.
+        """
+        tcPr_proto = self._tcPr_proto(edges)
+        if len(tcPr_proto):
+            self._apply_tcPr(tc, tcPr_proto)
+        if self._rPr_proto is not None:
+            self._apply_rPr(tc)
+
+    @staticmethod
+    def _apply_tcPr(tc, tcPr_proto):
+        """Merge a copy of the children of *tcPr_proto* into the `a:tcPr` of *tc*."""
+        tcPr = tc.tcPr
+        if tcPr is None:
+            tc._insert_tcPr(copy.deepcopy(tcPr_proto))
+            return
+        # ---common case: new cell, prototype children are already in order---
+        if len(tcPr) == 0:
+            tcPr.extend(list(copy.deepcopy(tcPr_proto)))
+            return
+        for child in tcPr_proto:
+            name = etree.QName(child).localname
+            if name == "solidFill":
+                tcPr._remove_eg_fillProperties()
+            else:
+                getattr(tcPr, "_remove_%s" % name)()
+            getattr(tcPr, "_insert_%s" % name)(copy.deepcopy(child))
+
+    def _apply_rPr(self, tc):
+        """Merge run-level formatting into each `a:r` element in *tc*."""
+        rPr_proto = self._rPr_proto
+        for r in tc.iter(qn("a:r")):
+            rPr = r.rPr
+            if rPr is None:
+                r._insert_rPr(copy.deepcopy(rPr_proto))
+                continue
+            for name, value in rPr_proto.attrib.items():
+                rPr.set(name, value)
+            if self._rPr_fill is not None:
+                rPr._remove_eg_fillProperties()
+                rPr._insert_solidFill(copy.deepcopy(rPr_proto[0]))
+
+    @lazyproperty
+    def _rPr_proto(self):
+        """Prototype `a:rPr` element, or |None| if no run formatting applies."""
+        if not self._rPr_attrs and self._rPr_fill is None:
+            return None
+        attrs = "".join(' %s="%s"' % item for item in sorted(self._rPr_attrs.items()))
+        fill_xml = "" if self._rPr_fill is None else solidFill_xml(self._rPr_fill)
+        return parse_xml("<a:rPr %s%s>%s</a:rPr>" % (nsdecls("a"), attrs, fill_xml))
+
+    def _tcPr_proto(self, edges):
+        """Prototype `a:tcPr` element for cells bordered on *edges*."""
+        edges = tuple(edges) if self._ln is not None else (False,) * 4
+        tcPr = self._tcPr_protos.get(edges)
+        if tcPr is None:
+            fill_xml = "" if self._fill is None else solidFill_xml(self._fill)
+            tcPr = parse_xml("<a:tcPr %s>%s</a:tcPr>" % (nsdecls("a"), fill_xml))
+            sides = [side for side, bordered in zip("LRTB", edges) if bordered]
+            for idx, side in enumerate(sides):
+                tcPr.insert(idx, CT_TableCellProperties.new_ln(side, *self._ln))
+            self._tcPr_protos[edges] = tcPr
+        return tcPr
+
+
 class TcRange(object):
     """A 2D block of `a:tc` cell elements in a table.
 
@@ -460,22 +694,34 @@ class TcRange(object):
     structural side-effects of this type.
     """
 
-    def __init__(self, tc, other_tc):
+    def __init__(self, tc, other_tc, span_map=None):
         self._tc = tc
         self._other_tc = other_tc
+        self._span_map = span_map
 
     @classmethod
-    def from_merge_origin(cls, tc):
-        """Return instance created from merge-origin tc element."""
-        other_tc = tc.tbl.tc(
-            tc.row_idx + tc.rowSpan - 1,  # ---other_row_idx
-            tc.col_idx + tc.gridSpan - 1,  # ---other_col_idx
+    def from_merge_origin(cls, tc, span_map=None):
+        """Return instance created from merge-origin tc element.
+
+        When *span_map* is provided, cell positions are resolved from it
+        rather than by searching the table for *tc*.
+        """
+        if span_map is not None:
+            row_idx, col_idx = span_map.position(tc)
+            tbl = span_map.tbl
+        else:
+            row_idx, col_idx, tbl = tc.row_idx, tc.col_idx, tc.tbl
+        other_tc = tbl.tc(
+            row_idx + tc.rowSpan - 1,  # ---other_row_idx
+            col_idx + tc.gridSpan - 1,  # ---other_col_idx
         )
-        return cls(tc, other_tc)
+        return cls(tc, other_tc, span_map)
 
     @lazyproperty
     def contains_merged_cell(self):
         """True if one or more cells in range are part of a merged cell."""
+        if self._span_map is not None:
+            return self._span_map.contains_merged_cell(*self._extents)
         for tc in self.iter_tcs():
             if tc.gridSpan > 1:
                 return True
@@ -564,8 +810,15 @@ class TcRange(object):
 
         tc, other_tc = self._tc, self._other_tc
 
-        left, width = start_and_size(tc.col_idx, other_tc.col_idx)
-        top, height = start_and_size(tc.row_idx, other_tc.row_idx)
+        if self._span_map is not None:
+            row_idx, col_idx = self._span_map.position(tc)
+            other_row_idx, other_col_idx = self._span_map.position(other_tc)
+        else:
+            row_idx, col_idx = tc.row_idx, tc.col_idx
+            other_row_idx, other_col_idx = other_tc.row_idx, other_tc.col_idx
+
+        left, width = start_and_size(col_idx, other_col_idx)
+        top, height = start_and_size(row_idx, other_row_idx)
 
         return left, top, width, height
 
@@ -584,6 +837,8 @@ class TcRange(object):
     @lazyproperty
     def _tbl(self):
         """`a:tbl` element containing this cell range"""
+        if self._span_map is not None:
+            return self._span_map.tbl
         return self._tc.tbl
 
     @lazyproperty
@@ -591,3 +846,153 @@ class TcRange(object):
         """Index of topmost row in range"""
         _, top, _, _ = self._extents
         return top
+
+
+class TcSpanMap(object):
+    """Merge-origin of every grid position in a table, resolved in one pass.
+
+    Each grid position maps to the (row_idx, col_idx) of the merge-origin cell
+    covering it, which is the position itself for a cell that is not spanned.
+    Lookups by position or by `a:tc` element are constant-time, where the
+    equivalent element queries walk the table.
+
+    Like |TcRange|, this object assumes the table structure does not change
+    while it is in use. `.is_stale` is a constant-time check that detects a
+    changed row or column count, cells merged or split through any cell
+    element, and any change reported with `TcSpanMap.table_changed()`, as the
+    row and column methods of |Table| do. Rows or cells replaced or reordered
+    by editing the XML directly, leaving the counts as they were, are not
+    detected; call `.table_changed()` on the `a:tbl` element after doing so.
+    Merge state changed through this map's range objects is picked up by
+    calling `.refresh()` on the affected range, after which the map is current
+    again.
+    """
+
+    # ---count of changes reported for each a:tbl element, held weakly, so an
+    # ---entry lasts as long as the element proxy, which each span map keeps---
+    _change_counts = weakref.WeakKeyDictionary()
+
+    def __init__(self, tbl):
+        super(TcSpanMap, self).__init__()
+        self._tbl = tbl
+        tr_lst = tbl.tr_lst
+        self._row_count = len(tr_lst)
+        self._col_count = col_count = len(tbl.tblGrid.gridCol_lst)
+        self._tcs = tcs = [None] * (self._row_count * col_count)
+        self._positions = positions = {}
+        for row_idx, tr in enumerate(tr_lst):
+            offset = row_idx * col_count
+            for col_idx, tc in enumerate(tr.tc_lst[:col_count]):
+                tcs[offset + col_idx] = tc
+                positions[tc] = offset + col_idx
+        self._signature = self._signature_of(tbl)
+        self._origins = array(str("l"), range(len(tcs)))
+        self._merged = bytearray(len(tcs))
+        self._resolve(0, 0, col_count, self._row_count)
+
+    def contains_merged_cell(self, left, top, width, height):
+        """True if any grid position in the range is part of a merged cell."""
+        merged, col_count = self._merged, self._col_count
+        for row_idx in range(top, top + height):
+            offset = row_idx * col_count + left
+            if any(merged[offset : offset + width]):
+                return True
+        return False
+
+    @property
+    def is_stale(self):
+        """True if rows, cells or merges changed since this map was built."""
+        return self._signature != self._signature_of(self._tbl)
+
+    def iter_real_tcs(self):
+        """Generate each `a:tc` element not spanned by a merge-origin cell.
+
+        Cell elements are generated left-to-right, top-to-bottom.
+        """
+        origins, tcs = self._origins, self._tcs
+        return (
+            tc for idx, tc in enumerate(tcs) if origins[idx] == idx and tc is not None
+        )
+
+    def origin(self, row_idx, col_idx):
+        """(row_idx, col_idx) of merge-origin cell covering the grid position."""
+        return divmod(self._origins[self._offset(row_idx, col_idx)], self._col_count)
+
+    def origin_tc(self, row_idx, col_idx):
+        """`a:tc` element of merge-origin cell covering the grid position."""
+        return self._tcs[self._origins[self._offset(row_idx, col_idx)]]
+
+    def position(self, tc):
+        """(row_idx, col_idx) grid position of *tc* in this table."""
+        return divmod(self._positions[tc], self._col_count)
+
+    @classmethod
+    def table_changed(cls, tbl):
+        """Make every span map of *tbl* stale after its rows or cells changed."""
+        change_counts = cls._change_counts
+        change_counts[tbl] = change_counts.get(tbl, 0) + 1
+
+    def range(self, tc, other_tc):
+        """Return a |TcRange| between *tc* and *other_tc* that uses this map."""
+        return TcRange(tc, other_tc, self)
+
+    def refresh(self, tc_range):
+        """Re-resolve grid positions in *tc_range* after its merge state changed."""
+        left, top, width, height = tc_range._extents
+        self._resolve(left, top, width, height)
+        self._signature = self._signature_of(self._tbl)
+
+    @property
+    def tbl(self):
+        """`a:tbl` element this map describes."""
+        return self._tbl
+
+    def _offset(self, row_idx, col_idx):
+        """Offset of grid position in the row-major arrays of this map."""
+        if row_idx < 0:
+            row_idx += self._row_count
+        if col_idx < 0:
+            col_idx += self._col_count
+        if not (0 <= row_idx < self._row_count and 0 <= col_idx < self._col_count):
+            raise IndexError("cell (%d, %d) out of range" % (row_idx, col_idx))
+        return row_idx * self._col_count + col_idx
+
+    def _resolve(self, left, top, width, height):
+        """Resolve merge-origins of positions in range, top-left first.
+
+        A horizontally-merged cell takes the origin of its left neighbor and
+        a vertically-merged cell that of the cell above, both of which are
+        resolved by the time it is reached.
+        """
+        tcs, origins, merged = self._tcs, self._origins, self._merged
+        col_count = self._col_count
+        for row_idx in range(top, top + height):
+            for col_idx in range(left, left + width):
+                idx = row_idx * col_count + col_idx
+                tc = tcs[idx]
+                if tc is None:
+                    origins[idx], merged[idx] = idx, 0
+                    continue
+                origin = idx
+                if tc.hMerge and col_idx > 0:
+                    origin = origins[idx - 1]
+                elif tc.vMerge and row_idx > 0:
+                    origin = origins[idx - col_count]
+                origins[idx] = origin
+                merged[idx] = (
+                    origin != idx or tc.gridSpan > 1 or tc.rowSpan > 1
+                    or tc.hMerge or tc.vMerge
+                )
+
+    @classmethod
+    def _signature_of(cls, tbl):
+        """Constant-time fingerprint of the structure and merge state of *tbl*.
+
+        Child counts of tbl and tblGrid, plus the count of changes reported
+        for *tbl* through `.table_changed()`.
+        """
+        return len(tbl), len(tbl.tblGrid), cls._change_counts.get(tbl, 0)
+
+def solidFill_xml(rgb_hex):
+    """Return `a:solidFill` XML for the hex RGB str *rgb_hex*."""
+    return '<a:solidFill><a:srgbClr val="%s"/></a:solidFill>' % rgb_hex
@@ -0,0 +1,244 @@
+# encoding: utf-8
+
+"""Opt-in tracing of XPath queries and generated accessors on oxml elements.
+
+While tracing is enabled, each call to :meth:`BaseOxmlElement.xpath` and to
+each accessor xmlchemy generates for an element class, like `CT_Shape.spPr`
+or `CT_Transform2D.get_or_add_off()`, is counted and timed. Calls are
+tallied by target, the XPath expression or accessor, and by calling API, the
+nearest calling function outside `pptx.oxml`, like
+`_BaseShapes.add_shape`, which is what makes it possible to tell which API
+call triggers an expensive whole-document query::
+
+    from pptx.oxml import trace
+
+    trace.enable()
+    build_deck()
+    trace.report(n=20)
+
+Tracing is also enabled, with a report written to stderr when the process
+exits, when the `PPTX_OXML_TRACE` environment variable is set to a non-empty
+value before `pptx` is imported.
+
+Nothing is instrumented while tracing is disabled, so it costs nothing then.
+When enabled, each traced call inspects the call stack and is several times
+slower. Counts from several threads tracing at once can be slightly low.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import atexit
+import os
+import sys
+
+from timeit import default_timer
+
+from . import xmlchemy
+from .xmlchemy import BaseOxmlElement
+
+# ---(target, api) -> [call_count, seconds]---
+_tallies = {}
+
+# ---(cls, attr_name) -> original class attribute, for each instrumented one---
+_originals = {}
+
+
+class TraceRecord(object):
+    """
+    Calls to one target from one calling API, as reported by :func:`records`.
+    """
+
+    __slots__ = ("target", "api", "calls", "total_ms")
+
+    def __init__(self, target, api, calls, total_ms):
+        self.target = target
+        self.api = api
+        self.calls = calls
+        self.total_ms = total_ms
+
+
+def enable():
+    """
+    Start tracing. Element classes created later, for example when a lazily
+    registered class is first used, are traced as well. Calling this while
+    tracing is already enabled has no effect.
+    """
+    if is_enabled():
+        return
+    _instrument(BaseOxmlElement, "xpath", _traced_xpath(BaseOxmlElement.xpath))
+    for cls in _element_classes(BaseOxmlElement):
+        _instrument_accessors(cls)
+    xmlchemy._class_created_hooks.append(_instrument_accessors)
+
+
+def disable():
+    """
+    Stop tracing, restoring each instrumented method and property. Tallies
+    collected so far are kept.
+    """
+    if _instrument_accessors in xmlchemy._class_created_hooks:
+        xmlchemy._class_created_hooks.remove(_instrument_accessors)
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+
+
+def is_enabled():
+    """True if tracing is enabled."""
+    return _instrument_accessors in xmlchemy._class_created_hooks
+
+
+def records():
+    """
+    Return a list of |TraceRecord| objects, one for each target and calling
+    API, having the most total time first.
+    """
+    return sorted(
+        (
+            TraceRecord(target, api, calls, seconds * 1000.0)
+            for (target, api), (calls, seconds) in _tallies.items()
+        ),
+        key=lambda r: r.total_ms,
+        reverse=True,
+    )
+
+
+def report(n=20, file=None):
+    """
+    Print the *n* costliest targets, each with its costliest calling APIs,
+    to *file*, `sys.stderr` by default.
+    """
+    file = sys.stderr if file is None else file
+    by_target = {}
+    for record in records():
+        by_target.setdefault(record.target, []).append(record)
+    ranked = sorted(
+        by_target.items(),
+        key=lambda item: sum(r.total_ms for r in item[1]),
+        reverse=True,
+    )
+    print("%10s %10s  %s" % ("total ms", "calls", "target / calling API"), file=file)
+    for target, target_records in ranked[:n]:
+        print(
+            "%10.2f %10d  %s"
+            % (
+                sum(r.total_ms for r in target_records),
+                sum(r.calls for r in target_records),
+                target,
+            ),
+            file=file,
+        )
+        for record in target_records[:5]:
+            print(
+                "%10.2f %10d    %s" % (record.total_ms, record.calls, record.api),
+                file=file,
+            )
+
+
+def reset():
+    """Discard the tallies collected so far."""
+    _tallies.clear()
+
+
+def _calling_api():
+    """
+    Return a name like "pptx.shapes.shapetree._BaseShapes.add_shape" for the
+    nearest function on the call stack outside this package.
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        module_name = frame.f_globals.get("__name__", "")
+        if not module_name.startswith("pptx.oxml"):
+            code = frame.f_code
+            return "%s.%s" % (module_name, getattr(code, "co_qualname", code.co_name))
+        frame = frame.f_back
+    return "?"
+
+
+def _element_classes(cls):
+    """Generate each subclass of *cls*, depth-first."""
+    for subclass in cls.__subclasses__():
+        yield subclass
+        for subclass in _element_classes(subclass):
+            yield subclass
+
+
+def _instrument(cls, name, replacement):
+    _originals[(cls, name)] = cls.__dict__[name]
+    setattr(cls, name, replacement)
+
+
+def _instrument_accessors(cls):
+    """
+    Replace each accessor generated by xmlchemy on *cls* with a traced one.
+    Accessors are recognized as functions defined in the xmlchemy module.
+    """
+    for name, value in list(cls.__dict__.items()):
+        if isinstance(value, property):
+            fget = value.fget
+            fset = value.fset
+            if not _is_generated(fget):
+                continue
+            target = "%s.%s" % (cls.__name__, name)
+            traced = property(
+                _traced(fget, target),
+                None if fset is None else _traced(fset, target + " (set)"),
+                value.fdel,
+                value.__doc__,
+            )
+            _instrument(cls, name, traced)
+        elif _is_generated(value):
+            _instrument(cls, name, _traced(value, "%s.%s()" % (cls.__name__, name)))
+
+
+def _is_generated(value):
+    return (
+        callable(value)
+        and getattr(value, "__module__", None) == xmlchemy.__name__
+        and getattr(value, "__closure__", None) is not None
+    )
+
+
+def _tally(target, start):
+    seconds = default_timer() - start
+    key = (target, _calling_api())
+    tally = _tallies.get(key)
+    if tally is None:
+        _tallies[key] = [1, seconds]
+    else:
+        tally[0] += 1
+        tally[1] += seconds
+
+
+def _traced(func, target):
+    """Return a function wrapping *func*, tallying calls as *target*."""
+
+    def traced(*args, **kwargs):
+        start = default_timer()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _tally(target, start)
+
+    traced.__doc__ = func.__doc__
+    traced.__name__ = func.__name__
+    return traced
+
+
+def _traced_xpath(xpath):
+    """Return a traced version of the *xpath* method, tallied by expression."""
+
+    def traced_xpath(self, xpath_str):
+        start = default_timer()
+        try:
+            return xpath(self, xpath_str)
+        finally:
+            _tally("xpath %s" % xpath_str, start)
+
+    traced_xpath.__doc__ = xpath.__doc__
+    return traced_xpath
+
+
+if os.environ.get("PPTX_OXML_TRACE"):
+    enable()
+    atexit.register(report)
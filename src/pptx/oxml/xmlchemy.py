@@ -11,7 +11,7 @@ import re
 
 from lxml import etree
 
-from . import oxml_parser
+from . import get_oxml_parser
 from ..compat import Unicode
 from ..exc import InvalidXmlError
 from .ns import NamespacePrefixedTag, _nsmap, qn
@@ -27,7 +27,7 @@ def OxmlElement(nsptag_str, nsmap=None):
     """
     nsptag = NamespacePrefixedTag(nsptag_str)
     nsmap = nsmap if nsmap is not None else nsptag.nsmap
-    return oxml_parser.makeelement(nsptag.clark_name, nsmap=nsmap)
+    return get_oxml_parser().makeelement(nsptag.clark_name, nsmap=nsmap)
 
 
 def serialize_for_reading(element):
@@ -120,6 +120,13 @@ class MetaOxmlElement(type):
         for key, value in clsdict.items():
             if isinstance(value, dispatchable):
                 value.populate_class_members(cls, key)
+        for hook in _class_created_hooks:
+            hook(cls)
+
+
+# ---callables each called with every element class created after the hook is
+# ---added, used by `pptx.oxml.trace` to instrument lazily imported classes---
+_class_created_hooks = []
 
 
 class BaseAttribute(object):
@@ -139,6 +146,9 @@ class BaseAttribute(object):
         """
         self._element_cls = element_cls
         self._prop_name = prop_name
+        self._clark_name = (
+            qn(self._attr_name) if ":" in self._attr_name else self._attr_name
+        )
 
         self._add_attr_property()
 
@@ -152,12 +162,6 @@ class BaseAttribute(object):
         # assign unconditionally to overwrite element name definition
         setattr(self._element_cls, self._prop_name, property_)
 
-    @property
-    def _clark_name(self):
-        if ":" in self._attr_name:
-            return qn(self._attr_name)
-        return self._attr_name
-
 
 class OptionalAttribute(BaseAttribute):
     """
@@ -190,11 +194,14 @@ class OptionalAttribute(BaseAttribute):
         property descriptor.
         """
 
+        clark_name, default = self._clark_name, self._default
+        from_xml = self._simple_type.from_xml
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
-                return self._default
-            return self._simple_type.from_xml(attr_str_value)
+                return default
+            return from_xml(attr_str_value)
 
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
@@ -206,13 +213,15 @@ class OptionalAttribute(BaseAttribute):
         property descriptor.
         """
 
+        clark_name, default = self._clark_name, self._default
+        to_xml = self._simple_type.to_xml
+
         def set_attr_value(obj, value):
-            if value == self._default:
-                if self._clark_name in obj.attrib:
-                    del obj.attrib[self._clark_name]
+            if value == default:
+                obj.attrib.pop(clark_name, None)
                 return
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            str_value = to_xml(value)
+            obj.set(clark_name, str_value)
 
         return set_attr_value
 
@@ -234,14 +243,17 @@ class RequiredAttribute(BaseAttribute):
         property descriptor.
         """
 
+        clark_name, attr_name = self._clark_name, self._attr_name
+        from_xml = self._simple_type.from_xml
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s"
-                    % (self._attr_name, obj.tag)
+                    % (attr_name, obj.tag)
                 )
-            return self._simple_type.from_xml(attr_str_value)
+            return from_xml(attr_str_value)
 
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
@@ -264,9 +276,11 @@ class RequiredAttribute(BaseAttribute):
         property descriptor.
         """
 
+        clark_name, to_xml = self._clark_name, self._simple_type.to_xml
+
         def set_attr_value(obj, value):
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            str_value = to_xml(value)
+            obj.set(clark_name, str_value)
 
         return set_attr_value
 
@@ -390,8 +404,10 @@ class _BaseChildElement(object):
         matching tag name or |None| if not present.
         """
 
+        clark_name = qn(self._nsptagname)
+
         def get_child_element(obj):
-            return obj.find(qn(self._nsptagname))
+            return obj.find(clark_name)
 
         get_child_element.__doc__ = (
             "``<%s>`` child element or |None| if not present." % self._nsptagname
@@ -409,8 +425,10 @@ class _BaseChildElement(object):
         property descriptor.
         """
 
+        clark_name = qn(self._nsptagname)
+
         def get_child_element_list(obj):
-            return obj.findall(qn(self._nsptagname))
+            return obj.findall(clark_name)
 
         get_child_element_list.__doc__ = (
             "A list containing each of the ``<%s>`` child elements, in the o"
@@ -514,8 +532,10 @@ class OneAndOnlyOne(_BaseChildElement):
         descriptor.
         """
 
+        clark_name = qn(self._nsptagname)
+
         def get_child_element(obj):
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(clark_name)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" % self._nsptagname
@@ -699,8 +719,14 @@ class ZeroOrOneChoice(_BaseChildElement):
         descriptor.
         """
 
+        clark_names = [qn(tagname) for tagname in self._member_nsptagnames]
+
         def get_group_member_element(obj):
-            return obj.first_child_found_in(*self._member_nsptagnames)
+            for clark_name in clark_names:
+                child = obj.find(clark_name)
+                if child is not None:
+                    return child
+            return None
 
         get_group_member_element.__doc__ = (
             "Return the child element belonging to this element group, or "
@@ -789,8 +815,31 @@ class _OxmlElementBase(etree.ElementBase):
         """
         Override of ``lxml`` _Element.xpath() method to provide standard Open
         XML namespace mapping in centralized location.
+
+        Each distinct expression is compiled once and the compiled form reused
+        on later calls.
         """
-        return super(BaseOxmlElement, self).xpath(xpath_str, namespaces=_nsmap)
+        return _compiled_xpath(xpath_str)(self)
+
+
+def _compiled_xpath(xpath_str):
+    """
+    Return the `etree.XPath` object for *xpath_str*, using the standard Open
+    XML namespace mapping. Compiled expressions are cached, up to a limit
+    that keeps expressions built from varying values from growing the cache
+    without bound.
+    """
+    try:
+        return _xpath_cache[xpath_str]
+    except KeyError:
+        compiled = etree.XPath(xpath_str, namespaces=_nsmap)
+        if len(_xpath_cache) < _XPATH_CACHE_LIMIT:
+            _xpath_cache[xpath_str] = compiled
+        return compiled
+
+
+_XPATH_CACHE_LIMIT = 2048
+_xpath_cache = {}
 
 
 BaseOxmlElement = MetaOxmlElement(
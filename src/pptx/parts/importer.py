@@ -0,0 +1,520 @@
+# encoding: utf-8
+
+"""
+Copying slides, along with the parts they depend on, between presentations.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import collections
+import copy
+import hashlib
+import re
+
+from lxml import etree
+
+from ..opc.constants import RELATIONSHIP_TYPE as RT
+from ..opc.package import PartFactory, XmlPart
+from ..opc.packuri import PackURI
+from ..oxml.ns import qn
+from .image import ImagePart
+from .media import MediaPart
+from .slide import NotesMasterPart, SlideLayoutPart, SlideMasterPart, SlidePart
+
+# ---splits a partname like "/ppt/media/image12.png" into the part before the
+# ---number and the extension---
+_PARTNAME_PARTS = re.compile(r"^(.*?)\d*(\.[^./]*)?$")
+
+# ---ids of slide masters and slide layouts share a range, starting here---
+_MIN_MASTER_ID = 2147483648
+
+_HYPERLINK_TAGS = (qn("a:hlinkClick"), qn("a:hlinkHover"))
+
+
+class SlideImporter(object):
+    """
+    Copies slides from other presentations into the presentation of
+    *prs_part*, in one pass for any number of slides.
+
+    The slide XML is copied as is; each copied part keeps the rIds of the
+    part it's copied from, so references in the XML don't need rewriting.
+    The parts a slide depends on are shared with the destination where
+    possible:
+
+    * An image or media part having the same SHA1 as one already in the
+      destination is reused rather than copied.
+    * A slide layout is reused when the destination has a slide layout
+      having the same XML, related parts and slide master. When only the
+      slide master matches, the layout is copied into that master. A slide
+      master having no match is copied along with all its layouts.
+
+    Other related parts, like charts, notes slides and embedded workbooks,
+    are copied. A hyperlink jumping to a slide that isn't imported is
+    removed, as its target doesn't exist in the destination.
+
+    The destination package is indexed when the importer is constructed, so
+    an importer should not be used after the destination is otherwise
+    changed.
+    """
+
+    def __init__(self, prs_part):
+        self._prs_part = prs_part
+        self._package = prs_part.package
+        # ---parts of the destination before any import, by partname---
+        self._parts_by_partname = dict(
+            (part.partname, part) for part in self._package.iter_parts()
+        )
+        self._partnames = set(self._parts_by_partname)
+        self._next_idx_by_template = {}
+        # ---source part -> destination part, for each part imported or found
+        # ---to have a match in the destination---
+        self._imported = {}
+        self._parts_by_sha1 = {}
+        for part in self._parts_by_partname.values():
+            sha1 = getattr(part, "sha1", None)
+            if sha1 is not None:
+                self._parts_by_sha1.setdefault(sha1, part)
+        self._notes_master_part = None
+        # ---slide masters and layouts of the destination are indexed by content
+        # ---only once a source layout needs to be matched that way---
+        self._masters_by_hash = None
+        self._layouts_by_hash = None
+        self._next_master_id = None
+
+    def import_slides(self, slide_parts, layout_parts=None):
+        """
+        Return a list of new |SlidePart| objects, copies of the source
+        *slide_parts* in the same order. The new slide parts are not yet
+        related to the presentation part.
+
+        *layout_parts*, when given, maps source slide layout parts to the
+        destination slide layout part a copied slide should use in their
+        place, rather than one found by content.
+        """
+        if layout_parts:
+            self._imported.update(layout_parts)
+        # ---a slide imported more than once stands for its first copy, as
+        # ---the target of hyperlinks from the other imported slides---
+        new_slide_parts = []
+        repeated = set()
+        for slide_part in slide_parts:
+            first_copy = self._imported.get(slide_part)
+            new_slide_parts.append(self._new_part(slide_part))
+            if first_copy is not None:
+                self._imported[slide_part] = first_copy
+                repeated.add(len(new_slide_parts) - 1)
+        for slide_part in slide_parts:
+            self._layout_for(slide_part.part_related_by(RT.SLIDE_LAYOUT))
+            for rel in slide_part.rels.values():
+                if rel.reltype != RT.NOTES_SLIDE:
+                    continue
+                src_notes_master_part = rel.target_part.part_related_by(
+                    RT.NOTES_MASTER
+                )
+                self._imported.setdefault(
+                    src_notes_master_part, self._notes_master()
+                )
+        for idx, (slide_part, new_slide_part) in enumerate(
+            zip(slide_parts, new_slide_parts)
+        ):
+            if idx in repeated:
+                self._copy_repeated_slide_rels(slide_part, new_slide_part)
+            else:
+                self._copy_rels(slide_part, new_slide_part)
+        return new_slide_parts
+
+    def import_shard(self, shard):
+        """
+        Return a list of new |SlidePart| objects, the slides serialized in
+        |SlideShard| *shard*, in order. The new slide parts are not yet
+        related to the presentation part.
+
+        The shard must come from a presentation loaded from the same
+        template as the destination, as its slide layouts are found by
+        partname. Images and media are shared with the destination and with
+        earlier shards by SHA1, other parts are added under the next
+        partnames not in use.
+        """
+        parts = {}
+        for partname, content_type, sha1, blob, _ in shard.parts:
+            if sha1 is not None:
+                part = self._parts_by_sha1.get(sha1)
+                if part is None:
+                    part = PartFactory(
+                        self._next_partname(partname),
+                        content_type,
+                        shard.blobs[sha1],
+                        self._package,
+                    )
+                    self._parts_by_sha1[sha1] = part
+                parts[partname] = part
+                continue
+            parts[partname] = PartFactory(
+                self._next_partname(partname), content_type, blob, self._package
+            )
+        for partname, _, sha1, _, rels in shard.parts:
+            if sha1 is not None:
+                continue
+            part = parts[partname]
+            for rId, reltype, target, is_external in rels:
+                if is_external:
+                    part.load_rel(reltype, target, rId, is_external=True)
+                    continue
+                target_part = self._shard_target(parts, reltype, target)
+                if target_part is None:
+                    _remove_hyperlinks(part, rId)
+                    continue
+                part.load_rel(reltype, target_part, rId)
+        return [parts[partname] for partname in shard.slide_partnames]
+
+    def _add_layout_to_master(self, layout_part, master_part):
+        """
+        Make *layout_part*, just imported, a layout of *master_part*, which is
+        in the destination.
+        """
+        rId = master_part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+        sldLayoutIdLst = master_part._element.get_or_add_sldLayoutIdLst()
+        sldLayoutIdLst._add_sldLayoutId(id=self._new_master_id(), rId=rId)
+
+    def _add_master(self, master_part):
+        """
+        Add *master_part*, just imported along with its layouts, to the
+        slide masters of the destination presentation.
+        """
+        sldLayoutIdLst = master_part._element.sldLayoutIdLst
+        if sldLayoutIdLst is not None:
+            for sldLayoutId in sldLayoutIdLst.sldLayoutId_lst:
+                sldLayoutId.id = self._new_master_id()
+        rId = self._prs_part.relate_to(master_part, RT.SLIDE_MASTER)
+        sldMasterIdLst = self._prs_part._element.get_or_add_sldMasterIdLst()
+        sldMasterIdLst._add_sldMasterId(id=self._new_master_id(), rId=rId)
+
+    def _copy_rels(self, src_part, part):
+        """
+        Give *part* a relationship to the import of each part *src_part* is
+        related to, having the same rId.
+        """
+        for rId, rel in src_part.rels.items():
+            if rel.is_external:
+                part.load_rel(rel.reltype, rel.target_ref, rId, is_external=True)
+                continue
+            target = self._import(rel.target_part, rel.reltype)
+            if target is None:
+                _remove_hyperlinks(part, rId)
+                continue
+            part.load_rel(rel.reltype, target, rId)
+
+    def _copy_repeated_slide_rels(self, src_slide_part, slide_part):
+        """
+        Copy the relationships of *src_slide_part* to *slide_part*, a further
+        copy of a slide already imported. The new slide gets its own copy of
+        each part belonging to a single slide, like its notes slide or
+        charts, rather than sharing those of the earlier copy.
+        """
+        imported = self._imported
+        self._imported = dict(
+            (src_part, part)
+            for src_part, part in imported.items()
+            if isinstance(part, _SHARED_PART_TYPES)
+        )
+        self._imported[src_slide_part] = slide_part
+        try:
+            self._copy_rels(src_slide_part, slide_part)
+        finally:
+            self._imported = imported
+
+    def _import(self, src_part, reltype):
+        """
+        Return the destination part standing in for *src_part*, importing it
+        first if need be. Returns |None| for a slide not being imported.
+        """
+        part = self._imported.get(src_part)
+        if part is not None:
+            return part
+        if reltype == RT.SLIDE:
+            return None
+        if isinstance(src_part, (ImagePart, MediaPart)):
+            part = self._parts_by_sha1.get(src_part.sha1)
+            if part is not None:
+                self._imported[src_part] = part
+                return part
+            part = self._new_part(src_part)
+            self._parts_by_sha1[src_part.sha1] = part
+            return part
+        part = self._new_part(src_part)
+        self._copy_rels(src_part, part)
+        return part
+
+    def _layout_for(self, src_layout_part):
+        """
+        Return the destination slide layout part standing in for
+        *src_layout_part*, found by content or imported.
+        """
+        layout_part = self._imported.get(src_layout_part)
+        if layout_part is not None:
+            return layout_part
+
+        if self._masters_by_hash is None:
+            self._index_masters()
+        src_master_part = src_layout_part.part_related_by(RT.SLIDE_MASTER)
+        master_hash = _master_hash(src_master_part)
+        layout_hash = _layout_hash(src_layout_part, master_hash)
+        layout_part = self._layouts_by_hash.get(layout_hash)
+        if layout_part is not None:
+            self._imported[src_layout_part] = layout_part
+            return layout_part
+
+        master_part = self._masters_by_hash.get(master_hash)
+        if master_part is None:
+            master_part = self._import(src_master_part, RT.SLIDE_MASTER)
+            self._add_master(master_part)
+            self._masters_by_hash[master_hash] = master_part
+            for src_part in self._layout_parts(src_master_part):
+                self._layouts_by_hash.setdefault(
+                    _layout_hash(src_part, master_hash), self._imported[src_part]
+                )
+            return self._imported[src_layout_part]
+
+        self._imported.setdefault(src_master_part, master_part)
+        layout_part = self._import(src_layout_part, RT.SLIDE_LAYOUT)
+        self._add_layout_to_master(layout_part, master_part)
+        self._layouts_by_hash[layout_hash] = layout_part
+        return layout_part
+
+    def _index_masters(self):
+        """
+        Index the slide masters and slide layouts of the destination by
+        content.
+        """
+        self._masters_by_hash = {}
+        self._layouts_by_hash = {}
+        for master_part in self._master_parts(self._prs_part):
+            master_hash = _master_hash(master_part)
+            self._masters_by_hash.setdefault(master_hash, master_part)
+            for layout_part in self._layout_parts(master_part):
+                self._layouts_by_hash.setdefault(
+                    _layout_hash(layout_part, master_hash), layout_part
+                )
+        self._next_master_id = self._max_master_id() + 1
+
+    @staticmethod
+    def _layout_parts(master_part):
+        for rel in master_part.rels.values():
+            if rel.reltype == RT.SLIDE_LAYOUT and not rel.is_external:
+                yield rel.target_part
+
+    @staticmethod
+    def _master_parts(prs_part):
+        for rel in prs_part.rels.values():
+            if rel.reltype == RT.SLIDE_MASTER and not rel.is_external:
+                yield rel.target_part
+
+    def _notes_master(self):
+        """
+        Notes master part of the destination, created the first time it's
+        needed if the destination doesn't have one.
+        """
+        if self._notes_master_part is None:
+            self._notes_master_part = self._prs_part.notes_master_part
+        return self._notes_master_part
+
+    def _max_master_id(self):
+        """
+        Largest slide master or slide layout id in the destination, or one
+        less than the smallest allowed when there are none.
+        """
+        ids = [
+            int(id_str)
+            for id_str in self._prs_part._element.xpath(
+                "./p:sldMasterIdLst/p:sldMasterId/@id"
+            )
+        ]
+        for master_part in self._master_parts(self._prs_part):
+            ids.extend(
+                int(id_str)
+                for id_str in master_part._element.xpath(
+                    "./p:sldLayoutIdLst/p:sldLayoutId/@id"
+                )
+            )
+        return max([_MIN_MASTER_ID - 1] + ids)
+
+    def _new_master_id(self):
+        master_id = self._next_master_id
+        self._next_master_id += 1
+        return master_id
+
+    def _new_part(self, src_part):
+        """
+        Return a copy of *src_part*, without its relationships, belonging to
+        the destination package and named like *src_part* but with the next
+        number not in use.
+        """
+        partname = self._next_partname(src_part.partname)
+        if isinstance(src_part, XmlPart):
+            part = type(src_part)(
+                partname,
+                src_part.content_type,
+                copy.deepcopy(src_part._element),
+                self._package,
+            )
+        else:
+            part = type(src_part).load(
+                partname, src_part.content_type, src_part.blob, self._package
+            )
+        self._imported[src_part] = part
+        return part
+
+    def _shard_target(self, parts, reltype, partname):
+        """
+        Return the destination part a relationship of *reltype* to the shard
+        part named *partname* should target, given the new parts of the
+        shard in dict *parts*. Returns |None| for a slide that isn't in the
+        shard or the destination.
+        """
+        if reltype == RT.NOTES_MASTER:
+            return self._notes_master()
+        part = parts.get(partname)
+        if part is None:
+            part = self._parts_by_partname.get(partname)
+        if part is None and reltype != RT.SLIDE:
+            raise ValueError(
+                "shard refers to part %s, not in the template of this "
+                "presentation" % partname
+            )
+        return part
+
+    def _next_partname(self, src_partname):
+        """
+        Return a |PackURI| like *src_partname* having the lowest number not
+        used by a part in the destination.
+        """
+        prefix, ext = _PARTNAME_PARTS.match(src_partname).groups()
+        template = prefix.replace("%", "%%") + "%d" + (ext or "")
+        idx = self._next_idx_by_template.get(template, 1)
+        while template % idx in self._partnames:
+            idx += 1
+        self._next_idx_by_template[template] = idx + 1
+        partname = PackURI(template % idx)
+        self._partnames.add(partname)
+        return partname
+
+
+class SlideShard(object):
+    """
+    Slides of a presentation serialized for adding to another presentation
+    loaded from the same template, usually in another process, with
+    :meth:`.Slides.import_shards`. A shard holds only bytes and strings so
+    it can be pickled.
+
+    The shard holds each of the slide parts in *slide_parts* and the parts
+    they depend on, like pictures, charts and notes slides. Slide layouts,
+    the notes master and other slides are referred to by partname only, as
+    they are expected to be in the template. Images and media are stored
+    once each, keyed by SHA1.
+    """
+
+    def __init__(self, slide_parts):
+        # ---partnames of the slides, in order---
+        self.slide_partnames = [str(part.partname) for part in slide_parts]
+        # ---(partname, content_type, sha1, blob, rels) for each part, where
+        # ---sha1 is None and blob the content of a part other than an image
+        # ---or media part, and rels a list of (rId, reltype, target,
+        # ---is_external), target being a partname or an external reference---
+        self.parts = []
+        # ---sha1 -> blob, for each image or media part---
+        self.blobs = {}
+        queue = collections.deque(slide_parts)
+        seen = set(queue)
+        while queue:
+            part = queue.popleft()
+            self.parts.append(self._part_record(part))
+            for rel in part.rels.values():
+                if rel.is_external or rel.reltype in _SHARD_REFERENCES:
+                    continue
+                if rel.target_part not in seen:
+                    seen.add(rel.target_part)
+                    queue.append(rel.target_part)
+
+    def _part_record(self, part):
+        partname = str(part.partname)
+        if isinstance(part, (ImagePart, MediaPart)):
+            self.blobs[part.sha1] = part.blob
+            return (partname, part.content_type, part.sha1, None, [])
+        rels = [
+            (
+                rId,
+                rel.reltype,
+                rel.target_ref if rel.is_external else str(rel.target_part.partname),
+                rel.is_external,
+            )
+            for rId, rel in part.rels.items()
+        ]
+        return (partname, part.content_type, None, part.blob, rels)
+
+
+# ---types of part shared by all copies of a slide imported more than once---
+_SHARED_PART_TYPES = (
+    ImagePart,
+    MediaPart,
+    NotesMasterPart,
+    SlideLayoutPart,
+    SlideMasterPart,
+    SlidePart,
+)
+
+# ---relationship types a shard refers to by partname rather than holding the
+# ---target part---
+_SHARD_REFERENCES = (RT.NOTES_MASTER, RT.SLIDE, RT.SLIDE_LAYOUT)
+
+
+def _layout_hash(layout_part, master_hash):
+    """
+    Digest of the content of *layout_part*, given the digest of its slide
+    master, equal for layouts that look the same.
+    """
+    sha1 = hashlib.sha1(layout_part.blob)
+    sha1.update(_rels_digest(layout_part, RT.SLIDE_MASTER))
+    sha1.update(master_hash.encode("ascii"))
+    return sha1.hexdigest()
+
+
+def _master_hash(master_part):
+    """
+    Digest of the content of *master_part*, not counting its layouts, equal
+    for masters that look the same.
+    """
+    sldMaster = copy.deepcopy(master_part._element)
+    sldMaster._remove_sldLayoutIdLst()
+    sha1 = hashlib.sha1(etree.tostring(sldMaster))
+    sha1.update(_rels_digest(master_part, RT.SLIDE_LAYOUT))
+    return sha1.hexdigest()
+
+
+def _part_hash(part):
+    """SHA1 of the blob of *part*, as computed by image and media parts."""
+    sha1 = getattr(part, "sha1", None)
+    if sha1 is None:
+        sha1 = hashlib.sha1(part.blob).hexdigest()
+    return sha1
+
+
+def _rels_digest(part, skipped_reltype):
+    """
+    Bytes describing the relationships of *part*, other than those of
+    *skipped_reltype*, by rId, type and target content.
+    """
+    lines = []
+    for rId in sorted(part.rels):
+        rel = part.rels[rId]
+        if rel.reltype == skipped_reltype:
+            continue
+        target = rel.target_ref if rel.is_external else _part_hash(rel.target_part)
+        lines.append("%s %s %s" % (rId, rel.reltype, target))
+    return "\n".join(lines).encode("utf-8")
+
+
+def _remove_hyperlinks(part, rId):
+    """Remove each hyperlink in the XML of *part* referring to *rId*."""
+    for element in part._element.xpath("//*[@r:id='%s']" % rId):
+        if element.tag in _HYPERLINK_TAGS:
+            element.getparent().remove(element)
@@ -7,9 +7,10 @@ Presentation part, the main part in a .pptx package.
 from __future__ import absolute_import
 
 from ..opc.constants import RELATIONSHIP_TYPE as RT
-from ..opc.package import XmlPart
+from ..opc.package import WrittenPart, XmlPart
 from ..opc.packuri import PackURI
 from ..presentation import Presentation
+from .importer import SlideImporter
 from .slide import NotesMasterPart, SlidePart
 from ..util import lazyproperty
 
@@ -19,6 +20,11 @@ class PresentationPart(XmlPart):
     Top level class in object model, represents the contents of the /ppt
     directory of a .pptx file.
     """
+
+    _explicit_reltypes = (RT.SLIDE,)
+
+    _slide_ids = None
+
     def new_slide(self, slide_layout):
         """
         Creates new temporary slide_part. Note that Slide has no relationship yet.
@@ -52,15 +58,66 @@ class PresentationPart(XmlPart):
         """
         return self.package.core_properties
 
+    def before_marshal(self):
+        """
+        Name the slide parts in presentation order, so reordering slides
+        doesn't have to rename them each time. Slide parts not in the
+        presentation, like those of removed slides, are numbered after the
+        rest so no two parts get the same name.
+        """
+        sldIdLst = self._element.sldIdLst
+        rIds = [] if sldIdLst is None else [sldId.rId for sldId in sldIdLst]
+        listed_rIds = set(rIds)
+        for rId, rel in self.rels.items():
+            if rel.is_external or rel.reltype != RT.SLIDE:
+                continue
+            if rId not in listed_rIds:
+                rIds.append(rId)
+        self.rename_slide_parts(rIds)
+
+    def drop_unreferenced_rels(self):
+        """
+        Remove the relationships to slides no longer in this presentation,
+        along with the slide index, which refers to those slide parts.
+        """
+        super(PresentationPart, self).drop_unreferenced_rels()
+        self._slide_ids = None
+
     def get_slide(self, slide_id):
         """
         Return the |Slide| object identified by *slide_id* (in this
         presentation), or |None| if not found.
         """
-        for sldId in self._element.sldIdLst:
-            if sldId.id == slide_id:
-                return self.related_parts[sldId.rId].slide
-        return None
+        rId = self._slide_id_index.rId_for(slide_id)
+        if rId is None:
+            return None
+        return self.related_parts[rId].slide
+
+    def import_slides(self, slide_parts, layout_parts=None):
+        """
+        Return a list of `(rId, slide)` pairs, one for each of the slides in
+        *slide_parts*, copied from another presentation along with the parts
+        they depend on. Each new slide is related to this part by *rId* but
+        not yet added to the slide sequence. *layout_parts* optionally maps
+        the slide layout parts of the source slides to those of this
+        presentation the copies should use.
+        """
+        slide_parts = SlideImporter(self).import_slides(slide_parts, layout_parts)
+        return self._relate_slide_parts(slide_parts)
+
+    def import_shards(self, shards):
+        """
+        Return a list of `(rId, slide)` pairs, one for each of the slides
+        serialized in the |SlideShard| objects in iterable *shards*, in order.
+        Each new slide is related to this part by *rId* but not yet added to
+        the slide sequence. Shards are imported one at a time as *shards* is
+        iterated.
+        """
+        importer = SlideImporter(self)
+        imported = []
+        for shard in shards:
+            imported.extend(self._relate_slide_parts(importer.import_shard(shard)))
+        return imported
 
     @lazyproperty
     def notes_master(self):
@@ -121,23 +178,132 @@ class PresentationPart(XmlPart):
             slide_part = self.related_parts[rId]
             slide_part.partname = PackURI("/ppt/slides/slide%d.xml" % (idx + 1))
 
-    def save(self, path_or_stream):
+    def save(
+        self, path_or_stream, optimize=False, profiler=None, collect_garbage=False
+    ):
         """
         Save this presentation package to *path_or_stream*, which can be
         either a path to a filesystem location (a string) or a file-like
-        object.
+        object. Returns the |SaveReport| of :meth:`.OpcPackage.save`.
         """
-        self.package.save(path_or_stream)
+        return self.package.save(path_or_stream, optimize, profiler, collect_garbage)
+
+    def stream_slides(self, slide_parts, pkg_writer):
+        """
+        Write *slide_parts*, slides of this presentation, to *pkg_writer*,
+        a |StreamingPackageWriter|, along with the parts only they use, like
+        notes slides and charts. Each part written is replaced in the package
+        by a |WrittenPart|, so the memory it holds is released once no other
+        object refers to it. Slide layouts and notes masters, which slides
+        share, are left to be written with the rest of the package.
+
+        Each slide part is named for its position first, as slide parts
+        written can't be renamed when the package is saved.
+        """
+        slide_id_index = self._slide_id_index
+        rIds = []
+        for slide_part in slide_parts:
+            rIds.append(slide_id_index.rId_for(slide_id_index.id_for(slide_part)))
+            slide_part.partname = PackURI(
+                "/ppt/slides/slide%d.xml" % (slide_id_index.position_of(slide_part) + 1)
+            )
+        del slide_id_index
+        self._slide_ids = None
+        written = {}
+        for rId in rIds:
+            slide_part = self.related_parts[rId]
+            written_part = _write_and_release(slide_part, pkg_writer, written)
+            self.load_rel(RT.SLIDE, written_part, rId)
 
     def slide_id(self, slide_part):
         """
         Return the slide identifier associated with *slide_part* in this
         presentation.
         """
-        for sldId in self._element.sldIdLst:
-            if self.related_parts[sldId.rId] is slide_part:
-                return sldId.id
-        raise ValueError("matching slide_part not found")
+        slide_id = self._slide_id_index.id_for(slide_part)
+        if slide_id is None:
+            raise ValueError("matching slide_part not found")
+        return slide_id
+
+    def slide_appended(self, sldId):
+        """
+        Add *sldId*, just appended to `p:sldIdLst`, to the slide index so
+        appending a slide doesn't cause the index to be rebuilt.
+        """
+        if self._slide_ids is not None:
+            self._slide_ids.append_new(sldId)
+
+    def slide_inserted(self, sldId):
+        """
+        Add *sldId*, just inserted into `p:sldIdLst`, to the slide index so
+        inserting a slide doesn't cause the index to be rebuilt.
+        """
+        if self._slide_ids is not None:
+            self._slide_ids.insert_new(sldId, sldId.getparent().index(sldId))
+
+    def slide_removed(self, sldId, idx):
+        """
+        Drop *sldId*, just removed from position *idx* of `p:sldIdLst`, from
+        the slide index so removing a slide doesn't cause the index to be
+        rebuilt.
+        """
+        if self._slide_ids is not None:
+            self._slide_ids.remove(sldId, idx)
+
+    def slides_reordered(self):
+        """
+        Discard the slide index after slides have been reordered in place or
+        `p:sldIdLst` was otherwise edited directly, which it can't always
+        detect, so it is rebuilt on next use.
+        """
+        self._slide_ids = None
+
+    def slides_using(self, slide_layout_part):
+        """
+        Return a tuple of the |Slide| objects in this presentation based on
+        the slide layout in *slide_layout_part*, in presentation order.
+        """
+        return tuple(
+            slide_part.slide
+            for slide_part in self._slide_id_index.slide_parts_using(slide_layout_part)
+        )
+
+    def slide_position(self, slide_part):
+        """
+        Return the zero-based position of *slide_part* in this presentation.
+        A slide part not related to this presentation matches when it shares
+        its XML with one that is, as a part copied by `Slides.insert_slide()`
+        does. Raises |ValueError| when no slide matches.
+        """
+        slide_id_index = self._slide_id_index
+        position = slide_id_index.position_of(slide_part)
+        if position is None:
+            position = slide_id_index.position_of_element(slide_part._element)
+        if position is None:
+            raise ValueError("matching slide_part not found")
+        return position
+
+    @property
+    def _slide_id_index(self):
+        """
+        |_SlideIdIndex| of the slides in this presentation, rebuilt when
+        `p:sldIdLst` has changed since it was built.
+        """
+        sldIdLst = self._element.get_or_add_sldIdLst()
+        slide_ids = self._slide_ids
+        if slide_ids is None or slide_ids.is_stale_for(sldIdLst):
+            slide_ids = self._slide_ids = _SlideIdIndex(sldIdLst, self.related_parts)
+        return slide_ids
+
+    def _relate_slide_parts(self, slide_parts):
+        """
+        Return a list of `(rId, slide)` pairs, one for each of the new slide
+        parts in *slide_parts*, each now related to this part by *rId*.
+        """
+        rIds = self.rels.add_relationships(RT.SLIDE, slide_parts)
+        return [
+            (rId, slide_part.slide) for rId, slide_part in zip(rIds, slide_parts)
+        ]
 
     @property
     def _next_slide_partname(self):
@@ -149,3 +315,222 @@ class PresentationPart(XmlPart):
         sldIdLst = self._element.get_or_add_sldIdLst()
         partname_str = "/ppt/slides/slide%d.xml" % (len(sldIdLst) + 1)
         return PackURI(partname_str)
+
+
+# ---types of relationship from a slide, or a part it uses, to a part shared
+# ---with other slides---
+_SHARED_RELTYPES = (RT.NOTES_MASTER, RT.SLIDE_LAYOUT)
+
+
+def _write_and_release(part, pkg_writer, written):
+    """
+    Return a |WrittenPart| standing in for *part* after writing it and the
+    parts it alone uses to *pkg_writer*. *written* maps each part written so
+    far to its stand-in; a part in it is not written again.
+    """
+    written_part = written.get(part)
+    if written_part is not None:
+        return written_part
+    written_part = written[part] = WrittenPart.replacing(part)
+    for rId, rel in list(part.rels.items()):
+        if rel.is_external or rel.reltype in _SHARED_RELTYPES:
+            continue
+        target = rel.target_part
+        if isinstance(target, WrittenPart):
+            continue
+        target = _write_and_release(target, pkg_writer, written)
+        part.load_rel(rel.reltype, target, rId)
+    pkg_writer.write_part(part)
+    for rId, rel in part.rels.items():
+        target = rel.target_ref if rel.is_external else rel.target_part
+        written_part.load_rel(rel.reltype, target, rId, rel.is_external)
+    return written_part
+
+
+class _SlideIdIndex(object):
+    """
+    Lookups between the slide id, rId, position, slide layout and |SlidePart|
+    of each slide in a presentation, built in one pass over its `p:sldIdLst`
+    element.
+
+    |Slides| notifies the index of each slide it appends, inserts or removes,
+    so the index is kept current without rebuilding it. Otherwise the index
+    is stale when the element or its first or last `p:sldId` element has
+    changed since it was built, which is checked in constant time. Other
+    direct edits to `p:sldIdLst`, like adding, removing or moving a slide
+    between two others, are not detected; call
+    :meth:`.PresentationPart.slides_reordered` after making one.
+    """
+
+    def __init__(self, sldIdLst, related_parts):
+        self._sldIdLst = sldIdLst
+        self._related_parts = related_parts
+        self._rIds_by_id = {}
+        self._ids_by_part = {}
+        self._positions_by_part = {}
+        # ---slide part and p:sldId element at each position---
+        self._parts = []
+        self._sldIds = []
+        # ---slide parts by slide layout part, built on first use---
+        self._slide_parts_by_layout_part = None
+        for sldId in sldIdLst.sldId_lst:
+            self.append(sldId)
+
+    def append(self, sldId):
+        """Add *sldId*, the next `p:sldId` element, to the index."""
+        slide_id, rId = sldId.id, sldId.rId
+        slide_part = self._related_parts.get(rId)
+        self._rIds_by_id[slide_id] = rId
+        self._ids_by_part.setdefault(slide_part, slide_id)
+        if slide_part not in self._positions_by_part:
+            self._positions_by_part[slide_part] = len(self._parts)
+            if self._slide_parts_by_layout_part is not None:
+                self._add_to_layout_index(slide_part)
+        self._parts.append(slide_part)
+        self._sldIds.append(sldId)
+
+    def append_new(self, sldId):
+        """
+        Add *sldId*, just appended to `p:sldIdLst`, provided this index was
+        current before that. A stale index is left to be rebuilt.
+        """
+        if self._fits_at(sldId, len(self._sldIds)):
+            self.append(sldId)
+
+    def insert_new(self, sldId, position):
+        """
+        Add *sldId*, just inserted at *position* in `p:sldIdLst`, provided
+        this index was current before that. A stale index is left to be
+        rebuilt. Takes time proportional to the count of slides after
+        *position*, without visiting their XML.
+        """
+        if not self._fits_at(sldId, position):
+            return
+        if position == len(self._parts):
+            self.append(sldId)
+            return
+        slide_id, rId = sldId.id, sldId.rId
+        slide_part = self._related_parts.get(rId)
+        self._rIds_by_id[slide_id] = rId
+        self._ids_by_part.setdefault(slide_part, slide_id)
+        self._parts.insert(position, slide_part)
+        self._sldIds.insert(position, sldId)
+        self._renumber_from(position)
+        # ---layout index lists slides in position order, rebuilt on next use---
+        self._slide_parts_by_layout_part = None
+
+    def remove(self, sldId, position):
+        """
+        Drop *sldId*, just removed from *position* in `p:sldIdLst`, provided
+        this index was current before that. A stale index is left to be
+        rebuilt. Takes time proportional to the count of slides after
+        *position*, without visiting their XML.
+        """
+        sldIdLst, parts = self._sldIdLst, self._parts
+        if len(sldIdLst) != len(parts) - 1 or not 0 <= position < len(parts):
+            return
+        slide_id, rId = sldId.id, sldId.rId
+        if self._rIds_by_id.get(slide_id) != rId:
+            return
+        if self._sldIds[position] is not sldId:
+            return
+        slide_part = parts.pop(position)
+        self._sldIds.pop(position)
+        del self._rIds_by_id[slide_id]
+        if self._ids_by_part.get(slide_part) == slide_id:
+            del self._ids_by_part[slide_part]
+        if self._positions_by_part.get(slide_part) == position:
+            del self._positions_by_part[slide_part]
+            if self._slide_parts_by_layout_part is not None:
+                for slide_parts in self._slide_parts_by_layout_part.values():
+                    if slide_part in slide_parts:
+                        slide_parts.remove(slide_part)
+                        break
+        self._renumber_from(position)
+
+    def id_for(self, slide_part):
+        """Slide id of *slide_part*, or |None| if it's not a slide here."""
+        return self._ids_by_part.get(slide_part)
+
+    def is_stale_for(self, sldIdLst):
+        """
+        True if *sldIdLst* has changed since this index was built, judged in
+        constant time from whether its first and last `p:sldId` elements are
+        still those indexed first and last.
+        """
+        if sldIdLst is not self._sldIdLst:
+            return True
+        sldIds = self._sldIds
+        if not sldIds:
+            return next(sldIdLst.iterchildren(), None) is not None
+        first, last = sldIds[0], sldIds[-1]
+        return (
+            first.getparent() is not sldIdLst
+            or first.getprevious() is not None
+            or last.getparent() is not sldIdLst
+            or last.getnext() is not None
+        )
+
+    def position_of(self, slide_part):
+        """Zero-based position of *slide_part*, or |None| if not present."""
+        return self._positions_by_part.get(slide_part)
+
+    def position_of_element(self, sld):
+        """
+        Zero-based position of the slide part having *sld* as its XML, or
+        |None| if not present. Takes time proportional to the slide count.
+        """
+        for slide_part, position in self._positions_by_part.items():
+            if getattr(slide_part, "_element", None) is sld:
+                return position
+        return None
+
+    def rId_for(self, slide_id):
+        """rId of the slide having *slide_id*, or |None| if not present."""
+        return self._rIds_by_id.get(slide_id)
+
+    def slide_parts_using(self, slide_layout_part):
+        """
+        List of the slide parts based on *slide_layout_part*, in position
+        order. Slide layouts are indexed on the first call, which takes time
+        proportional to the slide count.
+        """
+        if self._slide_parts_by_layout_part is None:
+            self._slide_parts_by_layout_part = {}
+            for slide_part in self._positions_by_part:
+                self._add_to_layout_index(slide_part)
+        return self._slide_parts_by_layout_part.get(slide_layout_part, [])
+
+    def _fits_at(self, sldId, position):
+        """
+        True if *sldId*, just added to `p:sldIdLst`, sits between the indexed
+        `p:sldId` elements before and at *position*, as it does when this
+        index was current before it was added.
+        """
+        sldIds = self._sldIds
+        if sldId.getparent() is not self._sldIdLst:
+            return False
+        if not 0 <= position <= len(sldIds):
+            return False
+        previous = sldIds[position - 1] if position else None
+        next_ = sldIds[position] if position < len(sldIds) else None
+        return sldId.getprevious() is previous and sldId.getnext() is next_
+
+    def _renumber_from(self, position):
+        """Update the position of each slide part from *position* on."""
+        positions = self._positions_by_part
+        parts = self._parts
+        # ---backward, so a part appearing twice keeps its first position---
+        for idx in range(len(parts) - 1, position - 1, -1):
+            slide_part = parts[idx]
+            if positions.get(slide_part, position) >= position:
+                positions[slide_part] = idx
+
+    def _add_to_layout_index(self, slide_part):
+        """Add *slide_part*, the last slide so far, to the layout index."""
+        if slide_part is None:
+            return
+        slide_layout_part = slide_part.part_related_by(RT.SLIDE_LAYOUT)
+        self._slide_parts_by_layout_part.setdefault(slide_layout_part, []).append(
+            slide_part
+        )
@@ -6,12 +6,15 @@ Slide and related objects.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import copy
+
 from .chart import ChartPart
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
 from ..opc.packuri import PackURI
 from ..oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
 from ..oxml.theme import CT_OfficeStyleSheet
+from ..shapes.shapetree import SlideShapes
 from ..slide import NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
 from ..util import lazyproperty
 
@@ -22,6 +25,15 @@ class BaseSlidePart(XmlPart):
     notesSlide, notesMaster, and handoutMaster.
     """
 
+    _explicit_reltypes = (
+        RT.CHART,
+        RT.IMAGE,
+        RT.MEDIA,
+        RT.OLE_OBJECT,
+        RT.PACKAGE,
+        RT.VIDEO,
+    )
+
     def get_image(self, rId):
         """
         Return an |Image| object containing the image related to this slide
@@ -155,12 +167,14 @@ class SlidePart(BaseSlidePart):
     """
 
     @classmethod
-    def new(cls, partname, package, slide_layout_part):
+    def new(cls, partname, package, slide_layout_part, sld=None):
         """
-        Return a newly-created blank slide part having *partname* and related
-        to *slide_layout_part*.
+        Return a newly-created slide part having *partname* and related to
+        *slide_layout_part*. The slide is blank unless a `p:sld` element is
+        given as *sld*.
         """
-        sld = CT_Slide.new()
+        if sld is None:
+            sld = CT_Slide.new()
         slide_part = cls(partname, CT.PML_SLIDE, sld, package)
 
         slide_part.relate_to(slide_layout_part, RT.SLIDE_LAYOUT)
@@ -259,6 +273,36 @@ class SlideLayoutPart(BaseSlidePart):
     ``ppt/slideLayouts/slideLayout[1-9][0-9]*.xml``.
     """
 
+    def __init__(self, partname, content_type, element, package=None):
+        super(SlideLayoutPart, self).__init__(
+            partname, content_type, element, package
+        )
+        # ---(signature, sp elements) of the placeholders cloned to a blank
+        # ---slide, see new_placeholder_sps()---
+        self._placeholder_prototype = None
+
+    def new_placeholder_sps(self):
+        """
+        Return a list of new `p:sp` elements, the placeholders a blank slide
+        gets from this layout, as cloned by
+        :meth:`.SlideShapes.clone_layout_placeholders`.
+
+        Placeholders are cloned to a blank slide once and copied from then
+        on, as the result depends only on the placeholders of this layout.
+        They are cloned again when a placeholder of this layout is added,
+        removed or has its type, orientation, size or idx changed.
+        """
+        signature = self._element.cSld.spTree.ph_signature
+        prototype = self._placeholder_prototype
+        if prototype is None or prototype[0] != signature:
+            spTree = CT_Slide.new().cSld.spTree
+            shapes = SlideShapes(spTree, None)
+            for placeholder in self.slide_layout.iter_cloneable_placeholders():
+                shapes.clone_placeholder(placeholder)
+            prototype = (signature, list(spTree.iter_shape_elms()))
+            self._placeholder_prototype = prototype
+        return [copy.deepcopy(sp) for sp in prototype[1]]
+
     @lazyproperty
     def slide_layout(self):
         """
@@ -280,6 +324,14 @@ class SlideMasterPart(BaseSlidePart):
     ppt/slideMasters/slideMaster[1-9][0-9]*.xml.
     """
 
+    _explicit_reltypes = BaseSlidePart._explicit_reltypes + (RT.SLIDE_LAYOUT,)
+
+    def __init__(self, partname, content_type, element, package=None):
+        super(SlideMasterPart, self).__init__(
+            partname, content_type, element, package
+        )
+        self._layout_index = None
+
     def related_slide_layout(self, rId):
         """
         Return the |SlideLayout| object of the related |SlideLayoutPart|
@@ -287,9 +339,99 @@ class SlideMasterPart(BaseSlidePart):
         """
         return self.related_parts[rId].slide_layout
 
+    def slide_layout_named(self, name):
+        """
+        Return the first |SlideLayout| of this slide master having *name*,
+        or |None| if there is none.
+
+        The layout found in the index must still have *name*, and the index
+        is rebuilt to look again when it doesn't or when none was found, so
+        layouts renamed by editing their XML are found too.
+        """
+        slide_layout_part = self._slide_layout_index.part_named(name)
+        if slide_layout_part is None or slide_layout_part.slide_layout.name != name:
+            self._layout_index = None
+            slide_layout_part = self._slide_layout_index.part_named(name)
+        if slide_layout_part is None:
+            return None
+        return slide_layout_part.slide_layout
+
+    def slide_layout_position(self, slide_layout_part):
+        """
+        Return the zero-based position of *slide_layout_part* among the
+        slide layouts of this master, or |None| if it's not one of them.
+        """
+        return self._slide_layout_index.position_of(slide_layout_part)
+
+    def slide_layout_renamed(self):
+        """
+        Discard the slide layout index after a layout of this master has
+        been renamed, which it can't detect, so it is rebuilt on next use.
+        """
+        self._layout_index = None
+
     @lazyproperty
     def slide_master(self):
         """
         The |SlideMaster| object representing this part.
         """
         return SlideMaster(self._element, self)
+
+    @property
+    def _slide_layout_index(self):
+        """
+        |_SlideLayoutIndex| of the layouts of this master, rebuilt when
+        `p:sldLayoutIdLst` has changed since it was built.
+        """
+        sldLayoutIdLst = self._element.get_or_add_sldLayoutIdLst()
+        index = self._layout_index
+        if index is None or index.is_stale_for(sldLayoutIdLst):
+            index = self._layout_index = _SlideLayoutIndex(
+                sldLayoutIdLst, self.related_parts
+            )
+        return index
+
+
+class _SlideLayoutIndex(object):
+    """
+    Lookups of the position and name of each slide layout of a slide master,
+    built in one pass over its `p:sldLayoutIdLst` element.
+
+    The index is stale when the element or the rIds in it have changed since
+    it was built, which catches layouts added, removed or reordered. A layout
+    renamed using |SlideLayout| resets the index of its master; a name lookup
+    rebuilds it when the layout found no longer has that name or none was
+    found, which catches most layouts renamed by editing the XML directly.
+    A layout given, through its XML, the name a later layout already has is
+    not detected; the later layout is still found by that name.
+    """
+
+    def __init__(self, sldLayoutIdLst, related_parts):
+        self._sldLayoutIdLst = sldLayoutIdLst
+        self._rIds = self._rIds_in(sldLayoutIdLst)
+        self._parts_by_name = {}
+        self._positions_by_part = {}
+        for position, rId in enumerate(self._rIds):
+            slide_layout_part = related_parts[rId]
+            self._positions_by_part.setdefault(slide_layout_part, position)
+            self._parts_by_name.setdefault(
+                slide_layout_part.slide_layout.name, slide_layout_part
+            )
+
+    def is_stale_for(self, sldLayoutIdLst):
+        """True if *sldLayoutIdLst* has changed since this index was built."""
+        if sldLayoutIdLst is not self._sldLayoutIdLst:
+            return True
+        return self._rIds_in(sldLayoutIdLst) != self._rIds
+
+    def part_named(self, name):
+        """First slide layout part having *name*, or |None| if there's none."""
+        return self._parts_by_name.get(name)
+
+    def position_of(self, slide_layout_part):
+        """Zero-based position of *slide_layout_part*, or |None|."""
+        return self._positions_by_part.get(slide_layout_part)
+
+    @staticmethod
+    def _rIds_in(sldLayoutIdLst):
+        return tuple(sldLayoutIdLst.xpath("./p:sldLayoutId/@r:id"))
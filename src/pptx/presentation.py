@@ -36,12 +36,43 @@ class Presentation(PartElementProxy):
         """
         return self.part.notes_master
 
-    def save(self, file):
+    @property
+    def package(self):
+        """
+        |Package| object holding the parts of this presentation. Its
+        :meth:`~.OpcPackage.stats` method reports the load cost and memory
+        estimate of each part.
+        """
+        return self.part.package
+
+    def save(self, file, optimize=False, profiler=None, collect_garbage=False):
         """
         Save this presentation to *file*, where *file* can be either a path
         to a file (a string) or a file-like object.
-        """
-        self.part.save(file)
+
+        Returns a |SaveReport| from :mod:`pptx.instrument`, whose
+        *bytes_saved* and *bytes_reclaimed* attributes report the effect of
+        the *optimize* and *collect_garbage* options, and are |None| when the
+        option is False.
+
+        When *optimize* is True, markup having no effect on the rendered
+        presentation, like attributes set to their default value and
+        repeated namespace declarations, is left out of the saved XML and
+        *bytes_saved* maps each partname to the number of bytes saved on that
+        part. The presentation in memory is not changed.
+
+        *profiler* is an optional |SaveProfiler| from :mod:`pptx.instrument`,
+        notified of the size and time taken by each part saved.
+
+        When *collect_garbage* is True, parts no longer used, like those of
+        slides removed from the presentation along with their notes and any
+        pictures and charts only they use, are discarded before saving, as
+        done by :meth:`.OpcPackage.collect_garbage`, and *bytes_reclaimed*
+        maps the partname of each part discarded to its size in bytes. These
+        are partnames from before the save renumbers the remaining slides,
+        so the saved file may hold a different slide under one of them.
+        """
+        return self.part.save(file, optimize, profiler, collect_garbage)
 
     @property
     def slide_height(self):
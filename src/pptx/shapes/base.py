@@ -39,8 +39,8 @@ class BaseShape(object):
         if not isinstance(idx, int):
             raise TypeError
 
-        top_left = [self._element.x, self._element.y]
-        w,h = self._element.cx, self._element.cy
+        x, y, w, h = self._element.get_xfrm_values("x", "y", "cx", "cy")
+        top_left = [x, y]
 
         if idx == 0:
             return tuple(top_left)
@@ -50,14 +50,15 @@ class Connector(BaseShape):
         English Metric Units (as a |Length| object).
         """
         cxnSp = self._element
-        x, cx, flipH = cxnSp.x, cxnSp.cx, cxnSp.flipH
+        x, cx, flipH = cxnSp.get_xfrm_values("x", "cx", "flipH")
         begin_x = x + cx if flipH else x
         return Emu(begin_x)
 
     @begin_x.setter
     def begin_x(self, value):
         cxnSp = self._element
-        x, cx, flipH, new_x = cxnSp.x, cxnSp.cx, cxnSp.flipH, int(value)
+        x, cx, flipH = cxnSp.get_xfrm_values("x", "cx", "flipH")
+        new_x = int(value)
 
         if flipH:
             old_x = x + cx
@@ -90,14 +91,15 @@ class Connector(BaseShape):
         English Metric Units (as a |Length| object).
         """
         cxnSp = self._element
-        y, cy, flipV = cxnSp.y, cxnSp.cy, cxnSp.flipV
+        y, cy, flipV = cxnSp.get_xfrm_values("y", "cy", "flipV")
         begin_y = y + cy if flipV else y
         return Emu(begin_y)
 
     @begin_y.setter
     def begin_y(self, value):
         cxnSp = self._element
-        y, cy, flipV, new_y = cxnSp.y, cxnSp.cy, cxnSp.flipV, int(value)
+        y, cy, flipV = cxnSp.get_xfrm_values("y", "cy", "flipV")
+        new_y = int(value)
 
         if flipV:
             old_y = y + cy
@@ -146,14 +148,15 @@ class Connector(BaseShape):
         Metric Units (as a |Length| object).
         """
         cxnSp = self._element
-        x, cx, flipH = cxnSp.x, cxnSp.cx, cxnSp.flipH
+        x, cx, flipH = cxnSp.get_xfrm_values("x", "cx", "flipH")
         end_x = x if flipH else x + cx
         return Emu(end_x)
 
     @end_x.setter
     def end_x(self, value):
         cxnSp = self._element
-        x, cx, flipH, new_x = cxnSp.x, cxnSp.cx, cxnSp.flipH, int(value)
+        x, cx, flipH = cxnSp.get_xfrm_values("x", "cx", "flipH")
+        new_x = int(value)
 
         if flipH:
             dx = abs(new_x - x)
@@ -186,14 +189,15 @@ class Connector(BaseShape):
         Metric Units (as a |Length| object).
         """
         cxnSp = self._element
-        y, cy, flipV = cxnSp.y, cxnSp.cy, cxnSp.flipV
+        y, cy, flipV = cxnSp.get_xfrm_values("y", "cy", "flipV")
         end_y = y if flipV else y + cy
         return Emu(end_y)
 
     @end_y.setter
     def end_y(self, value):
         cxnSp = self._element
-        y, cy, flipV, new_y = cxnSp.y, cxnSp.cy, cxnSp.flipV, int(value)
+        y, cy, flipV = cxnSp.get_xfrm_values("y", "cy", "flipV")
+        new_y = int(value)
 
         if flipV:
             dy = abs(new_y - y)
@@ -412,3 +412,46 @@ class TablePlaceholder(_BaseSlidePlaceholder):
         return CT_GraphicalObjectFrame.new_table_graphicFrame(
             shape_id, name, rows, cols, self.left, self.top, self.width, height
         )
+
+
+def resolve_geometry(slides):
+    """
+    Return a list having, for each slide in *slides*, a dict mapping the idx
+    of each placeholder on that slide to its effective `(left, top, width,
+    height)`, the values its properties of those names report.
+
+    The geometry of the placeholders of each slide layout, which the
+    placeholders of slides inherit, is resolved only once, however many of
+    *slides* use that layout, making this much faster than reading the
+    properties of each placeholder for a large number of slides.
+    """
+    inherited_by_layout_part = {}
+    geometries = []
+    for slide in slides:
+        slide_layout = slide.slide_layout
+        inherited = inherited_by_layout_part.get(slide_layout.part)
+        if inherited is None:
+            inherited = inherited_by_layout_part[slide_layout.part] = {}
+            for placeholder in slide_layout.placeholders:
+                inherited.setdefault(
+                    placeholder.element.ph_idx,
+                    (
+                        placeholder.left,
+                        placeholder.top,
+                        placeholder.width,
+                        placeholder.height,
+                    ),
+                )
+        geometry = {}
+        for placeholder in slide.placeholders:
+            element = placeholder.element
+            direct = (element.x, element.y, element.cx, element.cy)
+            base = (None, None, None, None)
+            if isinstance(placeholder, _InheritsDimensions):
+                base = inherited.get(element.ph_idx, base)
+            geometry[element.ph_idx] = tuple(
+                base_value if value is None else value
+                for value, base_value in zip(direct, base)
+            )
+        geometries.append(geometry)
+    return geometries
@@ -11,6 +11,7 @@ from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.oxml.ns import qn
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
+from pptx.oxml.shapes.shared import CT_Placeholder
 from pptx.oxml.simpletypes import ST_Direction
 from pptx.oxml.table import CT_Table
 from pptx.shapes.autoshape import AutoShapeType, Shape
@@ -507,18 +508,33 @@ class SlideShapes(_BaseGroupShapes):
         return self._shape_factory(movie_pic)
 
     def insert_table(self, i, table):
-        if not isinstance(table, GraphicFrame):
-            raise TypeError
-        if not table.has_table:
-            raise
-        tbl = copy.deepcopy(table._element)
-        new_id = self._next_shape_id
-        tbl._nvXxPr.cNvPr.id = new_id
-        tbl._nvXxPr.cNvPr.name = f'Table {new_id-1}'
-        self._spTree.insert(i,tbl)
+        """Insert a copy of *table* at position *i* in this shape tree.
+
+        *i* is a position in the sequence of shapes, as for `list.insert()`,
+        so 0 makes the table the bottom-most shape and a position at or past
+        the end makes it the topmost. *table* is either a graphic-frame shape
+        containing a table or an off-slide :class:`pptx.virtual.table.Table`,
+        which is materialized here. Return the newly inserted |GraphicFrame|
+        shape.
+        """
+        graphicFrame = self._new_table_graphicFrame(table)
+        shape_elms = list(self._spTree.iter_shape_elms())
+        if i < 0:
+            i = max(i + len(shape_elms), 0)
+        if i < len(shape_elms):
+            shape_elms[i].addprevious(graphicFrame)
+        else:
+            self._spTree.insert_element_before(graphicFrame, "p:extLst")
+        return self._shape_factory(graphicFrame)
 
     def append_table(self, table):
-        self.insert_table(-1, table)
+        """Append a copy of *table* as the topmost shape in this shape tree.
+
+        Accepts the same *table* objects as :meth:`insert_table`.
+        """
+        graphicFrame = self._new_table_graphicFrame(table)
+        self._spTree.insert_element_before(graphicFrame, "p:extLst")
+        return self._shape_factory(graphicFrame)
 
     def add_table(self, rows, cols, left, top, width, height):
         """
@@ -550,7 +566,14 @@ class SlideShapes(_BaseGroupShapes):
         Add placeholder shapes based on those in *slide_layout*. Z-order of
         placeholders is preserved. Latent placeholders (date, slide number,
         and footer) are not cloned.
+
+        A blank slide, like one just added, gets copies of placeholders the
+        layout part keeps ready, which is much faster than cloning each.
         """
+        if self._cached_max_shape_id is None and self._spTree.max_shape_id <= 1:
+            for sp in slide_layout.part.new_placeholder_sps():
+                self._spTree.insert_element_before(sp, "p:extLst")
+            return
         for placeholder in slide_layout.iter_cloneable_placeholders():
             self.clone_placeholder(placeholder)
 
@@ -583,6 +606,27 @@ class SlideShapes(_BaseGroupShapes):
         graphicFrame = self._spTree.add_table(_id, name, rows, cols, x, y, cx, cy)
         return graphicFrame
 
+    def _new_table_graphicFrame(self, table):
+        """Return a new `p:graphicFrame` element holding a copy of *table*.
+
+        The element is assigned the next available shape id and a matching
+        name but is not yet added to this shape tree.
+        """
+        from pptx.virtual.table import Table as VirtualTable
+
+        shape_id = self._next_shape_id
+        name = "Table %d" % (shape_id - 1)
+        if isinstance(table, VirtualTable):
+            return table.new_graphicFrame(shape_id, name)
+        if not isinstance(table, GraphicFrame):
+            raise TypeError("expected table graphic-frame, got %s" % type(table))
+        if not table.has_table:
+            raise ValueError("graphic-frame does not contain a table")
+        graphicFrame = copy.deepcopy(table._element)
+        graphicFrame._nvXxPr.cNvPr.id = shape_id
+        graphicFrame._nvXxPr.cNvPr.name = name
+        return graphicFrame
+
     def _add_video_timing(self, pic):
         """Add a `p:video` element under `p:sld/p:timing`.
 
@@ -670,6 +714,36 @@ class BasePlaceholders(_BaseShapes):
     :method:`_shape_factory` to use custom placeholder classes.
     """
 
+    def __init__(self, spTree, parent):
+        super(BasePlaceholders, self).__init__(spTree, parent)
+        # ---(shape tree child count, placeholder key generation, placeholders
+        # ---by key), see _get()---
+        self._lookup = None
+
+    def _get(self, key, default):
+        """
+        Return the first placeholder having *key*, as given by :meth:`_key`,
+        or *default* if there is none.
+
+        Placeholders are looked up in a dict, built once so placeholders on
+        slides can find the one they inherit from without iterating this
+        collection each time. The dict is rebuilt when the number of shapes
+        in the shape tree changes, when the type or idx of any placeholder
+        is assigned, or when the placeholder found is no longer in the tree
+        or no longer has *key*, so a lookup costs the same however many
+        placeholders there are.
+        """
+        lookup = self._lookup
+        if lookup is None or lookup[:2] != self._lookup_signature():
+            lookup = self._rebuild_lookup()
+        placeholder = lookup[2].get(key)
+        if placeholder is not None and (
+            placeholder.element.getparent() is not self._spTree
+            or self._key(placeholder) != key
+        ):
+            placeholder = self._rebuild_lookup()[2].get(key)
+        return default if placeholder is None else placeholder
+
     @staticmethod
     def _is_member_elm(shape_elm):
         """
@@ -677,6 +751,21 @@ class BasePlaceholders(_BaseShapes):
         """
         return shape_elm.has_ph_elm
 
+    @staticmethod
+    def _key(placeholder):
+        """Value *placeholder* is looked up by in this collection."""
+        raise NotImplementedError("must be implemented by each subclass")
+
+    def _rebuild_lookup(self):
+        by_key = {}
+        for placeholder in self:
+            by_key.setdefault(self._key(placeholder), placeholder)
+        self._lookup = self._lookup_signature() + (by_key,)
+        return self._lookup
+
+    def _lookup_signature(self):
+        return len(self._spTree), CT_Placeholder.key_generation()
+
 
 class LayoutPlaceholders(BasePlaceholders):
     """
@@ -689,10 +778,11 @@ class LayoutPlaceholders(BasePlaceholders):
         Return the first placeholder shape with matching *idx* value, or
         *default* if not found.
         """
-        for placeholder in self:
-            if placeholder.element.ph_idx == idx:
-                return placeholder
-        return default
+        return self._get(idx, default)
+
+    @staticmethod
+    def _key(placeholder):
+        return placeholder.element.ph_idx
 
     def _shape_factory(self, shape_elm):
         """
@@ -714,10 +804,11 @@ class MasterPlaceholders(BasePlaceholders):
         or *default* if no such placeholder shape is present in the
         collection.
         """
-        for placeholder in self:
-            if placeholder.ph_type == ph_type:
-                return placeholder
-        return default
+        return self._get(ph_type, default)
+
+    @staticmethod
+    def _key(placeholder):
+        return placeholder.ph_type
 
     def _shape_factory(self, shape_elm):
         """
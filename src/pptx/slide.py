@@ -298,9 +298,27 @@ class Slides(ParentedElementProxy):
         rId, slide = self.part.add_slide(slide_layout)
 
         slide.shapes.clone_layout_placeholders(slide_layout)
-        self._sldIdLst.add_sldId(rId)
+        self.part.slide_appended(self._sldIdLst.add_sldId(rId))
         return slide
 
+    def move(self, src_indices, dst):
+        """
+        Move the slides at positions *src_indices* so they come one after
+        another, in that order, starting at position *dst* of the resulting
+        sequence. The other slides keep their relative order. For example,
+        `slides.move([4, 5], 0)` moves the fifth and sixth slides to the
+        front.
+        """
+        slide_count = len(self)
+        src_indices = [self._normalized_index(idx) for idx in src_indices]
+        moved = set(src_indices)
+        if len(moved) != len(src_indices):
+            raise ValueError("slide index repeated in %r" % (src_indices,))
+        if not 0 <= dst <= slide_count - len(src_indices):
+            raise IndexError("destination index out of range")
+        remaining = [idx for idx in range(slide_count) if idx not in moved]
+        self.reorder(remaining[:dst] + src_indices + remaining[dst:])
+
     def new_slide(self, slide_layout):
         """
         Return a new slide that inherits layout from *slide_layout*.
@@ -315,16 +333,17 @@ class Slides(ParentedElementProxy):
     def insert_slide(self, idx, slide):
         # find matching slide layout by name or set default as 0
         prsnt = self.parent
-        slide_layout = prsnt.slide_layouts[0]
-        for sl in prsnt.slide_layouts:
-            if slide.slide_layout.name == sl.name:
-                slide_layout = sl
+        slide_layouts = prsnt.slide_layouts
+        slide_layout = slide_layouts.get_by_name(
+            slide.slide_layout.name, slide_layouts[0]
+        )
 
         rId, new_slide = self.part.add_slide(slide_layout)
         # slide.shapes.clone_layout_placeholders(slide_layout)
 
         e = self._sldIdLst.add_sldId(rId)
         self._sldIdLst.insert(idx,e) # this automakly removes old
+        self.part.slide_inserted(e)
 
         new_slide._part._element = slide._part._element
         new_slide._element = slide._element
@@ -335,26 +354,36 @@ class Slides(ParentedElementProxy):
     def remove_slide(self, idx_or_slide):
         if isinstance(idx_or_slide, int):
             idx = idx_or_slide
-            del self._sldIdLst[idx]
         elif isinstance(idx_or_slide, Slide):
-            slide = idx_or_slide
             try:
-                sId = slide.slide_id
-                for i, sldId in enumerate(self._sldIdLst):
-                    if sldId.id == sId:
-                        del self._sldIdLst[i]
-                        break
-            except:
-                for id,s in self.part.package.presentation_part.related_parts.items():
-                    if isinstance(s, type(slide.part)):
-                        if s._element == slide._element:
-                            for i,sldId in enumerate(self._sldIdLst):
-                                if sldId.id == s.slide_id:
-                                    del self._sldIdLst[i]
-                                    break
+                idx = self.part.slide_position(idx_or_slide.part)
+            except ValueError:
+                return
         else:
             raise TypeError
-
+        sldIdLst = self._sldIdLst
+        if idx < 0:
+            idx += len(sldIdLst)
+        sldId = sldIdLst[idx]
+        sldIdLst.remove(sldId)
+        self.part.slide_removed(sldId, idx)
+
+    def reorder(self, permutation):
+        """
+        Rearrange the slides so the one now at position `permutation[i]`
+        comes i-th; `slides.reorder(range(len(slides))[::-1])` reverses them.
+        Raises |ValueError| unless *permutation* contains each position
+        exactly once.
+
+        Slides are rearranged in one operation and slide parts are renamed to
+        match their new order when the presentation is saved, so reordering
+        even a large presentation is fast.
+        """
+        permutation = list(permutation)
+        if sorted(permutation) != list(range(len(self))):
+            raise ValueError("not a permutation of the slide positions")
+        self._sldIdLst.reorder(permutation)
+        self.part.slides_reordered()
 
     def get(self, slide_id, default=None):
         """
@@ -366,15 +395,69 @@ class Slides(ParentedElementProxy):
             return default
         return slide
 
+    def import_from(self, src_prs, indices=None):
+        """
+        Return a list of new slides, copies of the slides at *indices* in
+        |Presentation| *src_prs*, added in that order at the end of this
+        collection. All slides of *src_prs* are copied when *indices* is
+        |None|.
+
+        Pictures, charts, notes and other content of each slide are copied
+        along with it. Images and media already in this presentation are
+        reused, as are slide layouts and masters matching those of the copied
+        slides; others are copied. Importing many slides in one call is much
+        faster than one at a time.
+        """
+        src_slides = src_prs.slides
+        if indices is None:
+            indices = range(len(src_slides))
+        slide_parts = [src_slides[idx].part for idx in indices]
+        return self._append_imported(self.part.import_slides(slide_parts))
+
+    def import_shards(self, shards):
+        """
+        Return a list of new slides, those serialized in each |SlideShard|
+        object in iterable *shards*, added in that order at the end of this
+        collection.
+
+        Each shard must be made from slides of a presentation loaded from the
+        same template as this one, typically in a worker process as by
+        :func:`pptx.build_sharded`. Images and media are shared between the
+        slides of all shards. A hyperlink to a slide of another shard is
+        removed.
+        """
+        return self._append_imported(self.part.import_shards(shards))
+
     def index(self, slide):
         """
         Map *slide* to an integer representing its zero-based position in
         this slide collection. Raises |ValueError| on *slide* not present.
         """
-        for idx, this_slide in enumerate(self):
-            if this_slide == slide:
-                return idx
-        raise ValueError("%s is not in slide collection" % slide)
+        try:
+            return self.part.slide_position(slide.part)
+        except ValueError:
+            raise ValueError("%s is not in slide collection" % slide)
+
+    def _append_imported(self, imported):
+        """
+        Return a list of the slides in *imported*, a list of `(rId, slide)`
+        pairs like :meth:`.PresentationPart.import_slides` returns, after
+        adding them in that order at the end of this collection.
+        """
+        sldIds = self._sldIdLst.add_sldIds([rId for rId, _ in imported])
+        for sldId in sldIds:
+            self.part.slide_appended(sldId)
+        return [slide for _, slide in imported]
+
+    def _normalized_index(self, idx):
+        """
+        Return the non-negative position of the slide at *idx*, which can be
+        negative to count from the end. Raises |IndexError| when out of range.
+        """
+        slide_count = len(self)
+        if not -slide_count <= idx < slide_count:
+            raise IndexError("slide index out of range")
+        return idx % slide_count
 
 
 class SlideLayout(_BaseSlide):
@@ -423,12 +506,15 @@ class SlideLayout(_BaseSlide):
         """
         return self.part.slide_master
 
+    @_BaseSlide.name.setter
+    def name(self, value):
+        _BaseSlide.name.fset(self, value)
+        self.slide_master.part.slide_layout_renamed()
+
     @property
     def used_by_slides(self):
         """Tuple of slide objects based on this slide layout."""
-        # ---getting Slides collection requires going around the horn a bit---
-        slides = self.part.package.presentation_part.presentation.slides
-        return tuple(s for s in slides if s.slide_layout == self)
+        return self.part.package.presentation_part.slides_using(self.part)
 
 
 class SlideLayouts(ParentedElementProxy):
@@ -469,20 +555,20 @@ class SlideLayouts(ParentedElementProxy):
 
     def get_by_name(self, name, default=None):
         """Return SlideLayout object having *name* or *default* if not found."""
-        for slide_layout in self:
-            if slide_layout.name == name:
-                return slide_layout
-        return default
+        slide_layout = self.part.slide_layout_named(name)
+        if slide_layout is None:
+            return default
+        return slide_layout
 
     def index(self, slide_layout):
         """Return zero-based index of *slide_layout* in this collection.
 
         Raises ValueError if *slide_layout* is not present in this collection.
         """
-        for idx, this_layout in enumerate(self):
-            if slide_layout == this_layout:
-                return idx
-        raise ValueError("layout not in this SlideLayouts collection")
+        idx = self.part.slide_layout_position(slide_layout.part)
+        if idx is None:
+            raise ValueError("layout not in this SlideLayouts collection")
+        return idx
 
     def remove(self, slide_layout):
         """Remove *slide_layout* from the collection.
@@ -5,16 +5,29 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from pptx.compat import is_integer
+from pptx.dml.color import RGBColor, rgb_hex
 from pptx.dml.fill import FillFormat
-from pptx.oxml.table import TcRange,CT_TableCell
+from pptx.oxml.table import (
+    TcFormatStamp,
+    TcRange,
+    TcSpanMap,
+    CT_TableCell,
+    CT_TableCellProperties,
+)
 from pptx.oxml.dml.line import CT_TableCellEdgeLeft, CT_TableCellEdgeRight, CT_TableCellEdgeTop, CT_TableCellEdgeBottom
 from pptx.oxml.xmlchemy import serialize_for_reading
 from pptx.shapes import Subshape
+from pptx.text.fonts import FontFiles
+from pptx.text.layout import FontMetrics
 from pptx.text.text import TextFrame
 from pptx.util import lazyproperty
-from pptx.util import Length,Emu
+from pptx.util import Length, Emu, Pt
 from pptx.dml.line import LineFormat
 import copy
+import csv
+import io
+import itertools
+import re
 
 class Table(object):
     """A DrawingML table object.
@@ -27,6 +40,7 @@ class Table(object):
         super(Table, self).__init__()
         self._tbl = tbl
         self._graphic_frame = graphic_frame
+        self._spans = None
 
     def cell(self, row_idx, col_idx):
         """Return cell at *row_idx*, *col_idx*.
@@ -88,12 +102,14 @@ class Table(object):
         Each grid cell is generated in left-to-right, top-to-bottom order.
         """
         return (_Cell(tc, self) for tc in self._tbl.iter_tcs())
+
     def iter_real_cells(self):
+        """Generate _Cell object for each grid cell not spanned by a merged cell.
+
+        Merge-origin and unmerged cells are generated in left-to-right,
+        top-to-bottom order.
         """
-        Return cells with no merged
-        :return:
-        """
-        return (_Cell(tc, self) for tc in self._tbl.iter_tcs() if not tc.is_spanned)
+        return (_Cell(tc, self) for tc in self._span_map.iter_real_tcs())
 
     @property
     def last_col(self):
@@ -126,7 +142,7 @@ class Table(object):
         Called by a row when its height changes, triggering the graphic frame
         to recalculate its total height (as the sum of the row heights).
         """
-        new_table_height = sum([row.height for row in self.rows])
+        new_table_height = sum([tr.h for tr in self._tbl.tr_lst])
         self._graphic_frame.height = new_table_height
 
     def notify_width_changed(self):
@@ -135,9 +151,17 @@ class Table(object):
         frame to recalculate its total width (as the sum of the column
         widths).
         """
-        new_table_width = sum([col.width for col in self.columns])
+        new_table_width = sum([gridCol.w for gridCol in self._tbl.tblGrid.gridCol_lst])
         self._graphic_frame.width = new_table_width
 
+    def origin_cell(self, row_idx, col_idx):
+        """Return |_Cell| of the merged cell covering *row_idx*, *col_idx*.
+
+        This is the merge-origin cell when the grid cell at that position is
+        spanned, otherwise the cell at that position itself.
+        """
+        return _Cell(self._span_map.origin_tc(row_idx, col_idx), self)
+
     @property
     def part(self):
         """
@@ -180,6 +204,7 @@ class Table(object):
         elif not isinstance(height, Length):
             raise TypeError('Must feed one of pptx.util.Length types')
 
+        TcSpanMap.table_changed(self._tbl)
         trs = []
         for i in range(n):
             new_tr = self._tbl.add_tr(height)
@@ -191,6 +216,79 @@ class Table(object):
         else:
             return trs
 
+    def extend_rows(self, rows, chunk_size=1000, height=None, max_rows=None,
+                    progress=None):
+        """
+        Append a row for each sequence of cell values in iterable *rows*.
+
+        Cell values are converted with `str()`; |None| leaves a cell empty. A
+        row may have fewer values than the table has columns but not more.
+        *rows* is consumed *chunk_size* rows at a time and each chunk is
+        appended in one pass, with its text set as the rows are built. At most
+        *max_rows* rows are added when it is not |None|. *progress*, when
+        provided, is called with the running count of rows added after each
+        chunk. *height* defaults to the height of the last row and must be
+        given when the table has no rows.
+
+        Returns the number of rows added.
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError('chunk_size must be a positive int')
+        if height is None:
+            tr_lst = self._tbl.tr_lst
+            if not tr_lst:
+                raise ValueError('table has no rows, height must be given')
+            height = tr_lst[-1].h
+        elif not isinstance(height, Length):
+            raise TypeError('Must feed one of pptx.util.Length types')
+
+        TcSpanMap.table_changed(self._tbl)
+        rows = iter(rows) if max_rows is None else itertools.islice(rows, max_rows)
+        added = 0
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                break
+            self._tbl.add_trs(chunk, height)
+            added += len(chunk)
+            if progress is not None:
+                progress(added)
+
+        if added and self._graphic_frame is not None:
+            self.notify_height_changed()
+        return added
+
+    def extend_rows_from_arrow(self, data, **kwargs):
+        """
+        Append a row for each record in Arrow *data*.
+
+        *data* is a `pyarrow.Table`, a `pyarrow.RecordBatch` or an iterable of
+        record batches such as a `RecordBatchReader`. Batches are converted to
+        Python values one at a time. Keyword arguments are those of
+        :meth:`extend_rows`.
+        """
+        return self.extend_rows(_iter_arrow_rows(data), **kwargs)
+
+    def extend_rows_from_csv(self, csv_file, skip_header=False, encoding='utf-8',
+                             dialect='excel', **kwargs):
+        """
+        Append a row for each record in *csv_file*.
+
+        *csv_file* is a path or a text-mode file-like object. The first record
+        is dropped when *skip_header* is True. *encoding* applies when a path
+        is given and *dialect* is passed to `csv.reader`. Other keyword
+        arguments are those of :meth:`extend_rows`.
+        """
+        if not hasattr(csv_file, 'read'):
+            with io.open(csv_file, newline='', encoding=encoding) as f:
+                return self.extend_rows_from_csv(
+                    f, skip_header=skip_header, dialect=dialect, **kwargs
+                )
+        reader = csv.reader(csv_file, dialect)
+        if skip_header:
+            next(reader, None)
+        return self.extend_rows(reader, **kwargs)
+
     def add_column(self, n=1, width=None):
         """
         Adds number of columns into the table
@@ -205,6 +303,7 @@ class Table(object):
         elif not isinstance(width, Length):
             raise TypeError('Must feed one of pptx.util.Length types')
 
+        TcSpanMap.table_changed(self._tbl)
         for i in range(n):
             self._tbl.tblGrid.add_gridCol(width)
             for row in self._tbl.tr_lst:
@@ -218,6 +317,7 @@ class Table(object):
         """
         if not isinstance(idx, int):
             raise TypeError('Must feet <int>')
+        TcSpanMap.table_changed(self._tbl)
         self._tbl.tr_lst[idx].delete()
 
     def delete_column(self, idx=-1):
@@ -228,6 +328,7 @@ class Table(object):
         """
         if not isinstance(idx, int):
             raise TypeError('Must feet <int>')
+        TcSpanMap.table_changed(self._tbl)
         for row in self._tbl.tr_lst:
             row.tc_lst[idx].delete()
         self._tbl.tblGrid.gridCol_lst[idx].delete()
@@ -260,6 +361,7 @@ class Table(object):
         else:
             raise TypeError('param *pos* should be either <str> or <int>')
 
+        TcSpanMap.table_changed(self._tbl)
         that_table = copy.deepcopy(to_join)
         r_diff = len(self.rows) - len(to_join.rows)
         c_diff = len(self.columns) - len(to_join.columns)
@@ -326,25 +428,186 @@ class Table(object):
             ss = to_join._graphic_frame._parent
             ss._spTree.remove(to_join._graphic_frame._element)
 
+    def style_range(self, rows=None, cols=None, fill=None, border=None, font=None,
+                    border_mode='all'):
+        """
+        Apply formatting to the block of cells selected by *rows* and *cols*.
+
+        *rows* and *cols* are each an int index, a slice or range, or |None| to
+        select all of them. *fill* is an |RGBColor| (or hex str) cell background.
+        *border* is an |RGBColor| (or hex str) line color, or a `(color, width)`
+        pair; width defaults to 1 pt. *border_mode* selects the edges that get
+        a line: 'all' for every cell edge, 'outer' for the outline of the range
+        only and 'inner' for the grid lines between cells only. *font* is a dict
+        with any of `size`, `bold`, `italic` and `color` applied to every text
+        run in the range.
+
+        Each distinct cell-property fragment is built once and copied onto the
+        selected cells.
+        """
+        if border_mode not in ('all', 'outer', 'inner'):
+            raise ValueError("border_mode must be one of 'all', 'outer' or 'inner'")
+        tr_lst = self._tbl.tr_lst
+        row_idxs = _idx_range(rows, len(tr_lst))
+        col_idxs = _idx_range(cols, len(self._tbl.tblGrid.gridCol_lst))
+        if not row_idxs or not col_idxs:
+            return
+        stamp = _format_stamp(fill, border, font)
+
+        first_row, last_row = row_idxs[0], row_idxs[-1]
+        first_col, last_col = col_idxs[0], col_idxs[-1]
+        outer = border_mode == 'outer'
+        for row_idx in row_idxs:
+            tc_lst = tr_lst[row_idx].tc_lst
+            top, bottom = row_idx == first_row, row_idx == last_row
+            for col_idx in col_idxs:
+                left, right = col_idx == first_col, col_idx == last_col
+                if border_mode == 'all':
+                    edges = (True, True, True, True)
+                else:
+                    edges = tuple(
+                        is_outer is outer for is_outer in (left, right, top, bottom)
+                    )
+                stamp.apply(tc_lst[col_idx], edges)
+
+    def autofit(self, rows=True, cols=True, font_family='Calibri', font_size=18,
+                bold=False, italic=False, font_file=None, max_col_width=None):
+        """
+        Size columns and rows of this table to the text in their cells.
+
+        Text is measured at whole-number point size *font_size* in the font
+        found for *font_family*, *bold* and *italic*, the same lookup
+        :meth:`.TextFrame.fit_text` uses, or in *font_file* when provided.
+
+        When *cols* is True, each column becomes as wide as its widest
+        unwrapped paragraph plus the cell's left and right margins, capped at
+        *max_col_width* when provided. Columns with no text keep their width.
+        When *rows* is True, each row becomes as tall as the cell needing the
+        most wrapped lines at the new column widths, plus its top and bottom
+        margins. A merged cell wraps within the columns it spans; a cell
+        spanning rows does not size any row.
+
+        All sizes are computed before any is assigned.
+        """
+        if font_file is None:
+            font_file = FontFiles.find(font_family, bold, italic)
+        metrics = FontMetrics.for_font(font_file, font_size)
+        gridCol_lst = self._tbl.tblGrid.gridCol_lst
+        tr_lst = self._tbl.tr_lst
+
+        spans = self._span_map
+        cells = []
+        for tc in spans.iter_real_tcs():
+            row_idx, col_idx = spans.position(tc)
+            cells.append((row_idx, col_idx, tc, tc.text))
+
+        widths = [gridCol.w for gridCol in gridCol_lst]
+        if cols:
+            fitted = [None] * len(widths)
+            for _, col_idx, tc, text in cells:
+                if tc.gridSpan > 1 or not text:
+                    continue
+                width = tc.marL + tc.marR + max(
+                    metrics.text_width(line) for line in re.split('\n|\v', text)
+                )
+                if max_col_width is not None:
+                    width = min(width, max_col_width)
+                fitted[col_idx] = max(fitted[col_idx] or 0, width)
+            widths = [w if f is None else Emu(f) for w, f in zip(widths, fitted)]
+
+        heights = [tr.h for tr in tr_lst]
+        if rows:
+            line_height = metrics.line_height
+            fitted = [None] * len(heights)
+            for row_idx, col_idx, tc, text in cells:
+                if tc.rowSpan > 1:
+                    continue
+                wrap_width = sum(widths[col_idx:col_idx + tc.gridSpan]) - (
+                    tc.marL + tc.marR
+                )
+                height = (
+                    metrics.line_count(text, wrap_width) * line_height
+                    + tc.marT + tc.marB
+                )
+                fitted[row_idx] = max(fitted[row_idx] or 0, height)
+            heights = [h if f is None else Emu(f) for h, f in zip(heights, fitted)]
+
+        for gridCol, width in zip(gridCol_lst, widths):
+            gridCol.w = width
+        for tr, height in zip(tr_lst, heights):
+            tr.h = height
+
+        if self._graphic_frame is not None:
+            self.notify_width_changed()
+            self.notify_height_changed()
+
     def cell_idx(self, cell):
         if not isinstance(cell, _Cell):
             raise
 
-        tc = cell._tc
-        tr = tc.getparent()
-
-        for i, c in enumerate(tr.tc_lst):
-            if c == tc:
-                col_idx = i
-                break
-
-        row_idx = None
-        for i, r in enumerate(self._tbl.tr_lst):
-            if r == tr:
-                row_idx = i
-                break
+        return self._span_map.position(cell._tc)
 
-        return row_idx, col_idx
+    @property
+    def _span_map(self):
+        """|TcSpanMap| of this table, rebuilt when its rows, cells or merges change."""
+        spans = self._spans
+        if spans is None or spans.is_stale:
+            spans = self._spans = TcSpanMap(self._tbl)
+        return spans
+
+
+def _format_stamp(fill, border, font):
+    """Return a |TcFormatStamp| for the `Table.style_range()` arguments."""
+    ln = None
+    if border is not None:
+        # ---an RGBColor is a 3-tuple, so a 2-tuple is a (color, width) pair---
+        is_pair = isinstance(border, tuple) and len(border) == 2
+        color, width = border if is_pair else (border, Pt(1))
+        ln = (width, rgb_hex(color))
+    rPr_attrs, rPr_fill = {}, None
+    if font:
+        unknown = set(font) - {'size', 'bold', 'italic', 'color'}
+        if unknown:
+            raise ValueError('unsupported font property %s' % sorted(unknown)[0])
+        if font.get('size') is not None:
+            rPr_attrs['sz'] = str(Length(font['size']).centipoints)
+        for prop, attr in (('bold', 'b'), ('italic', 'i')):
+            if font.get(prop) is not None:
+                rPr_attrs[attr] = '1' if font[prop] else '0'
+        if font.get('color') is not None:
+            rPr_fill = rgb_hex(font['color'])
+    fill = None if fill is None else rgb_hex(fill)
+    return TcFormatStamp(fill, ln, rPr_attrs, rPr_fill)
+
+
+def _iter_arrow_rows(data):
+    """Generate a tuple of Python values for each record in Arrow *data*."""
+    if hasattr(data, 'to_batches'):
+        batches = data.to_batches()
+    elif hasattr(data, 'num_rows'):
+        batches = (data,)
+    else:
+        batches = data
+    for batch in batches:
+        columns = [column.to_pylist() for column in batch.columns]
+        for row in zip(*columns):
+            yield row
+
+
+def _idx_range(selector, count):
+    """Return range of indexes into a sequence of *count* picked by *selector*."""
+    if selector is None:
+        return range(count)
+    if isinstance(selector, slice):
+        return range(*selector.indices(count))
+    if isinstance(selector, range):
+        return selector
+    if isinstance(selector, int):
+        idx = selector + count if selector < 0 else selector
+        if not 0 <= idx < count:
+            raise IndexError('index [%d] out of range' % selector)
+        return range(idx, idx + 1)
+    raise TypeError('expected int, slice, range or None, got %s' % type(selector))
 
 
 class _CellEdge:
@@ -353,46 +616,51 @@ class _CellEdge:
 
     @property
     def left(self):
-        if self._tc.tcPr.lnL is None:
-            self._add_default_edge('L')
-        return _Edge(self._tc.tcPr, self._tc.get_or_add_lnL())
+        return self._edge('L')
+
     @property
     def right(self):
-        if self._tc.tcPr.lnR is None:
-            self._add_default_edge('R')
-        return _Edge(self._tc.tcPr, self._tc.get_or_add_lnR())
+        return self._edge('R')
+
     @property
     def top(self):
-        if self._tc.tcPr.lnT is None:
-            self._add_default_edge('T')
-        return _Edge(self._tc.tcPr, self._tc.get_or_add_lnT())
+        return self._edge('T')
+
     @property
     def bottom(self):
-        if self._tc.tcPr.lnB is None:
-            self._add_default_edge('B')
-        return _Edge(self._tc.tcPr, self._tc.tcPr.get_or_add_lnB())
+        return self._edge('B')
+
+    def _edge(self, pos):
+        """Return |_Edge| for the `a:ln{pos}` line, adding a default one if absent."""
+        tcPr = self._tc.get_or_add_tcPr()
+        lnx = getattr(tcPr, 'ln%s' % pos)
+        if lnx is None:
+            lnx = self._add_default_edge(pos)
+        return _Edge(tcPr, lnx)
 
     def _add_default_edge(self, pos):
-        ln = eval(f"self._tc.tcPr._add_ln{pos}(w=12700, cap='flat', cmpd='sng', algn='ctr')")
-        sf = ln._add_solidFill()
-        srgb = sf._add_srgbClr(val='FFFFFF')
-        srgb._add_alpha(val=1.0)
-        ln._add_round()
-        ln._add_prstDash(val=1)
-        ln._add_headEnd(type='none', w='med', len='med')
-        ln._add_tailEnd(type='none', w='med', len='med')
-        return ln
-
-    def solid(self, r,g,b,a):
-        pass
+        tcPr = self._tc.get_or_add_tcPr()
+        ln = CT_TableCellProperties.new_ln(pos, 12700, 'FFFFFF', alpha=1.0)
+        return getattr(tcPr, '_insert_ln%s' % pos)(ln)
+
+    def solid(self, r, g, b, a=1.0):
+        """Set all four edges of this cell to a solid line of the given color."""
+        for edge in (self.left, self.right, self.top, self.bottom):
+            edge.solid(r, g, b, a)
 
 class _Edge:
     def __init__(self, tcPr, lnx):
         self._tcPr = tcPr
         self._lnx = lnx
 
-    def solid(self, r,g,b,a=1.0):
-        pass
+    def solid(self, r, g, b, a=1.0):
+        """Set this edge to a solid line of RGB color (*r*, *g*, *b*).
+
+        *a* is the alpha (opacity) value, between 0.0 and 1.0.
+        """
+        srgbClr = self._lnx.get_or_change_to_solidFill().get_or_change_to_srgbClr()
+        srgbClr.val = str(RGBColor(r, g, b))
+        srgbClr.get_or_add_alpha().val = a
 
 
 
@@ -538,7 +806,11 @@ class _Cell(Subshape):
         cells anywhere within its extents or if *other_cell* is not in the
         same table as *self*.
         """
-        tc_range = TcRange(self._tc, other_cell._tc)
+        spans = self._table_span_map
+        if spans is None or other_cell._table_span_map is not spans:
+            tc_range = TcRange(self._tc, other_cell._tc)
+        else:
+            tc_range = spans.range(self._tc, other_cell._tc)
 
         if not tc_range.in_same_table:
             raise ValueError("other_cell from different table")
@@ -558,6 +830,9 @@ class _Cell(Subshape):
         for tc in tc_range.iter_except_top_row_tcs():
             tc.vMerge = True
 
+        if spans is not None:
+            spans.refresh(tc_range)
+
     @property
     def span_height(self):
         """int count of rows spanned by this cell.
@@ -597,12 +872,16 @@ class _Cell(Subshape):
                 "not a merge-origin cell; only a merge-origin cell can be sp" "lit"
             )
 
-        tc_range = TcRange.from_merge_origin(self._tc)
+        spans = self._table_span_map
+        tc_range = TcRange.from_merge_origin(self._tc, spans)
 
         for tc in tc_range.iter_tcs():
             tc.rowSpan = tc.gridSpan = 1
             tc.hMerge = tc.vMerge = False
 
+        if spans is not None:
+            spans.refresh(tc_range)
+
     @property
     def text(self):
         """Unicode (str in Python 3) representation of cell contents.
@@ -655,6 +934,20 @@ class _Cell(Subshape):
     def vertical_anchor(self, mso_anchor_idx):
         self._tc.anchor = mso_anchor_idx
 
+    @property
+    def _table_span_map(self):
+        """|TcSpanMap| of the table containing this cell, |None| if there is none.
+
+        The table is found through the parents of this cell, so a cell reached
+        through `rows` or `columns` shares the span map of its table.
+        """
+        parent = self._parent
+        while isinstance(parent, Subshape):
+            parent = parent._parent
+        if not isinstance(parent, Table):
+            return None
+        return parent._span_map
+
     @staticmethod
     def _validate_margin_value(margin_value):
         """
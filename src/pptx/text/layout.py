@@ -6,6 +6,8 @@ Objects related to layout of rendered text, such as TextFitter.
 
 from __future__ import absolute_import, print_function
 
+import re
+
 from PIL import ImageFont
 
 
@@ -114,6 +116,94 @@ class TextFitter(tuple):
         return lines
 
 
+class FontMetrics(object):
+    """
+    Glyph advance widths and line height of one font at one point size.
+
+    Widths are measured once per character and cached, so measuring a string
+    costs a dict lookup per character rather than a rendering pass. Kerning
+    is not applied, which slightly overestimates the width of some text.
+    Instances are shared; use :meth:`for_font` to obtain one.
+    """
+
+    _instances = {}
+
+    def __init__(self, font_file, point_size):
+        super(FontMetrics, self).__init__()
+        self._font = _Fonts.font(font_file, point_size)
+        self._widths = {}
+
+    @classmethod
+    def for_font(cls, font_file, point_size):
+        """
+        Return the |FontMetrics| instance for *point_size* in the font
+        defined in *font_file*.
+        """
+        key = (font_file, point_size)
+        if key not in cls._instances:
+            cls._instances[key] = cls(font_file, point_size)
+        return cls._instances[key]
+
+    @property
+    def line_height(self):
+        """
+        Height in EMU of a single line of text, from font ascent to descent.
+        """
+        ascent, descent = self._font.getmetrics()
+        return _px_to_emu(ascent + descent)
+
+    def line_count(self, text, width):
+        """
+        Return the number of lines *text* occupies when word-wrapped within
+        *width* EMU. A line-feed or vertical-tab character starts a new line.
+        A word wider than *width* is broken across lines.
+        """
+        width = max(width, 1)
+        return sum(
+            self._wrapped_line_count(line, width) for line in re.split("\n|\v", text)
+        )
+
+    def text_width(self, text):
+        """
+        Width in EMU of *text* rendered on a single line.
+        """
+        widths = self._widths
+        width = 0
+        for char in text:
+            if char not in widths:
+                widths[char] = self._glyph_width(char)
+            width += widths[char]
+        return width
+
+    def _glyph_width(self, char):
+        """
+        Advance width in EMU of single-character str *char*.
+        """
+        font = self._font
+        if hasattr(font, "getlength"):
+            return _px_to_emu(font.getlength(char))
+        return _px_to_emu(font.getsize(char)[0])
+
+    def _wrapped_line_count(self, line, width):
+        """
+        Return the number of lines *line*, which contains no line breaks,
+        occupies when word-wrapped within *width* EMU.
+        """
+        space = self.text_width(" ")
+        count, x = 1, 0
+        for word in line.split():
+            word_width = self.text_width(word)
+            if x and x + space + word_width <= width:
+                x += space + word_width
+                continue
+            if x:
+                count += 1
+            overflow_lines = -(-word_width // width) - 1 if word_width else 0
+            count += overflow_lines
+            x = word_width - overflow_lines * width
+        return count
+
+
 class _BinarySearchTree(object):
     """
     A node in a binary search tree. Uniform for root, subtree root, and leaf
@@ -319,3 +409,11 @@ def _rendered_size(text, point_size, font_file):
     emu_height = int(px_height / px_per_inch * emu_per_inch)
 
     return emu_width, emu_height
+
+
+def _px_to_emu(px):
+    """
+    Return int EMU value of *px* font-unit pixels, which are points at the
+    72 dpi resolution fonts are loaded at.
+    """
+    return int(px / 72.0 * 914400)
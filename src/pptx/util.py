@@ -100,7 +100,7 @@ class Emu(Length):
     """
 
     def __new__(cls, emu):
-        return Length.__new__(cls, int(emu))
+        return int.__new__(cls, emu)
 
 
 class Mm(Length):
@@ -1,2 +1,2 @@
-from .slide import Slide
+from .slide import Slide, append_slides
 from .table import Table
@@ -1,37 +1,117 @@
-from ..parts.slide import SlidePart
-from ..oxml.slide import CT_Slide
-from ..opc.packuri import PackURI
-from ..opc.constants import RELATIONSHIP_TYPE as RT
-from .. import Presentation
+# encoding: utf-8
+
+"""Slides built apart from any presentation.
+
+A virtual |Slide| belongs to a private presentation made from the default
+template and is copied into a real presentation by :meth:`Slide.append_to`,
+or many at once by :func:`append_slides`. Each one starts as a copy of
+a ready-made skeleton for its layout, a `p:sld` element already holding the
+placeholders of that layout, so creating one costs little more than copying
+that element. Creating and filling virtual slides doesn't touch the
+presentations they are added to, so it can be done on worker threads, with
+the slides added to the presentation in bulk afterward.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
 import copy
+import threading
+
+from pptx.api import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.oxml.slide import CT_Slide
+from pptx.parts.slide import SlidePart
+
+
+class Slide(object):
+    """Slide built apart from any presentation.
+
+    The slide uses the layout at *slide_layout_idx* in the default template.
+    Attributes of |pptx.slide.Slide|, like `shapes` and `notes_slide`, are
+    available directly on this object.
+    """
 
-class Slide:
     _false_package = Presentation()
 
-    def __init__(self, slide_layout_idx = 0):
-        self._slide = self._false_package.slides.new_slide(self._false_package.slide_layouts[slide_layout_idx])
+    # ---one p:sld element per layout of the private presentation, each having
+    # ---the placeholders a new slide gets from that layout---
+    _skeletons = None
+    _skeletons_lock = threading.Lock()
+
+    def __init__(self, slide_layout_idx=0):
+        prs = self._false_package
+        slide_layout = prs.slide_layouts[slide_layout_idx]
+        slide_part = SlidePart.new(
+            PackURI("/pptx/slides/temp_slide"),
+            prs.part.package,
+            slide_layout.part,
+            self._new_sld(slide_layout_idx),
+        )
+        self._slide = slide_part.slide
+
+    def __getattr__(self, item):
+        """Delegate attributes not found on this object to the wrapped slide."""
+        if item == "_slide":
+            raise AttributeError(item)
+        return getattr(self._slide, item)
 
     def append_to(self, prsnt):
         """
-        Adds this slide to a Presentation.
-        :param prsnt:
-        :return:
+        Return a new slide, a copy of this one added at the end of the slides
+        of |Presentation| *prsnt*, as by :func:`append_slides`. Use that
+        function to add many slides, which is much faster than one at a time.
         """
-        # find matching slide layout by name or set default as 0
-        slide_layout = prsnt.slide_layouts[0]
-        for sl in prsnt.slide_layouts:
-            if self._slide.slide_layout.name == sl.name:
-                slide_layout = sl
+        return append_slides(prsnt, [self])[0]
 
-        slide = prsnt.slides.new_slide(slide_layout)
-        slide._part._element = self._slide._part._element
-        slide._element = self._slide._element
-
-    def __getattr__(self, item):
+    @classmethod
+    def _new_sld(cls, slide_layout_idx):
         """
-        Wires virtual slide to actual slide
-        :param item:
-        :return:
+        Return a new `p:sld` element, a copy of the skeleton for the layout
+        at *slide_layout_idx*. The skeletons of all layouts are built on first
+        use; only that is done under the lock, so threads copy concurrently.
         """
-        if hasattr(self._slide, item):
-            return eval(f'self._slide.{item}')
+        skeletons = cls._skeletons
+        if skeletons is None:
+            with cls._skeletons_lock:
+                if cls._skeletons is None:
+                    cls._skeletons = [
+                        cls._new_skeleton(slide_layout)
+                        for slide_layout in cls._false_package.slide_layouts
+                    ]
+                skeletons = cls._skeletons
+        return copy.deepcopy(skeletons[slide_layout_idx])
+
+    @staticmethod
+    def _new_skeleton(slide_layout):
+        sld = CT_Slide.new()
+        spTree = sld.cSld.spTree
+        for sp in slide_layout.part.new_placeholder_sps():
+            spTree.insert_element_before(sp, "p:extLst")
+        return sld
+
+
+def append_slides(prsnt, slides):
+    """
+    Return a list of new slides, copies of the virtual *slides* added in that
+    order at the end of the slides of |Presentation| *prsnt*.
+
+    Each copy uses the slide layout of *prsnt* having the name of the layout
+    of its virtual slide, or the first slide layout when there is none by
+    that name. Pictures, charts, notes and other content are copied along
+    with each slide as by :meth:`.Slides.import_from`.
+    """
+    slide_layouts = prsnt.slide_layouts
+    layout_parts = {}
+    slide_parts = []
+    for slide in slides:
+        slide_part = slide.part
+        src_layout_part = slide_part.part_related_by(RT.SLIDE_LAYOUT)
+        if src_layout_part not in layout_parts:
+            slide_layout = slide_layouts.get_by_name(
+                src_layout_part.slide_layout.name, slide_layouts[0]
+            )
+            layout_parts[src_layout_part] = slide_layout.part
+        slide_parts.append(slide_part)
+    imported = prsnt.part.import_slides(slide_parts, layout_parts)
+    return prsnt.slides._append_imported(imported)
@@ -1,54 +1,356 @@
-from pptx.table import Table as _Table
-from pptx.oxml.table import CT_Table
-from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
-from pptx.oxml.slide import CT_Slide
-from pptx.slide import SlideMaster
-from pptx.opc.constants import RELATIONSHIP_TYPE as RT, CONTENT_TYPE as CT
-from pptx.parts.slide import SlidePart
-import pptx
-import copy
-
-class Table:
-    def __init__(self,rows,cols, left, top, width, height):
-        self.graphicFrame = CT_GraphicalObjectFrame.new_table_graphicFrame(-1,None,rows,cols,left,top,width, height)
-
-    def append_to(self):
-        pass
-
-
-class Slide:
-    def __init__(self, layout_idx=0):
-        p = pptx.Presentation()
-        l = p.slide_layouts[layout_idx]
-        self.slide = p.slides.add_slide(l)
-
-    def append_in(self, p):
-        new_slide = copy.deepcopy(self.slide)
-        # print(p.__dir__())
-        # print(p.part.__dir__())
-        new_slide.part._package = p.part.package
-        # print(new_slide.part.related_parts)
-        # print(new_slide.part._element.xml)
-        # print(new_slide.slide_layout.__dir__())
-        # print(new_slide.slide_layout.name)
-        new_slide.shapes.add_table(2,2,0,0,pptx.util.Cm(10),pptx.util.Cm(10))
-        # print(new_slide.shapes._spTree.xml)
-        # exit()
-        # print(new_slide.slide_layout.background)
-        for i,sl in enumerate(p.slide_layouts):
-            if sl.name == new_slide.slide_layout.name:
-                new_slide.part.relate_to(sl.part,RT.SLIDE_LAYOUT)
-                break
-        # exit()
-        k = p.part.relate_to(new_slide.part,reltype=RT.SLIDE)
-        # print(k)
-        # p.slides._sldIdLst.add_sldId(k)
-        # print(p.slides[0].shapes._spTree.xml)
-        # print(p.slides.part._next_slide_partname)
-        # for i in p.part.rels.items():
-        #     print(i)
-        #     # print(i[1].__dir__())
-        #     v = i[1]
-        #     print(v.reltype, v._target, v.target_part, v.target_ref)
-        # for i in p.part.parts.items():
-        #     print(i)
\ No newline at end of file
+# encoding: utf-8
+
+"""Off-slide table builder.
+
+A virtual |Table| holds its cell values and styles in compact columnar storage
+(arrays of interned string and style ids) and only produces an `a:tbl` element
+when it is placed on a slide. No lxml element exists per cell until then, so very
+large tables can be built at a fraction of the memory a live table requires.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from array import array
+from xml.sax.saxutils import escape, quoteattr
+
+from pptx.dml.color import rgb_hex
+from pptx.enum.text import MSO_ANCHOR
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.oxml.table import solidFill_xml
+from pptx.oxml.text import CT_RegularTextRun
+from pptx.spec import GRAPHIC_DATA_URI_TABLE
+from pptx.util import Emu, Length
+
+
+class Table(object):
+    """Table built off-slide and materialized on placement.
+
+    *rows* and *cols* give the initial grid size. *width* is evenly distributed
+    between the columns and *height* between the rows, the same way
+    :meth:`.SlideShapes.add_table` does it. Cells are accessed with
+    :meth:`cell` and the table is placed on a slide with :meth:`append_to` or
+    :meth:`.SlideShapes.insert_table`.
+    """
+
+    def __init__(self, rows, cols, left, top, width, height):
+        super(Table, self).__init__()
+        if rows < 1 or cols < 1:
+            raise ValueError(
+                "table must have at least one row and column, got %d x %d"
+                % (rows, cols)
+            )
+        self.left, self.top = Emu(left), Emu(top)
+        self._col_widths = array("q", _distribute(width, cols))
+        self._row_heights = array("q", _distribute(height, rows))
+        # ---cell storage is row-major, one slot per grid cell---
+        self._text_ids = array("L", [0]) * (rows * cols)
+        self._style_ids = array("L", [0]) * (rows * cols)
+        self._strings = _InternTable("")
+        self._styles = _InternTable(_CellStyle(()))
+
+    def add_column(self, width=None):
+        """Append a column to the right of the table.
+
+        The width of the last column is used when *width* is |None|.
+        """
+        width = self._col_widths[-1] if width is None else width
+        old_cols = self.col_count
+        self._col_widths.append(width)
+        for ids in (self._text_ids, self._style_ids):
+            new_ids = array("L")
+            for row_idx in range(self.row_count):
+                start = row_idx * old_cols
+                new_ids.extend(ids[start : start + old_cols])
+                new_ids.append(0)
+            ids[:] = new_ids
+
+    def add_row(self, height=None):
+        """Append a row at the bottom of the table.
+
+        The height of the last row is used when *height* is |None|.
+        """
+        height = self._row_heights[-1] if height is None else height
+        self._row_heights.append(height)
+        empty = array("L", [0]) * self.col_count
+        self._text_ids.extend(empty)
+        self._style_ids.extend(empty)
+
+    def append_to(self, slide):
+        """Place this table on *slide* and return the new |GraphicFrame| shape."""
+        return slide.shapes.append_table(self)
+
+    def cell(self, row_idx, col_idx):
+        """Return a |_Cell| view on the grid cell at *row_idx*, *col_idx*."""
+        return _Cell(self, self._offset(row_idx, col_idx))
+
+    @property
+    def col_count(self):
+        """Number of columns in this table."""
+        return len(self._col_widths)
+
+    @property
+    def height(self):
+        """Total table height, the sum of the row heights."""
+        return Emu(sum(self._row_heights))
+
+    def new_graphicFrame(self, id_, name):
+        """Return a new `p:graphicFrame` element containing this table.
+
+        The whole element tree is serialized in a single pass and parsed once.
+        """
+        xml = (
+            "<p:graphicFrame %s>"
+            "<p:nvGraphicFramePr>"
+            "<p:cNvPr id=\"%d\" name=%s/>"
+            "<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp=\"1\"/>"
+            "</p:cNvGraphicFramePr>"
+            "<p:nvPr/>"
+            "</p:nvGraphicFramePr>"
+            "<p:xfrm><a:off x=\"%d\" y=\"%d\"/><a:ext cx=\"%d\" cy=\"%d\"/></p:xfrm>"
+            "<a:graphic><a:graphicData uri=\"%s\">%s</a:graphicData></a:graphic>"
+            "</p:graphicFrame>"
+            % (
+                nsdecls("a", "p"),
+                id_,
+                quoteattr(name),
+                self.left,
+                self.top,
+                self.width,
+                self.height,
+                GRAPHIC_DATA_URI_TABLE,
+                self._tbl_xml(),
+            )
+        )
+        return parse_xml(xml)
+
+    @property
+    def row_count(self):
+        """Number of rows in this table."""
+        return len(self._row_heights)
+
+    def set_column_width(self, col_idx, width):
+        """Set the width of the column at *col_idx* to *width* EMU."""
+        self._col_widths[col_idx] = width
+
+    def set_row_height(self, row_idx, height):
+        """Set the height of the row at *row_idx* to *height* EMU."""
+        self._row_heights[row_idx] = height
+
+    @property
+    def width(self):
+        """Total table width, the sum of the column widths."""
+        return Emu(sum(self._col_widths))
+
+    def _offset(self, row_idx, col_idx):
+        """Return the storage offset of the cell at *row_idx*, *col_idx*."""
+        row_count, col_count = self.row_count, self.col_count
+        if row_idx < 0:
+            row_idx += row_count
+        if col_idx < 0:
+            col_idx += col_count
+        if not (0 <= row_idx < row_count and 0 <= col_idx < col_count):
+            raise IndexError("cell (%d, %d) out of range" % (row_idx, col_idx))
+        return row_idx * col_count + col_idx
+
+    def _tbl_xml(self):
+        """Return the `a:tbl` XML for this table as a str.
+
+        The `a:tc` markup for a given (text, style) pair is rendered only once,
+        so repeated values cost a dict lookup each.
+        """
+        strings, styles = self._strings, self._styles
+        text_ids, style_ids = self._text_ids, self._style_ids
+        col_count = self.col_count
+        tc_xml_cache = {}
+
+        parts = [
+            "<a:tbl><a:tblPr firstRow=\"1\" bandRow=\"1\">"
+            "<a:tableStyleId>{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}</a:tableStyleId>"
+            "</a:tblPr><a:tblGrid>"
+        ]
+        parts.extend('<a:gridCol w="%d"/>' % w for w in self._col_widths)
+        parts.append("</a:tblGrid>")
+        for row_idx, h in enumerate(self._row_heights):
+            parts.append('<a:tr h="%d">' % h)
+            start = row_idx * col_count
+            for offset in range(start, start + col_count):
+                key = (text_ids[offset], style_ids[offset])
+                tc_xml = tc_xml_cache.get(key)
+                if tc_xml is None:
+                    style = styles[key[1]]
+                    tc_xml = tc_xml_cache[key] = _tc_xml(strings[key[0]], style)
+                parts.append(tc_xml)
+            parts.append("</a:tr>")
+        parts.append("</a:tbl>")
+        return "".join(parts)
+
+
+class _Cell(object):
+    """Lightweight view on one grid cell of a virtual |Table|.
+
+    Holds no cell state of its own, only the table and the cell's storage offset.
+    """
+
+    __slots__ = ("_table", "_offset")
+
+    def __init__(self, table, offset):
+        self._table = table
+        self._offset = offset
+
+    @property
+    def style(self):
+        """Dict of the style properties applied to this cell."""
+        return dict(self._table._styles[self._table._style_ids[self._offset]].items)
+
+    def set_style(self, **props):
+        """Apply the style properties in *props* to this cell.
+
+        Properties not named keep their current value; a property assigned |None|
+        is cleared. Supported properties are `fill`, `color` (|RGBColor| or hex
+        str), `anchor` (:ref:`MsoVerticalAnchor`), `bold`, `italic`, `size`
+        (|Length|) and `margin_left`, `margin_right`, `margin_top`,
+        `margin_bottom` (|Length|).
+        """
+        table = self._table
+        style = table._styles[table._style_ids[self._offset]]
+        table._style_ids[self._offset] = table._styles.intern(style.updated(props))
+
+    @property
+    def text(self):
+        """str text of this cell; `\\n` separates paragraphs, `\\v` line-breaks."""
+        return self._table._strings[self._table._text_ids[self._offset]]
+
+    @text.setter
+    def text(self, text):
+        self._table._text_ids[self._offset] = self._table._strings.intern(text)
+
+
+class _CellStyle(object):
+    """Immutable set of cell style properties, renderable to XML fragments."""
+
+    __slots__ = ("items", "_tcPr_xml", "_rPr_xml")
+
+    _margin_attrs = (
+        ("margin_left", "marL"),
+        ("margin_right", "marR"),
+        ("margin_top", "marT"),
+        ("margin_bottom", "marB"),
+    )
+    _props = frozenset(
+        ("fill", "color", "anchor", "bold", "italic", "size")
+        + tuple(prop for prop, _ in _margin_attrs)
+    )
+
+    def __init__(self, items):
+        self.items = items
+        self._tcPr_xml = self._rPr_xml = None
+
+    def __eq__(self, other):
+        return isinstance(other, _CellStyle) and self.items == other.items
+
+    def __hash__(self):
+        return hash(self.items)
+
+    @property
+    def rPr_xml(self):
+        """`a:rPr` XML for runs in a cell having this style, or '' for none."""
+        if self._rPr_xml is None:
+            props = dict(self.items)
+            attrs = ""
+            if props.get("size") is not None:
+                attrs += ' sz="%d"' % Length(props["size"]).centipoints
+            if props.get("bold") is not None:
+                attrs += ' b="%d"' % bool(props["bold"])
+            if props.get("italic") is not None:
+                attrs += ' i="%d"' % bool(props["italic"])
+            color = props.get("color")
+            if color is None:
+                self._rPr_xml = "<a:rPr%s/>" % attrs if attrs else ""
+            else:
+                self._rPr_xml = "<a:rPr%s>%s</a:rPr>" % (attrs, solidFill_xml(color))
+        return self._rPr_xml
+
+    @property
+    def tcPr_xml(self):
+        """`a:tcPr` XML for a cell having this style."""
+        if self._tcPr_xml is None:
+            props = dict(self.items)
+            attrs = "".join(
+                ' %s="%d"' % (attr, props[prop])
+                for prop, attr in self._margin_attrs
+                if props.get(prop) is not None
+            )
+            if props.get("anchor") is not None:
+                attrs += ' anchor="%s"' % MSO_ANCHOR.to_xml(props["anchor"])
+            fill = props.get("fill")
+            if fill is None:
+                self._tcPr_xml = "<a:tcPr%s/>" % attrs
+            else:
+                self._tcPr_xml = "<a:tcPr%s>%s</a:tcPr>" % (attrs, solidFill_xml(fill))
+        return self._tcPr_xml
+
+    def updated(self, props):
+        """Return a new style with *props* applied over the items of this one."""
+        unknown = set(props) - self._props
+        if unknown:
+            raise ValueError("unsupported cell style property %s" % sorted(unknown)[0])
+        merged = dict(self.items)
+        for prop, value in props.items():
+            if prop in ("fill", "color") and value is not None:
+                value = rgb_hex(value)
+            if value is None:
+                merged.pop(prop, None)
+            else:
+                merged[prop] = value
+        return _CellStyle(tuple(sorted(merged.items())))
+
+
+class _InternTable(object):
+    """Maps hashable values to small integer ids, id 0 being *default*."""
+
+    def __init__(self, default):
+        self._values = [default]
+        self._ids = {default: 0}
+
+    def __getitem__(self, id_):
+        return self._values[id_]
+
+    def __len__(self):
+        return len(self._values)
+
+    def intern(self, value):
+        """Return the id of *value*, assigning the next id if it is new."""
+        id_ = self._ids.get(value)
+        if id_ is None:
+            id_ = self._ids[value] = len(self._values)
+            self._values.append(value)
+        return id_
+
+
+def _distribute(total, count):
+    """Return *count* int sizes summing to *total*, the last absorbing any error."""
+    size = total // count
+    return [size] * (count - 1) + [total - size * (count - 1)]
+
+
+def _p_xml(p_text, rPr_xml):
+    """Return `a:p` XML for the paragraph text *p_text*."""
+    runs = []
+    for idx, r_str in enumerate(p_text.split("\v")):
+        if idx > 0:
+            runs.append("<a:br/>")
+        if r_str:
+            t = escape(CT_RegularTextRun._escape_ctrl_chars(r_str))
+            runs.append("<a:r>%s<a:t>%s</a:t></a:r>" % (rPr_xml, t))
+    return "<a:p>%s</a:p>" % "".join(runs)
+
+
+def _tc_xml(text, style):
+    """Return `a:tc` XML for a cell containing *text* formatted with *style*."""
+    rPr_xml = style.rPr_xml
+    ps_xml = "".join(_p_xml(p_text, rPr_xml) for p_text in text.split("\n"))
+    return "<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>%s</a:txBody>%s</a:tc>" % (
+        ps_xml,
+        style.tcPr_xml,
+    )
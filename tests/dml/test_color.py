@@ -8,7 +8,7 @@ from __future__ import absolute_import
 
 import pytest
 
-from pptx.dml.color import ColorFormat, RGBColor
+from pptx.dml.color import ColorFormat, RGBColor, rgb_hex
 from pptx.enum.dml import MSO_COLOR_TYPE, MSO_THEME_COLOR
 
 from ..oxml.unitdata.dml import (
@@ -290,3 +290,14 @@ class DescribeRGBColor(object):
 
     def it_can_provide_a_hex_string_rgb_value(self):
         assert str(RGBColor(0x12, 0x34, 0x56)) == "123456"
+
+
+class Describe_rgb_hex(object):
+    def it_converts_a_color_or_hex_str_to_a_hex_rgb_str(self):
+        assert rgb_hex(RGBColor(0x12, 0x34, 0x56)) == "123456"
+        assert rgb_hex("12ab56") == "12AB56"
+
+    @pytest.mark.parametrize("value", ("12345", "GG0000", "00FF00FF"))
+    def but_it_raises_on_an_invalid_hex_str(self, value):
+        with pytest.raises(ValueError):
+            rgb_hex(value)
@@ -8,7 +8,9 @@ from __future__ import absolute_import
 
 import pytest
 
-from pptx.opc.oxml import CT_Relationships
+from pptx.instrument import SaveReport, TopPartsProfiler
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import CT_Relationships, serialize_part_xml
 from pptx.opc.packuri import PACKAGE_URI, PackURI
 from pptx.opc.package import (
     OpcPackage,
@@ -17,6 +19,7 @@ from pptx.opc.package import (
     _Relationship,
     RelationshipCollection,
     Unmarshaller,
+    WrittenPart,
     XmlPart,
 )
 from pptx.opc.pkgreader import PackageReader
@@ -25,6 +28,7 @@ from pptx.package import Package
 
 from ..unitutil.cxml import element
 from ..unitutil.mock import (
+    ANY,
     call,
     class_mock,
     cls_attr_mock,
@@ -48,7 +52,9 @@ class DescribeOpcPackage(object):
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
         PackageReader_.from_file.assert_called_once_with(pkg_file)
-        Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg, PartFactory_)
+        Unmarshaller_.unmarshal.assert_called_once_with(
+            pkg_reader, pkg, PartFactory_, workers=None
+        )
         assert isinstance(pkg, OpcPackage)
 
     def it_initializes_its_rels_collection_on_first_reference(
@@ -105,14 +111,84 @@ class DescribeOpcPackage(object):
 
     def it_can_save_to_a_pkg_file(self, pkg_file_, PackageWriter_, parts, parts_):
         pkg = OpcPackage()
-        pkg.save(pkg_file_)
+        profiler = TopPartsProfiler()
+
+        report = pkg.save(pkg_file_, optimize=True, profiler=profiler)
+
         for part in parts_:
             part.before_marshal.assert_called_once_with()
-        PackageWriter_.write.assert_called_once_with(pkg_file_, pkg._rels, parts_)
+        PackageWriter_.write.assert_called_once_with(
+            pkg_file_, pkg._rels, parts_, True, profiler
+        )
+        assert isinstance(report, SaveReport)
+        assert report.bytes_saved is PackageWriter_.write.return_value
+        assert report.bytes_reclaimed is None
+        (event,) = profiler.package_events
+        assert event.part_count == len(parts_)
+        assert event.total_ms >= event.marshal_ms >= 0.0
+
+    def it_can_collect_garbage_before_saving(
+        self, request, pkg_file_, PackageWriter_, parts, parts_
+    ):
+        collect_garbage_ = method_mock(request, OpcPackage, "collect_garbage")
+        pkg = OpcPackage()
+
+        report = pkg.save(pkg_file_, collect_garbage=True)
+
+        collect_garbage_.assert_called_once_with()
+        PackageWriter_.write.assert_called_once_with(
+            pkg_file_, pkg._rels, parts_, False, None
+        )
+        assert report.bytes_saved is PackageWriter_.write.return_value
+        assert report.bytes_reclaimed is collect_garbage_.return_value
+
+    def it_can_discard_parts_no_longer_reachable(self):
+        pkg = OpcPackage()
+        prs_part = XmlPart(
+            PackURI("/ppt/presentation.xml"),
+            "app/prs",
+            element("p:presentation/p:sldIdLst/p:sldId{r:id=rId1,id=256}"),
+        )
+        prs_part._explicit_reltypes = (RT.SLIDE,)
+        kept_slide = Part(PackURI("/ppt/slides/slide1.xml"), "app/sld", b"sld1")
+        removed_slide = Part(PackURI("/ppt/slides/slide2.xml"), "app/sld", b"sld2..")
+        theme = Part(PackURI("/ppt/theme/theme1.xml"), "app/thm", b"thm")
+        pkg.load_rel(RT.OFFICE_DOCUMENT, prs_part, "rId1")
+        prs_part.load_rel(RT.SLIDE, kept_slide, "rId1")
+        prs_part.load_rel(RT.SLIDE, removed_slide, "rId2")
+        prs_part.load_rel(RT.THEME, theme, "rId3")
+        pkg.record_part_load(removed_slide, 1.0, 2.0, 6)
+
+        bytes_reclaimed = pkg.collect_garbage()
+
+        assert bytes_reclaimed == {"/ppt/slides/slide2.xml": 6}
+        assert pkg.parts == [prs_part, kept_slide, theme]
+        assert sorted(prs_part.related_parts) == ["rId1", "rId3"]
+        assert pkg._part_load_times == {}
 
     def it_can_be_notified_after_unmarshalling_is_complete(self, pkg):
         pkg.after_unmarshal()
 
+    def it_reports_the_load_stats_of_its_parts(self, request):
+        loaded_part = Part("/loaded.bin", "app/x", b"0123456789")
+        added_part = XmlPart("/added.xml", "app/y", element("p:sld/p:cSld"))
+        method_mock(
+            request,
+            OpcPackage,
+            "iter_parts",
+            return_value=iter((loaded_part, added_part)),
+        )
+        pkg = OpcPackage()
+        pkg.record_part_load(loaded_part, 1.5, 2.5, 10)
+
+        loaded, added = pkg.stats()
+
+        assert (loaded.partname, loaded.content_type) == ("/loaded.bin", "app/x")
+        assert (loaded.read_ms, loaded.parse_ms, loaded.blob_bytes) == (1.5, 2.5, 10)
+        assert (loaded.element_count, loaded.approx_bytes) == (0, 10)
+        assert (added.read_ms, added.parse_ms, added.blob_bytes) == (None,) * 3
+        assert added.element_count == 2
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -322,6 +398,10 @@ class DescribePart(object):
         part.blob = new_blob
         assert part.blob == new_blob
 
+    def it_estimates_its_memory_as_its_blob_size(self):
+        part = Part(None, None, b"0123456789", None)
+        assert part.memory_estimate == (0, 10)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -417,6 +497,23 @@ class DescribePartRelationshipManagementInterface(object):
         else:
             assert rId in part.rels
 
+    def it_can_drop_relationships_its_xml_no_longer_refers_to(self):
+        part = XmlPart(
+            PackURI("/ppt/slides/slide1.xml"),
+            None,
+            element("p:sld/p:cSld/p:spTree/p:pic/p:blipFill/a:blip{r:embed=rId2}"),
+        )
+        part._explicit_reltypes = (RT.IMAGE,)
+        part.load_rel(RT.IMAGE, "image-1", "rId1")
+        part.load_rel(RT.IMAGE, "image-2", "rId2")
+        part.load_rel(RT.SLIDE_LAYOUT, "layout", "rId3")
+        part.load_rel(RT.IMAGE, "http://x/y.png", "rId4", is_external=True)
+
+        part.drop_unreferenced_rels()
+
+        assert sorted(part.rels) == ["rId2", "rId3", "rId4"]
+        assert "rId1" not in part.related_parts
+
     def it_can_find_a_related_part_by_reltype(self, related_part_fixture):
         part, reltype_, related_part_ = related_part_fixture
         related_part = part.part_related_by(reltype_)
@@ -551,6 +648,36 @@ class DescribeXmlPart(object):
         serialize_part_xml_.assert_called_once_with(element_)
         assert blob is serialize_part_xml_.return_value
 
+    def it_can_serialize_to_optimized_xml(
+        self, request, element_, serialize_part_xml_
+    ):
+        optimized_copy_ = function_mock(request, "pptx.opc.package.optimized_copy")
+        xml_part = XmlPart(None, None, element_, None)
+
+        blob = xml_part.optimized_blob
+
+        optimized_copy_.assert_called_once_with(element_)
+        serialize_part_xml_.assert_called_once_with(optimized_copy_.return_value)
+        assert blob is serialize_part_xml_.return_value
+
+    def it_measures_its_xml_while_serializing_it_optimized(self, request):
+        serialize_part_xml_ = function_mock(
+            request, "pptx.opc.package.serialize_part_xml", wraps=serialize_part_xml
+        )
+        xml_part = XmlPart(None, None, element("a:tc{gridSpan=1}/a:tcPr"), None)
+
+        blob, blob_size = xml_part.optimized_blob_and_size
+
+        assert serialize_part_xml_.call_count == 2
+        assert blob == xml_part.optimized_blob
+        assert blob_size == len(xml_part.blob) > len(blob)
+
+    def it_estimates_the_memory_held_by_its_xml(self):
+        xml_part = XmlPart(None, None, element("p:sld/p:cSld{name=foo}"), None)
+        element_count, approx_bytes = xml_part.memory_estimate
+        assert element_count == 2
+        assert approx_bytes > 0
+
     def it_knows_its_the_part_for_its_child_objects(self, part_fixture):
         xml_part = part_fixture
         assert xml_part.part is xml_part
@@ -625,6 +752,28 @@ class DescribeXmlPart(object):
         return function_mock(request, "pptx.opc.package.serialize_part_xml")
 
 
+class DescribeWrittenPart(object):
+    def it_can_stand_in_for_a_written_part(self):
+        package = OpcPackage()
+        part = Part(PackURI("/ppt/media/image1.png"), "image/png", b"foo", package)
+        part.sha1 = "0beec7b5ea3f0fdbc95d0dd47f3c5bc275da8a33"
+
+        written_part = WrittenPart.replacing(part)
+
+        assert written_part.partname == part.partname
+        assert written_part.content_type == "image/png"
+        assert written_part.package is package
+        assert written_part.sha1 == part.sha1
+        assert len(written_part.rels) == 0
+
+    def but_it_cannot_be_renamed(self):
+        written_part = WrittenPart(PackURI("/ppt/slides/slide1.xml"), "app/vnd.sld")
+        written_part.partname = PackURI("/ppt/slides/slide1.xml")
+
+        with pytest.raises(ValueError):
+            written_part.partname = PackURI("/ppt/slides/slide2.xml")
+
+
 class DescribePartFactory(object):
     def it_constructs_custom_part_type_for_registered_content_types(
         self, part_args_, CustomPartClass_, part_of_custom_type_
@@ -734,6 +883,13 @@ class DescribeRelationshipCollection(object):
         rels["foobar"] = rel
         assert rels["foobar"] == rel
 
+    def it_forgets_the_target_part_of_a_deleted_relationship(self):
+        rels = RelationshipCollection(None)
+        rels.add_relationship(RT.SLIDE, "slide-part", "rId1")
+        del rels["rId1"]
+        assert "rId1" not in rels
+        assert rels.related_parts == {}
+
     def it_should_raise_on_failed_lookup_by_rId(self):
         rels = RelationshipCollection(None)
         with pytest.raises(KeyError):
@@ -753,6 +909,20 @@ class DescribeRelationshipCollection(object):
         assert rels[rId] == rel
         assert rel == _Relationship_.return_value
 
+    def it_can_add_relationships_to_several_parts(self):
+        rels = RelationshipCollection("/ppt")
+        for rId in ("rId1", "rId3"):
+            rels.add_relationship(RT.SLIDE, "part-%s" % rId, rId)
+
+        rIds = rels.add_relationships(RT.SLIDE, ["part-a", "part-b", "part-c"])
+
+        assert rIds == ["rId2", "rId4", "rId5"]
+        assert [rels.related_parts[rId] for rId in rIds] == [
+            "part-a",
+            "part-b",
+            "part-c",
+        ]
+
     def it_can_add_an_external_relationship(self, add_ext_rel_fixture_):
         rels, reltype, url = add_ext_rel_fixture_
         rId = rels.get_or_add_ext_rel(reltype, url)
@@ -858,7 +1028,9 @@ class DescribeUnmarshaller(object):
         # exercise ---------------------
         Unmarshaller.unmarshal(pkg_reader_, pkg_, part_factory_)
         # verify -----------------------
-        _unmarshal_parts.assert_called_once_with(pkg_reader_, pkg_, part_factory_)
+        _unmarshal_parts.assert_called_once_with(
+            pkg_reader_, pkg_, part_factory_, None
+        )
         _unmarshal_relationships.assert_called_once_with(pkg_reader_, pkg_, parts_dict_)
         for part in parts_dict_.values():
             part.after_unmarshal.assert_called_once_with()
@@ -869,6 +1041,7 @@ class DescribeUnmarshaller(object):
         pkg_reader_,
         pkg_,
         part_factory_,
+        parts_,
         parts_dict_,
         partnames_,
         content_types_,
@@ -885,7 +1058,26 @@ class DescribeUnmarshaller(object):
             call(partname_, content_type_, blob_, pkg_),
             call(partname_2_, content_type_2_, blob_2_, pkg_),
         ]
+        assert pkg_reader_.read_stats_for.call_args_list == [
+            call(partname_),
+            call(partname_2_),
+        ]
+        assert pkg_.record_part_load.call_args_list == [
+            call(parts_[0], 1.5, ANY, 42),
+            call(parts_[1], 1.5, ANY, 42),
+        ]
+        assert parts == parts_dict_
+
+    def it_can_unmarshal_parts_on_a_thread_pool(
+        self, pkg_reader_, pkg_, part_factory_, parts_dict_, partnames_
+    ):
+        parts = Unmarshaller._unmarshal_parts(
+            pkg_reader_, pkg_, part_factory_, workers=2
+        )
+
+        assert part_factory_.call_count == 2
         assert parts == parts_dict_
+        assert list(parts) == list(partnames_)
 
     def it_can_unmarshal_relationships(self):
         # test data --------------------
@@ -1005,6 +1197,7 @@ class DescribeUnmarshaller(object):
         )
         pkg_reader_ = instance_mock(request, PackageReader)
         pkg_reader_.iter_sparts.return_value = spart_return_values
+        pkg_reader_.read_stats_for.return_value = (1.5, 42)
         return pkg_reader_
 
     @pytest.fixture
@@ -171,6 +171,19 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_knows_the_compressed_size_of_a_written_blob(self, pkg_file):
+        pack_uri = PackURI("/part/name.xml")
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write(pack_uri, b"<a/>" * 1000)
+
+        compressed_size = pkg_writer.compressed_size(pack_uri)
+
+        pkg_writer.close()
+        assert 0 < compressed_size < 4000
+        assert ZipFile(pkg_file).getinfo("part/name.xml").compress_size == (
+            compressed_size
+        )
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -22,6 +22,7 @@ from pptx.opc.pkgreader import (
 
 from .unitdata.types import a_Default, a_Types, an_Override
 from ..unitutil.mock import (
+    ANY,
     call,
     class_mock,
     function_mock,
@@ -106,6 +107,11 @@ class DescribePackageReader(object):
         assert retval == (partname, content_type, blob)
         assert iter_count == 1
 
+    def it_knows_the_read_stats_of_each_part(self):
+        spart = _SerializedPart("/part/name.xml", None, b"0123456789", None, 1.5)
+        pkg_reader = PackageReader(None, None, [spart])
+        assert pkg_reader.read_stats_for("/part/name.xml") == (1.5, 10)
+
     def it_can_iterate_over_all_the_srels(self):
         # mockery ----------------------
         pkg_srels = ["srel1", "srel2"]
@@ -149,8 +155,8 @@ class DescribePackageReader(object):
         )
         # verify -----------------------
         expected_calls = [
-            call("/part/name1.xml", "app/vnd.type_1", "<Part_1/>", "srels_1"),
-            call("/part/name2.xml", "app/vnd.type_2", "<Part_2/>", "srels_2"),
+            call("/part/name1.xml", "app/vnd.type_1", "<Part_1/>", "srels_1", ANY),
+            call("/part/name2.xml", "app/vnd.type_2", "<Part_2/>", "srels_2", ANY),
         ]
         assert _SerializedPart_.call_args_list == expected_calls
         assert retval == expected_sparts
@@ -4,12 +4,21 @@
 Test suite for opc.pkgwriter module
 """
 
+import zipfile
+
+from io import BytesIO
+
 import pytest
 
+from pptx.instrument import TopPartsProfiler
 from pptx.opc.constants import CONTENT_TYPE as CT
-from pptx.opc.package import Part
+from pptx.opc.package import Part, WrittenPart
 from pptx.opc.packuri import PackURI
-from pptx.opc.pkgwriter import _ContentTypesItem, PackageWriter
+from pptx.opc.pkgwriter import (
+    _ContentTypesItem,
+    PackageWriter,
+    StreamingPackageWriter,
+)
 
 from .unitdata.types import a_Default, a_Types, an_Override
 from ..unitutil.mock import (
@@ -36,7 +45,7 @@ class DescribePackageWriter(object):
         expected_calls = [
             call._write_content_types_stream(phys_writer, parts),
             call._write_pkg_rels(phys_writer, pkg_rels),
-            call._write_parts(phys_writer, parts),
+            call._write_parts(phys_writer, parts, False, None),
         ]
         PhysPkgWriter_.assert_called_once_with(pkg_file)
         assert _write_methods.mock_calls == expected_calls
@@ -81,6 +90,31 @@ class DescribePackageWriter(object):
         ]
         assert phys_writer.write.mock_calls == expected_calls
 
+    def it_can_write_optimized_parts_and_report_bytes_saved(self):
+        phys_writer = Mock(name="phys_writer")
+        part = Mock(name="part", optimized_blob_and_size=(b"0123", 10), _rels=[])
+
+        bytes_saved = PackageWriter._write_parts(phys_writer, [part], optimize=True)
+
+        phys_writer.write.assert_called_once_with(part.partname, b"0123")
+        assert bytes_saved == {part.partname: 6}
+
+    def it_notifies_a_profiler_of_each_part_written(self):
+        phys_writer = Mock(name="phys_writer")
+        phys_writer.compressed_size.return_value = 4
+        part = Mock(name="part", blob=b"0123456789", _rels=[])
+        profiler = TopPartsProfiler()
+
+        PackageWriter._write_parts(phys_writer, [part], profiler=profiler)
+
+        phys_writer.compressed_size.assert_called_once_with(part.partname)
+        (event,) = profiler.part_events
+        assert event.partname is part.partname
+        assert event.content_type is part.content_type
+        assert (event.raw_bytes, event.compressed_bytes) == (10, 4)
+        assert event.serialize_ms >= 0.0
+        assert event.compress_ms >= 0.0
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -117,6 +151,50 @@ class DescribePackageWriter(object):
         return method_mock(request, _ContentTypesItem, "xml_for")
 
 
+class DescribeStreamingPackageWriter(object):
+    def it_writes_each_part_once_as_it_is_finished(self):
+        stream = BytesIO()
+        pkg_writer = StreamingPackageWriter(stream)
+        slide_part = Part(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, b"<sld/>")
+        image_part = Part(PackURI("/ppt/media/image1.png"), CT.PNG, b"png")
+        slide_part.load_rel("http://img", image_part, "rId1")
+        pkg_rels = Mock(name="pkg_rels", xml=b"<rels/>")
+
+        pkg_writer.write_part(slide_part)
+        pkg_writer.write_part(slide_part)
+        pkg_writer.close(pkg_rels, [slide_part, image_part])
+
+        zip_file = zipfile.ZipFile(stream)
+        assert zip_file.namelist() == [
+            "ppt/slides/slide1.xml",
+            "ppt/slides/_rels/slide1.xml.rels",
+            "ppt/media/image1.png",
+            "[Content_Types].xml",
+            "_rels/.rels",
+        ]
+        content_types = zip_file.read("[Content_Types].xml").decode("utf-8")
+        assert 'PartName="/ppt/slides/slide1.xml"' in content_types
+        assert 'Extension="png"' in content_types
+        assert zip_file.read("_rels/.rels") == b"<rels/>"
+
+    def it_skips_the_stand_in_for_a_part_it_wrote(self):
+        pkg_writer = StreamingPackageWriter(BytesIO())
+        slide_part = Part(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, b"<sld/>")
+
+        pkg_writer.write_part(slide_part)
+        pkg_writer.write_part(WrittenPart.replacing(slide_part))
+
+        assert pkg_writer._written == [(slide_part.partname, CT.PML_SLIDE)]
+
+    def but_it_raises_on_a_different_part_having_a_written_partname(self):
+        pkg_writer = StreamingPackageWriter(BytesIO())
+        partname = PackURI("/ppt/slides/slide1.xml")
+        pkg_writer.write_part(Part(partname, CT.PML_SLIDE, b"<sld/>"))
+
+        with pytest.raises(ValueError):
+            pkg_writer.write_part(Part(partname, CT.PML_SLIDE, b"<sld/>"))
+
+
 class Describe_ContentTypesItem(object):
     def it_can_compose_content_types_xml(self, xml_for_fixture):
         parts, expected_xml = xml_for_fixture
@@ -0,0 +1,43 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.oxml.shapes.shared` module."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from ...unitutil.cxml import element, xml
+
+
+class DescribeBaseShapeElement(object):
+    def it_can_get_several_transform_values_at_once(self):
+        sp = element(
+            "p:sp/p:spPr/a:xfrm{flipH=1}/(a:off{x=1,y=2},a:ext{cx=3,cy=4})"
+        )
+        assert sp.get_xfrm_values("x", "y", "cx", "cy", "flipH") == (
+            1,
+            2,
+            3,
+            4,
+            True,
+        )
+
+    def and_it_gets_None_for_each_when_it_has_no_transform(self):
+        sp = element("p:sp/p:spPr")
+        assert sp.get_xfrm_values("x", "cy") == (None, None)
+
+    def it_can_set_several_transform_values_at_once(self):
+        sp = element("p:sp{a:b=c}/p:spPr")
+        sp.set_xfrm_values(x=1, y=2, cx=3, cy=4, rot=45.0)
+        assert sp.xml == xml(
+            "p:sp{a:b=c}/p:spPr/a:xfrm{rot=2700000}/(a:off{x=1,y=2},a:ext{cx=3,cy=4})"
+        )
+
+
+class DescribeCT_Transform2D(object):
+    def it_raises_on_a_name_that_is_not_a_transform_value(self):
+        xfrm = element("a:xfrm")
+        with pytest.raises(AttributeError):
+            xfrm.get_values("tag")
+        with pytest.raises(AttributeError):
+            xfrm.set_values(foo=1)
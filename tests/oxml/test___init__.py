@@ -6,15 +6,26 @@ Test suite for pptx.oxml.__init__.py module, primarily XML parser-related.
 
 from __future__ import print_function, unicode_literals
 
+import threading
+
 import pytest
 
 from lxml import etree
 
-from pptx.oxml import oxml_parser, parse_xml, register_element_cls
-from pptx.oxml.ns import qn
+from pptx.oxml import (
+    ElementPrototype,
+    element_class_lookup,
+    get_oxml_parser,
+    oxml_parser,
+    parse_xml,
+    register_element_cls,
+    register_lazy_element_classes,
+)
+from pptx.oxml.ns import nsdecls, nsuri, qn
+from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.xmlchemy import BaseOxmlElement
 
-from ..unitutil.mock import function_mock, loose_mock, var_mock
+from ..unitutil.mock import function_mock, loose_mock
 
 
 class DescribeOxmlParser(object):
@@ -22,10 +33,28 @@ class DescribeOxmlParser(object):
         xml_bytes = etree.tostring(foo)
         assert xml_bytes == stripped_xml_bytes
 
+    def it_provides_a_parser_for_each_thread(self):
+        parsers = []
+
+        def parse():
+            parsers.append(get_oxml_parser())
+            parsers.append(get_oxml_parser())
+            parsers.append(parse_xml("<p:sp %s/>" % nsdecls("p")))
+
+        thread = threading.Thread(target=parse)
+        thread.start()
+        thread.join()
+
+        parser, same_parser, sp = parsers
+        assert get_oxml_parser() is oxml_parser
+        assert parser is not oxml_parser
+        assert same_parser is parser
+        assert type(sp) is CT_Shape
+
 
 class DescribeParseXml(object):
     def it_uses_oxml_configured_parser_to_parse_xml(
-        self, mock_xml_bytes, fromstring, mock_oxml_parser
+        self, mock_xml_bytes, fromstring, get_oxml_parser_, mock_oxml_parser
     ):
         element = parse_xml(mock_xml_bytes)
         fromstring.assert_called_once_with(mock_xml_bytes, mock_oxml_parser)
@@ -49,6 +78,25 @@ class DescribeParseXml(object):
             parse_xml(xml_text)
 
 
+class DescribeElementPrototype(object):
+    def it_parses_its_template_once_and_returns_copies(self):
+        calls = []
+
+        def tmpl_factory():
+            calls.append(None)
+            return '<foo a="0"><bar b="0"/></foo>'
+
+        prototype = ElementPrototype(tmpl_factory, (), (0,))
+
+        foo = prototype.new({"a": "1"}, {"b": "2"})
+        foo_2 = prototype.new({"a": "3"}, {"b": None})
+
+        assert len(calls) == 1
+        assert foo_2 is not foo
+        assert etree.tostring(foo) == b'<foo a="1"><bar b="2"/></foo>'
+        assert etree.tostring(foo_2) == b'<foo a="3"><bar/></foo>'
+
+
 class DescribeRegisterCustomElementClass(object):
     def it_determines_cust_elm_class_constructed_for_specified_tag(self, xml_bytes):
         register_element_cls("a:foo", CustElmCls)
@@ -56,6 +104,17 @@ class DescribeRegisterCustomElementClass(object):
         assert type(foo) is CustElmCls
         assert type(foo.find(qn("a:bar"))) is etree._Element
 
+    def it_can_register_a_cust_elm_class_by_module_and_name(self):
+        register_lazy_element_classes(__name__, ("a:lazyFoo", "CustElmCls"))
+        namespace = element_class_lookup.get_namespace(nsuri("a"))
+        assert "lazyFoo" not in namespace
+
+        lazy_foo = parse_xml("<a:lazyFoo %s><a:bar/></a:lazyFoo>" % nsdecls("a"))
+
+        assert type(lazy_foo) is CustElmCls
+        assert type(lazy_foo[0]) is etree._Element
+        assert namespace["lazyFoo"] is CustElmCls
+
 
 # ===========================================================================
 # fixtures
@@ -76,9 +135,16 @@ def fromstring(request):
     return function_mock(request, "pptx.oxml.etree.fromstring")
 
 
+@pytest.fixture
+def get_oxml_parser_(request, mock_oxml_parser):
+    return function_mock(
+        request, "pptx.oxml.get_oxml_parser", return_value=mock_oxml_parser
+    )
+
+
 @pytest.fixture
 def mock_oxml_parser(request):
-    return var_mock(request, "pptx.oxml.oxml_parser")
+    return loose_mock(request, "oxml_parser")
 
 
 @pytest.fixture
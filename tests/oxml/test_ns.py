@@ -56,6 +56,9 @@ class DescribeQn(object):
     ):
         assert qn(nsptag_str) == clark_name
 
+    def it_returns_the_same_clark_name_on_repeated_calls(self, nsptag_str):
+        assert qn(nsptag_str) is qn(nsptag_str)
+
 
 # ===========================================================================
 # fixtures
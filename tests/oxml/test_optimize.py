@@ -0,0 +1,80 @@
+# encoding: utf-8
+
+"""Unit-test suite for pptx.oxml.optimize module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.oxml.optimize import optimized_copy
+
+from ..unitutil.cxml import element, xml
+
+
+class Describe_optimized_copy(object):
+    def it_removes_attributes_set_to_their_default(self, attrs_fixture):
+        elm, expected_xml = attrs_fixture
+        assert optimized_copy(elm).xml == expected_xml
+
+    def it_removes_empty_optional_elements(self, empty_fixture):
+        elm, expected_xml = empty_fixture
+        assert optimized_copy(elm).xml == expected_xml
+
+    def it_declares_each_namespace_once_on_the_root(self):
+        sp = parse_xml(
+            "<p:sp %s><p:spPr><a:xfrm %s/></p:spPr><p:txBody><a:p %s/>"
+            "</p:txBody></p:sp>" % (nsdecls("p"), nsdecls("a"), nsdecls("a"))
+        )
+        assert optimized_copy(sp).xml == (
+            "<p:sp %s>\n  <p:spPr>\n    <a:xfrm/>\n  </p:spPr>\n  <p:txBody>\n"
+            "    <a:p/>\n  </p:txBody>\n</p:sp>\n" % nsdecls("p", "a")
+        )
+
+    def it_keeps_prefixes_named_by_markup_compatibility_attributes(self):
+        p14_uri = "http://schemas.microsoft.com/office/powerpoint/2010/main"
+        sld = parse_xml(
+            '<p:sld %s><mc:AlternateContent xmlns:mc="http://schemas.openxmlfor'
+            'mats.org/markup-compatibility/2006"><mc:Choice xmlns:p14="%s" Requi'
+            'res="p14"/></mc:AlternateContent></p:sld>' % (nsdecls("p"), p14_uri)
+        )
+        assert optimized_copy(sld).nsmap["p14"] == p14_uri
+
+    def it_does_not_change_the_original_element(self):
+        tc = element("a:tc{gridSpan=1}/a:tcPr")
+        optimized_copy(tc)
+        assert tc.xml == xml("a:tc{gridSpan=1}/a:tcPr")
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(
+        params=[
+            ("a:tc{gridSpan=1,rowSpan=2,hMerge=0}", "a:tc{rowSpan=2}"),
+            ("a:tcPr{marL=91440,marR=0,anchor=ctr}", "a:tcPr{marR=0,anchor=ctr}"),
+            ("a:xfrm{rot=0,flipH=false,flipV=1}", "a:xfrm{flipV=1}"),
+            ("p:cNvPr{id=2,name=Foo,hidden=0}", "p:cNvPr{id=2,name=Foo}"),
+            ("p:ph{type=obj,idx=0,sz=half}", "p:ph{sz=half}"),
+            ("p:ph{type=title,idx=1}", "p:ph{type=title,idx=1}"),
+        ]
+    )
+    def attrs_fixture(self, request):
+        cxml, expected_cxml = request.param
+        return element(cxml), xml(expected_cxml)
+
+    @pytest.fixture(
+        params=[
+            (
+                "a:tc/(a:txBody/(a:bodyPr,a:lstStyle,a:p),a:tcPr)",
+                "a:tc/a:txBody/(a:bodyPr,a:p)",
+            ),
+            ("a:tc/a:tcPr{marL=91440}", "a:tc"),
+            ("a:tc/a:tcPr{marL=0}", "a:tc/a:tcPr{marL=0}"),
+            ("a:p/(a:pPr,a:r/(a:rPr,a:t\"foo\"))", "a:p/a:r/a:t\"foo\""),
+            ("a:p/a:pPr/a:buNone", "a:p/a:pPr/a:buNone"),
+            ("a:prstGeom{prst=rect}/a:avLst", "a:prstGeom{prst=rect}"),
+        ]
+    )
+    def empty_fixture(self, request):
+        cxml, expected_cxml = request.param
+        return element(cxml), xml(expected_cxml)
@@ -17,6 +17,26 @@ class DescribeCT_SlideIdList(object):
         sldIdLst.add_sldId("rId1")
         assert sldIdLst.xml == expected_xml
 
+    def it_can_add_several_sldId_elements_at_once(self):
+        sldIdLst = element("p:sldIdLst/p:sldId{r:id=rId4,id=300}")
+
+        sldIds = sldIdLst.add_sldIds(["rId5", "rId6"])
+
+        assert sldIds == sldIdLst[1:]
+        assert sldIdLst.xml == xml(
+            "p:sldIdLst/(p:sldId{r:id=rId4,id=300},p:sldId{r:id=rId5,id=301},p:"
+            "sldId{r:id=rId6,id=302})"
+        )
+
+    def it_can_reorder_its_sldId_children(self):
+        sldIdLst = element(
+            "p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b},p:sldId{r:id=c})"
+        )
+        sldIdLst.reorder([2, 0, 1])
+        assert sldIdLst.xml == xml(
+            "p:sldIdLst/(p:sldId{r:id=c},p:sldId{r:id=a},p:sldId{r:id=b})"
+        )
+
     def it_knows_the_next_available_slide_id(self, next_id_fixture):
         sldIdLst, expected_id = next_id_fixture
         assert sldIdLst._next_id == expected_id
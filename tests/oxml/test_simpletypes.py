@@ -18,6 +18,7 @@ from pptx.oxml.simpletypes import (
     ST_HexColorRGB,
     ST_Percentage,
 )
+from pptx.util import Emu, Inches
 
 from ..unitutil.mock import method_mock, instance_mock
 
@@ -167,6 +168,24 @@ class DescribeST_Coordinate(object):
         str_value, expected_value = univ_meas_fixture
         assert ST_Coordinate.convert_from_xml(str_value) == expected_value
 
+    def it_reuses_the_value_converted_from_an_xml_string(self):
+        value = ST_Coordinate.from_xml("914400")
+        assert value == 914400
+        assert isinstance(value, Emu)
+        assert ST_Coordinate.from_xml("914400") is value
+
+    def it_converts_an_int_or_length_to_xml_without_full_validation(self):
+        assert ST_Coordinate.to_xml(42) == "42"
+        assert ST_Coordinate.to_xml(Inches(1)) == "914400"
+
+    @pytest.mark.parametrize(
+        "value, exception",
+        ((1.5, TypeError), ("42", TypeError), (27273042316901, ValueError)),
+    )
+    def but_it_validates_other_values_in_full(self, value, exception):
+        with pytest.raises(exception):
+            ST_Coordinate.to_xml(value)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(
@@ -7,7 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import pytest
 
 from pptx.oxml.ns import nsdecls
-from pptx.oxml.table import CT_Table, TcRange
+from pptx.oxml.table import CT_Table, TcFormatStamp, TcRange, TcSpanMap
 
 from ..unitutil.cxml import element
 
@@ -52,6 +52,73 @@ class DescribeCT_Table(object):
         assert tbl.tc(1, 0) is tcs[2]
         assert tbl.tc(1, 1) is tcs[3]
 
+    def it_can_append_rows_of_cell_values(self):
+        tbl = element("a:tbl/(a:tblGrid/(a:gridCol,a:gridCol,a:gridCol),a:tr)")
+
+        trs = tbl.add_trs([("a", 1, None), ["b\nc"]], 42)
+
+        assert tbl.tr_lst[1:] == trs
+        assert [tr.h for tr in trs] == [42, 42]
+        assert [tc.text for tc in trs[0].tc_lst] == ["a", "1", ""]
+        assert [tc.text for tc in trs[1].tc_lst] == ["b\nc", "", ""]
+        assert trs[0].tc_lst[2].txBody.p_lst[0].r_lst == []
+
+    def but_it_raises_when_a_row_has_more_values_than_columns(self):
+        tbl = element("a:tbl/a:tblGrid/a:gridCol")
+        with pytest.raises(ValueError):
+            tbl.add_trs([("a",), ("a", "b")], 42)
+        assert tbl.tr_lst == []
+
+
+class DescribeTcFormatStamp(object):
+    def it_stamps_a_tcPr_onto_cells(self):
+        tc = element("a:tc/(a:txBody/a:p/a:r/a:t\"foo\",a:tcPr{marL=42})")
+        stamp = TcFormatStamp(fill="FF0000", ln=(12700, "00FF00"))
+
+        stamp.apply(tc, (True, False, False, True))
+
+        tcPr = tc.tcPr
+        assert tcPr.marL == 42
+        assert [child.tag.split("}")[1] for child in tcPr] == [
+            "lnL",
+            "lnB",
+            "solidFill",
+        ]
+        assert tc.txBody.p_lst[0].r_lst[0].rPr is None
+
+    def it_builds_each_distinct_tcPr_once(self):
+        tbl = element("a:tbl/a:tr/(a:tc,a:tc,a:tc)")
+        stamp = TcFormatStamp(fill="FF0000", ln=(12700, "00FF00"))
+
+        for tc in tbl.iter_tcs():
+            stamp.apply(tc, (True, True, True, True))
+
+        assert len(stamp._tcPr_protos) == 1
+        tcPrs = [tc.tcPr for tc in tbl.iter_tcs()]
+        assert len(set(id(tcPr) for tcPr in tcPrs)) == 3
+
+    def it_replaces_existing_edges_and_fill(self):
+        tc = element("a:tc/a:tcPr/(a:lnR/a:noFill,a:noFill)")
+        stamp = TcFormatStamp(fill="FF0000", ln=(12700, "00FF00"))
+
+        stamp.apply(tc, (False, True, False, False))
+
+        tcPr = tc.tcPr
+        assert tcPr.lnR.eg_fillProperties.tag.endswith("solidFill")
+        assert tcPr.eg_fillProperties.tag.endswith("solidFill")
+        assert len(tcPr) == 2
+
+    def it_applies_run_formatting(self):
+        tc = element("a:tc/a:txBody/a:p/(a:r/a:t,a:r/(a:rPr{sz=900,i=1},a:t))")
+        stamp = TcFormatStamp(rPr_attrs={"b": "1"}, rPr_fill="0000FF")
+
+        stamp.apply(tc)
+
+        r_lst = tc.txBody.p_lst[0].r_lst
+        assert [r.rPr.get("b") for r in r_lst] == ["1", "1"]
+        assert r_lst[1].rPr.get("i") == "1"
+        assert all(r.rPr.solidFill is not None for r in r_lst)
+
 
 class DescribeTcRange(object):
     def it_knows_when_the_range_contains_a_merged_cell(self, contains_merge_fixture):
@@ -263,3 +330,84 @@ class DescribeTcRange(object):
         tc, other_tc = tcs[tc_idxs[0]], tcs[tc_idxs[1]]
         expected_value = [tcs[idx] for idx in expected_tc_idxs]
         return tc, other_tc, expected_value
+
+
+class DescribeTcSpanMap(object):
+    def it_resolves_the_merge_origin_of_each_grid_cell(self, tbl):
+        span_map = TcSpanMap(tbl)
+
+        assert span_map.origin(0, 0) == (0, 0)
+        assert span_map.origin(1, 1) == (0, 0)
+        assert span_map.origin(2, 2) == (2, 2)
+        assert span_map.origin(-1, 1) == (2, 1)
+        assert span_map.origin_tc(1, 0) is tbl.tc(0, 0)
+        assert span_map.position(tbl.tc(2, 1)) == (2, 1)
+
+    def it_generates_the_tcs_not_spanned_by_a_merge(self, tbl):
+        span_map = TcSpanMap(tbl)
+
+        tcs = list(span_map.iter_real_tcs())
+
+        assert tcs == [tbl.tc(0, 0), tbl.tc(0, 2), tbl.tc(1, 2)] + tbl.tr_lst[2].tc_lst
+
+    def it_knows_when_a_range_contains_a_merged_cell(self, tbl):
+        span_map = TcSpanMap(tbl)
+
+        assert span_map.contains_merged_cell(1, 1, 1, 1) is True
+        assert span_map.contains_merged_cell(2, 0, 1, 3) is False
+        assert span_map.range(tbl.tc(2, 0), tbl.tc(1, 2)).contains_merged_cell
+
+    def it_refreshes_a_range_after_its_merge_state_changes(self, tbl):
+        span_map = TcSpanMap(tbl)
+        tc_range = TcRange.from_merge_origin(tbl.tc(0, 0), span_map)
+        for tc in tc_range.iter_tcs():
+            tc.rowSpan = tc.gridSpan = 1
+            tc.hMerge = tc.vMerge = False
+
+        span_map.refresh(tc_range)
+
+        assert span_map.origin(1, 1) == (1, 1)
+        assert span_map.contains_merged_cell(0, 0, 3, 3) is False
+        assert span_map.is_stale is False
+
+    def it_knows_when_the_table_structure_changed(self, tbl):
+        span_map = TcSpanMap(tbl)
+        assert span_map.is_stale is False
+
+        tbl.add_tr(100)
+
+        assert span_map.is_stale is True
+
+    def and_it_knows_when_cells_were_merged_or_split(self, tbl):
+        span_map = TcSpanMap(tbl)
+
+        tbl.tc(2, 0).gridSpan = 2
+        tbl.tc(2, 1).hMerge = True
+
+        assert span_map.is_stale is True
+
+    def and_it_knows_when_a_change_to_its_table_was_reported(self, tbl):
+        span_map = TcSpanMap(tbl)
+        tr = tbl.tr_lst[0]
+        tbl.remove(tr)
+        tbl.append(tr)
+        assert span_map.is_stale is False
+
+        TcSpanMap.table_changed(tbl)
+
+        assert span_map.is_stale is True
+
+    def but_it_raises_on_a_grid_position_out_of_range(self, tbl):
+        with pytest.raises(IndexError):
+            TcSpanMap(tbl).origin(3, 0)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def tbl(self):
+        return element(
+            "a:tbl/(a:tblGrid/(a:gridCol,a:gridCol,a:gridCol),"
+            "a:tr/(a:tc{gridSpan=2,rowSpan=2},a:tc{rowSpan=2,hMerge=1},a:tc),"
+            "a:tr/(a:tc{gridSpan=2,vMerge=1},a:tc{hMerge=1,vMerge=1},a:tc),"
+            "a:tr/(a:tc,a:tc,a:tc))"
+        )
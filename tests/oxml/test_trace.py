@@ -0,0 +1,84 @@
+# encoding: utf-8
+
+"""Unit-test suite for pptx.oxml.trace module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import io
+
+import pytest
+
+from pptx.oxml import trace
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.oxml.simpletypes import XsdUnsignedInt
+from pptx.oxml.xmlchemy import BaseOxmlElement, OptionalAttribute, ZeroOrOne
+
+from ..unitutil.cxml import element
+
+
+class DescribeTrace(object):
+    def it_counts_xpath_calls_by_expression_and_api(self, tracing):
+        sp = element("p:sp/p:spPr")
+        for _ in range(3):
+            sp.xpath("./p:spPr")
+
+        (record,) = trace.records()
+
+        assert record.target == "xpath ./p:spPr"
+        assert record.api.endswith(".it_counts_xpath_calls_by_expression_and_api")
+        assert record.calls == 3
+        assert record.total_ms > 0.0
+
+    def it_counts_generated_accessor_calls(self, tracing):
+        sp = element("p:sp/p:spPr")
+        sp.spPr.get_or_add_xfrm()
+
+        targets = set(record.target for record in trace.records())
+
+        assert "CT_Shape.spPr" in targets
+        assert "CT_ShapeProperties.get_or_add_xfrm()" in targets
+
+    def it_traces_element_classes_created_after_it_is_enabled(self, tracing):
+        class CT_Traced(BaseOxmlElement):
+            foo = ZeroOrOne("p:foo")
+            bar = OptionalAttribute("bar", XsdUnsignedInt)
+
+        traced = CT_Traced()
+        traced.foo
+        traced.bar = 42
+
+        targets = set(record.target for record in trace.records())
+        assert targets == {"CT_Traced.foo", "CT_Traced.bar (set)"}
+
+    def it_restores_the_original_accessors_when_disabled(self):
+        spPr, xpath = CT_Shape.__dict__["spPr"], BaseOxmlElement.__dict__["xpath"]
+        trace.enable()
+        assert CT_Shape.__dict__["spPr"] is not spPr
+
+        trace.disable()
+
+        assert CT_Shape.__dict__["spPr"] is spPr
+        assert BaseOxmlElement.__dict__["xpath"] is xpath
+        assert not trace.is_enabled()
+
+    def it_can_print_a_report(self, tracing):
+        element("p:sp/p:spPr").xpath("./p:spPr")
+        file = io.StringIO()
+
+        trace.report(file=file)
+
+        lines = file.getvalue().splitlines()
+        assert lines[1].split()[1:] == ["1", "xpath", "./p:spPr"]
+        assert lines[2].split()[1] == "1"
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def tracing(self, request):
+        def fin():
+            trace.disable()
+            trace.reset()
+
+        request.addfinalizer(fin)
+        trace.reset()
+        trace.enable()
@@ -14,6 +14,7 @@ from pptx.exc import InvalidXmlError
 from pptx.oxml import register_element_cls
 from pptx.oxml.ns import qn
 from pptx.oxml.simpletypes import BaseIntType
+from pptx.oxml import xmlchemy
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement,
     Choice,
@@ -33,6 +34,23 @@ class DescribeCustomElementClass(object):
     def it_has_the_MetaOxmlElement_metaclass(self):
         assert type(CT_Parent).__name__ == "MetaOxmlElement"
 
+    def it_evaluates_xpath_with_a_compiled_expression(self):
+        parent = a_parent().with_nsdecls().with_child(a_zomChild()).element
+        xpath_str = "./p:zomChild"
+
+        assert len(parent.xpath(xpath_str)) == 1
+        assert xpath_str in xmlchemy._xpath_cache
+        assert parent.xpath(xpath_str)[0] is parent.zomChild_lst[0]
+
+    def but_it_stops_caching_xpath_expressions_past_the_limit(self, monkeypatch):
+        monkeypatch.setattr(xmlchemy, "_xpath_cache", {})
+        monkeypatch.setattr(xmlchemy, "_XPATH_CACHE_LIMIT", 1)
+        parent = a_parent().with_nsdecls().element
+
+        assert parent.xpath("count(./p:zomChild)") == 0.0
+        assert parent.xpath("count(./p:zooChild)") == 0.0
+        assert list(xmlchemy._xpath_cache) == ["count(./p:zomChild)"]
+
 
 class DescribeChoice(object):
     def it_adds_a_getter_property_for_the_choice_element(self, getter_fixture):
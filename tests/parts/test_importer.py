@@ -0,0 +1,237 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.parts.importer module
+"""
+
+from __future__ import absolute_import, print_function
+
+import pickle
+
+import pytest
+
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.importer import SlideImporter, SlideShard
+from pptx.parts.slide import SlidePart
+from pptx.util import Inches
+
+from ..unitutil.file import testfile
+
+
+class DescribeSlideImporter(object):
+    def it_copies_slides_along_with_their_related_parts(self):
+        src = Presentation()
+        slide = src.slides.add_slide(src.slide_layouts[1])
+        slide.shapes.add_picture(testfile("monty-truth.png"), 0, 0)
+        slide.notes_slide.notes_text_frame.text = "notes"
+        dest = Presentation()
+        dest_slide = dest.slides.add_slide(dest.slide_layouts[6])
+        dest_slide.shapes.add_picture(testfile("monty-truth.png"), 0, 0)
+        importer = SlideImporter(dest.part)
+
+        (slide_part,) = importer.import_slides([slide.part])
+
+        assert isinstance(slide_part, SlidePart)
+        assert slide_part is not slide.part
+        assert slide_part.package is dest.part.package
+        assert slide_part._element is not slide.part._element
+        assert slide_part.slide_layout == dest.slide_layouts[1]
+        src_rId = slide.shapes[-1]._element.blip_rId
+        dest_rId = dest_slide.shapes[0]._element.blip_rId
+        image_part = dest_slide.part.related_parts[dest_rId]
+        assert slide_part.related_parts[src_rId] is image_part
+        notes_slide = slide_part.notes_slide
+        assert notes_slide.notes_text_frame.text == "notes"
+        assert notes_slide.part.part_related_by(RT.SLIDE) is slide_part
+        assert notes_slide.part.part_related_by(RT.NOTES_MASTER) is (
+            dest.part.notes_master_part
+        )
+
+    def it_copies_a_slide_master_having_no_match(self):
+        src = Presentation(testfile("test.pptx"))
+        dest = Presentation()
+        master_ids = dest.part._element.xpath("//p:sldMasterId/@id")
+        layout_ids = dest.slide_masters[0]._element.xpath("//p:sldLayoutId/@id")
+
+        (slide_part,) = SlideImporter(dest.part).import_slides([src.slides[0].part])
+
+        assert len(dest.slide_masters) == 2
+        new_master = dest.slide_masters[1]
+        assert slide_part.slide_layout in list(new_master.slide_layouts)
+        assert len(new_master.slide_layouts) == len(src.slide_masters[0].slide_layouts)
+        new_ids = dest.part._element.xpath("//p:sldMasterId/@id")
+        new_ids += new_master._element.xpath("//p:sldLayoutId/@id")
+        assert len(set(new_ids)) == len(new_ids)
+        assert min(int(id_) for id_ in new_ids[len(master_ids):]) > max(
+            int(id_) for id_ in master_ids + layout_ids
+        )
+
+    def it_copies_a_changed_layout_into_the_matching_master(self):
+        src = Presentation()
+        src_layout = src.slide_layouts[6]
+        src_layout.name = "Changed"
+        slide = src.slides.add_slide(src_layout)
+        dest = Presentation()
+        layout_count = len(dest.slide_layouts)
+
+        (slide_part,) = SlideImporter(dest.part).import_slides([slide.part])
+
+        assert len(dest.slide_masters) == 1
+        assert len(dest.slide_layouts) == layout_count + 1
+        assert slide_part.slide_layout == dest.slide_layouts[-1]
+        assert dest.slide_layouts[-1].name == "Changed"
+
+    def it_can_use_the_slide_layouts_it_is_given(self):
+        src = Presentation()
+        slide = src.slides.add_slide(src.slide_layouts[1])
+        dest = Presentation()
+        importer = SlideImporter(dest.part)
+        layout_parts = {slide.part.slide_layout.part: dest.slide_layouts[4].part}
+
+        (slide_part,) = importer.import_slides([slide.part], layout_parts)
+
+        assert slide_part.slide_layout == dest.slide_layouts[4]
+        assert importer._masters_by_hash is None
+
+    def it_removes_hyperlinks_to_slides_not_imported(self):
+        src = Presentation()
+        layout = src.slide_layouts[6]
+        slides = [src.slides.add_slide(layout) for _ in range(3)]
+        for slide, target in ((slides[0], slides[1]), (slides[1], slides[2])):
+            textbox = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1))
+            textbox.click_action.target_slide = target
+        dest = Presentation()
+
+        new_slide_parts = SlideImporter(dest.part).import_slides(
+            [slides[0].part, slides[1].part]
+        )
+
+        click_actions = [
+            slide_part.slide.shapes[0].click_action for slide_part in new_slide_parts
+        ]
+        assert click_actions[0].target_slide.part is new_slide_parts[1]
+        assert click_actions[1].hyperlink.address is None
+        assert new_slide_parts[1].slide.shapes[0]._element.xpath(
+            ".//a:hlinkClick"
+        ) == []
+
+    def it_gives_each_copy_of_a_repeated_slide_its_own_notes(self):
+        src = Presentation()
+        slide = src.slides.add_slide(src.slide_layouts[1])
+        slide.shapes.add_picture(testfile("monty-truth.png"), 0, 0)
+        slide.notes_slide.notes_text_frame.text = "notes"
+        dest = Presentation()
+
+        slide_parts = SlideImporter(dest.part).import_slides([slide.part] * 2)
+
+        notes_parts = [p.part_related_by(RT.NOTES_SLIDE) for p in slide_parts]
+        assert notes_parts[0] is not notes_parts[1]
+        assert [p.part_related_by(RT.SLIDE) for p in notes_parts] == slide_parts
+        assert notes_parts[1].notes_slide.notes_text_frame.text == "notes"
+        rId = slide.shapes[-1]._element.blip_rId
+        assert slide_parts[0].related_parts[rId] is slide_parts[1].related_parts[rId]
+
+    def it_can_import_slides_serialized_in_shards(self):
+        shards = []
+        for title in ("first", "second"):
+            src = Presentation()
+            slides = [src.slides.add_slide(src.slide_layouts[1]) for _ in range(2)]
+            for slide in slides:
+                slide.shapes.title.text = title
+                slide.shapes.add_picture(testfile("monty-truth.png"), 0, 0)
+            slides[0].notes_slide.notes_text_frame.text = "%s notes" % title
+            slides[1].shapes.title.click_action.target_slide = slides[0]
+            shards.append(SlideShard([slide.part for slide in slides]))
+        # ---the second shard lacks the slide its hyperlink jumps to---
+        shards[1] = SlideShard([slides[1].part])
+        dest = Presentation()
+        importer = SlideImporter(dest.part)
+
+        slide_parts = importer.import_shard(shards[0])
+        slide_parts += importer.import_shard(shards[1])
+
+        assert [slide_part.partname for slide_part in slide_parts] == [
+            "/ppt/slides/slide1.xml",
+            "/ppt/slides/slide2.xml",
+            "/ppt/slides/slide3.xml",
+        ]
+        slides = [slide_part.slide for slide_part in slide_parts]
+        assert [slide.shapes.title.text for slide in slides] == [
+            "first",
+            "first",
+            "second",
+        ]
+        assert slides[0].slide_layout == dest.slide_layouts[1]
+        assert slides[0].notes_slide.notes_text_frame.text == "first notes"
+        assert slides[0].notes_slide.part.part_related_by(RT.NOTES_MASTER) is (
+            dest.part.notes_master_part
+        )
+        assert len(set(slide.shapes[-1].image.sha1 for slide in slides)) == 1
+        image_parts = set(
+            slide.part.related_parts[slide.shapes[-1]._element.blip_rId]
+            for slide in slides
+        )
+        assert len(image_parts) == 1
+        assert slides[1].shapes.title.click_action.target_slide.part is (
+            slide_parts[0]
+        )
+        assert slides[2].shapes.title.click_action.hyperlink.address is None
+        assert slides[2].shapes[0]._element.xpath(".//a:hlinkClick") == []
+
+    def but_it_raises_on_a_shard_using_a_layout_not_in_the_template(self):
+        src = Presentation()
+        shard = SlideShard([src.slides.add_slide(src.slide_layouts[0]).part])
+        dest = Presentation()
+        dest.slide_layouts.remove(dest.slide_layouts[0])
+
+        with pytest.raises(ValueError):
+            SlideImporter(dest.part).import_shard(shard)
+
+    @pytest.mark.parametrize(
+        "src_partname, expected_partname",
+        (
+            ("/ppt/slides/slide7.xml", "/ppt/slides/slide2.xml"),
+            ("/ppt/media/image12.png", "/ppt/media/image1.png"),
+            ("/ppt/embeddings/data.bin", "/ppt/embeddings/data1.bin"),
+            ("/ppt/tags/tag9", "/ppt/tags/tag1"),
+        ),
+    )
+    def it_names_each_copy_with_the_next_free_number(
+        self, src_partname, expected_partname
+    ):
+        dest = Presentation()
+        dest.slides.add_slide(dest.slide_layouts[0])
+        importer = SlideImporter(dest.part)
+
+        partname = importer._next_partname(PackURI(src_partname))
+
+        assert partname == expected_partname
+        assert importer._next_partname(PackURI(src_partname)) != partname
+
+
+class DescribeSlideShard(object):
+    def it_serializes_slides_and_the_parts_they_depend_on(self):
+        prs = Presentation()
+        slides = [prs.slides.add_slide(prs.slide_layouts[6]) for _ in range(2)]
+        for slide in slides:
+            slide.shapes.add_picture(testfile("monty-truth.png"), 0, 0)
+        slides[1].notes_slide.notes_text_frame.text = "notes"
+
+        shard = pickle.loads(pickle.dumps(SlideShard([s.part for s in slides])))
+
+        assert shard.slide_partnames == [s.part.partname for s in slides]
+        assert [record[0] for record in shard.parts] == [
+            slides[0].part.partname,
+            slides[1].part.partname,
+            "/ppt/media/image1.png",
+            "/ppt/notesSlides/notesSlide1.xml",
+        ]
+        image_part = slides[0].shapes[0].image
+        assert shard.parts[2][2:4] == (image_part.sha1, None)
+        assert shard.blobs == {image_part.sha1: image_part.blob}
+        assert shard.parts[0][3] == slides[0].part.blob
+        assert ("rId1", RT.SLIDE_LAYOUT, prs.slide_layouts[6].part.partname, False) in (
+            shard.parts[0][4]
+        )
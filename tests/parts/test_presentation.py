@@ -8,7 +8,9 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
+from pptx.api import Presentation as Presentation_
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import WrittenPart
 from pptx.opc.packuri import PackURI
 from pptx.package import Package
 from pptx.parts.coreprops import CorePropertiesPart
@@ -18,7 +20,14 @@ from pptx.presentation import Presentation
 from pptx.slide import NotesMaster, Slide, SlideLayout, SlideMaster
 
 from ..unitutil.cxml import element
-from ..unitutil.mock import call, class_mock, instance_mock, method_mock, property_mock
+from ..unitutil.mock import (
+    call,
+    class_mock,
+    instance_mock,
+    method_mock,
+    Mock,
+    property_mock,
+)
 
 
 class DescribePresentationPart(object):
@@ -84,10 +93,32 @@ class DescribePresentationPart(object):
         assert getitem_.call_args_list == calls
         assert [sp.partname for sp in slide_parts] == expected_names
 
+    def it_names_slide_parts_in_presentation_order_before_saving(self, request):
+        rename_slide_parts_ = method_mock(
+            request, PresentationPart, "rename_slide_parts", autospec=True
+        )
+        prs_part = PresentationPart(
+            PackURI("/ppt/presentation.xml"),
+            None,
+            element(
+                "p:presentation/p:sldIdLst/(p:sldId{r:id=rId3},p:sldId{r:id=rId1})"
+            ),
+        )
+        prs_part.load_rel(RT.SLIDE, "slide-1", "rId1")
+        prs_part.load_rel(RT.SLIDE_MASTER, "master", "rId2")
+        prs_part.load_rel(RT.SLIDE, "slide-3", "rId3")
+        prs_part.load_rel(RT.SLIDE, "removed-slide", "rId4")
+
+        prs_part.before_marshal()
+
+        rename_slide_parts_.assert_called_once_with(
+            prs_part, ["rId3", "rId1", "rId4"]
+        )
+
     def it_can_save_the_package_to_a_file(self, save_fixture):
         prs_part, file_, package_ = save_fixture
         prs_part.save(file_)
-        package_.save.assert_called_once_with(file_)
+        package_.save.assert_called_once_with(file_, False, None, False)
 
     def it_can_add_a_new_slide(self, add_slide_fixture):
         prs_part, slide_layout_, SlidePart_, partname = add_slide_fixture[:4]
@@ -116,6 +147,197 @@ class DescribePresentationPart(object):
         slide = prs_part.get_slide(slide_id)
         assert slide == expected_value
 
+    def it_knows_the_position_of_a_slide_part(self, related_parts_prop_):
+        prs_elm = element(
+            "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id="
+            "b,id=257})"
+        )
+        prs_part = PresentationPart(None, None, prs_elm)
+        slide_parts = [SlidePart(None, None, element("p:sld")) for _ in range(3)]
+        related_parts_prop_.return_value = {"a": slide_parts[0], "b": slide_parts[1]}
+
+        assert prs_part.slide_position(slide_parts[1]) == 1
+        copy = SlidePart(None, None, slide_parts[0]._element)
+        assert prs_part.slide_position(copy) == 0
+        with pytest.raises(ValueError):
+            prs_part.slide_position(slide_parts[2])
+
+    def it_keeps_its_slide_index_current(self, related_parts_prop_):
+        prs_elm = element(
+            "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id="
+            "b,id=257})"
+        )
+        prs_part = PresentationPart(None, None, prs_elm)
+        related_parts = {"a": "part-a", "b": "part-b", "c": "part-c"}
+        related_parts_prop_.return_value = related_parts
+        slide_id_index = prs_part._slide_id_index
+
+        sldIdLst = prs_elm.sldIdLst
+        prs_part.slide_appended(sldIdLst.add_sldId("c"))
+        assert prs_part._slide_id_index is slide_id_index
+        assert prs_part.slide_id("part-c") == 258
+
+        slide_id_index = prs_part._slide_id_index
+        prs_part.slides_reordered()
+        assert prs_part._slide_id_index is not slide_id_index
+
+        slide_id_index = prs_part._slide_id_index
+        sldIdLst.remove(sldIdLst[0])
+        assert prs_part._slide_id_index is not slide_id_index
+        assert prs_part.slide_position("part-c") == 1
+        assert prs_part.get_slide(256) is None
+
+    def and_it_updates_its_slide_index_on_insert_and_remove(
+        self, related_parts_prop_
+    ):
+        prs_elm = element(
+            "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id="
+            "b,id=257},p:sldId{r:id=c,id=258})"
+        )
+        prs_part = PresentationPart(None, None, prs_elm)
+        related_parts_prop_.return_value = {
+            "a": "part-a", "b": "part-b", "c": "part-c", "d": "part-d"
+        }
+        slide_id_index = prs_part._slide_id_index
+        sldIdLst = prs_elm.sldIdLst
+
+        sldId = sldIdLst[1]
+        sldIdLst.remove(sldId)
+        prs_part.slide_removed(sldId, 1)
+        sldId = sldIdLst.add_sldId("d")
+        sldIdLst.insert(0, sldId)
+        prs_part.slide_inserted(sldId)
+
+        assert prs_part._slide_id_index is slide_id_index
+        assert [prs_part.slide_position(p) for p in ("part-d", "part-a", "part-c")] == [
+            0, 1, 2
+        ]
+        assert prs_part.slide_id("part-d") == 259
+        with pytest.raises(ValueError):
+            prs_part.slide_id("part-b")
+
+    def it_keeps_its_slide_index_as_slides_are_inserted_and_removed(self):
+        prs = Presentation_()
+        layout = prs.slide_layouts[6]
+        slides = [prs.slides.add_slide(layout) for _ in range(6)]
+        prs_part = prs.part
+        slide_id_index = prs_part._slide_id_index
+
+        prs.slides.remove_slide(slides[1])
+        prs.slides.remove_slide(-1)
+        prs.slides.insert_slide(0, slides[3])
+        prs.slides.remove_slide(2)
+
+        assert prs_part._slide_id_index is slide_id_index
+        slide_parts = [slide.part for slide in prs.slides]
+        assert len(slide_parts) == 4
+        assert [prs_part.slide_position(p) for p in slide_parts] == [0, 1, 2, 3]
+        assert [prs_part.slide_id(p) for p in slide_parts] == [
+            sldId.id for sldId in prs_part._element.sldIdLst
+        ]
+
+    def and_it_notices_a_new_first_or_last_slide_in_the_xml(self):
+        prs = Presentation_()
+        slides = [prs.slides.add_slide(prs.slide_layouts[6]) for _ in range(4)]
+        assert [prs.slides.index(slide) for slide in slides] == [0, 1, 2, 3]
+
+        sldIdLst = prs.part._element.sldIdLst
+        sldIdLst.insert(0, sldIdLst[2])
+
+        assert [prs.slides.index(slide) for slide in prs.slides] == [0, 1, 2, 3]
+        assert [prs.slides.index(slide) for slide in slides] == [1, 2, 0, 3]
+
+    def but_it_needs_a_reset_after_other_reorders_in_the_xml(self):
+        prs = Presentation_()
+        slides = [prs.slides.add_slide(prs.slide_layouts[6]) for _ in range(4)]
+        prs_part = prs.part
+        slide_id_index = prs_part._slide_id_index
+
+        sldIdLst = prs_part._element.sldIdLst
+        sldIdLst.insert(1, sldIdLst[2])
+        assert prs_part._slide_id_index is slide_id_index
+
+        prs_part.slides_reordered()
+
+        assert [prs.slides.index(slide) for slide in slides] == [0, 2, 1, 3]
+
+    def it_knows_the_slides_based_on_each_slide_layout(self):
+        prs = Presentation_()
+        layouts = prs.slide_layouts
+        slides = [prs.slides.add_slide(layouts[idx]) for idx in (1, 6, 1)]
+        prs_part = prs.part
+
+        assert prs_part.slides_using(layouts[1].part) == (slides[0], slides[2])
+        assert prs_part.slides_using(layouts[2].part) == ()
+
+        slides.append(prs.slides.add_slide(layouts[1]))
+        prs.slides.remove_slide(0)
+
+        assert prs_part.slides_using(layouts[1].part) == (slides[2], slides[3])
+        assert prs_part.slides_using(layouts[6].part) == (slides[1],)
+
+    def it_can_import_slides_from_another_presentation(
+        self, request, slide_part_, slide_
+    ):
+        SlideImporter_ = class_mock(request, "pptx.parts.presentation.SlideImporter")
+        importer_ = SlideImporter_.return_value
+        importer_.import_slides.return_value = [slide_part_]
+        slide_part_.slide = slide_
+        prs_part = PresentationPart(PackURI("/ppt/presentation.xml"), None, None)
+        prs_part.rels.add_relationship(RT.SLIDE_MASTER, "master-part", "rId1")
+
+        imported = prs_part.import_slides(["src-slide-part"], {"a": "b"})
+
+        SlideImporter_.assert_called_once_with(prs_part)
+        importer_.import_slides.assert_called_once_with(["src-slide-part"], {"a": "b"})
+        assert prs_part.related_parts["rId2"] is slide_part_
+        assert imported == [("rId2", slide_)]
+
+    def it_can_import_slides_serialized_in_shards(
+        self, request, slide_part_, slide_
+    ):
+        SlideImporter_ = class_mock(request, "pptx.parts.presentation.SlideImporter")
+        importer_ = SlideImporter_.return_value
+        importer_.import_shard.side_effect = [[slide_part_], [slide_part_]]
+        slide_part_.slide = slide_
+        prs_part = PresentationPart(PackURI("/ppt/presentation.xml"), None, None)
+
+        imported = prs_part.import_shards(iter(["shard-1", "shard-2"]))
+
+        SlideImporter_.assert_called_once_with(prs_part)
+        assert importer_.import_shard.call_args_list == [
+            call("shard-1"),
+            call("shard-2"),
+        ]
+        assert imported == [("rId1", slide_), ("rId2", slide_)]
+
+    def it_can_stream_slides_to_a_package_writer(self):
+        prs = Presentation_()
+        layout = prs.slide_layouts[6]
+        slides = [prs.slides.add_slide(layout) for _ in range(2)]
+        slides[1].notes_slide.notes_text_frame.text = "notes"
+        prs_part = prs.part
+        prs_part.related_parts[prs_part._element.sldIdLst[1].rId].partname = (
+            PackURI("/ppt/slides/slide9.xml")
+        )
+        pkg_writer_ = Mock(name="pkg_writer")
+
+        prs_part.stream_slides([slides[1].part], pkg_writer_)
+
+        written = [c[1][0] for c in pkg_writer_.write_part.mock_calls]
+        assert [part.partname for part in written] == [
+            "/ppt/notesSlides/notesSlide1.xml",
+            "/ppt/slides/slide2.xml",
+        ]
+        slide_part = prs_part.related_parts[prs_part._element.sldIdLst[1].rId]
+        assert isinstance(slide_part, WrittenPart)
+        assert slide_part.partname == "/ppt/slides/slide2.xml"
+        notes_part = slide_part.part_related_by(RT.NOTES_SLIDE)
+        assert isinstance(notes_part, WrittenPart)
+        assert notes_part.part_related_by(RT.SLIDE) is slide_part
+        assert slide_part.part_related_by(RT.SLIDE_LAYOUT) is layout.part
+        assert prs_part.get_slide(prs_part._element.sldIdLst[0].id) == slides[0]
+
     def it_knows_the_next_slide_partname_to_help(self, next_fixture):
         prs_part, partname = next_fixture
         assert prs_part._next_slide_partname == partname
@@ -8,6 +8,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from pptx.api import Presentation
 from pptx.chart.data import ChartData
 from pptx.enum.base import EnumValue
 from pptx.media import Video
@@ -29,6 +30,7 @@ from pptx.parts.slide import (
     SlideMasterPart,
     SlidePart,
 )
+from pptx.shapes.shapetree import SlideShapes
 from pptx.slide import NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
 
 from ..unitutil.cxml import element
@@ -471,6 +473,14 @@ class DescribeSlidePart(object):
         )
         assert isinstance(slide_part, SlidePart)
 
+    def and_it_can_create_one_having_a_given_slide_element(self, new_fixture):
+        slide_layout_part_, partname, package_, SlidePart_init_ = new_fixture[:4]
+        sld = element("p:sld")
+
+        SlidePart.new(partname, package_, slide_layout_part_, sld)
+
+        SlidePart_init_.assert_called_once_with(partname, CT.PML_SLIDE, sld, package_)
+
     def it_provides_access_to_its_slide(self, slide_fixture):
         slide_part, Slide_, sld, slide_ = slide_fixture
         slide = slide_part.slide
@@ -707,6 +717,38 @@ class DescribeSlideLayoutPart(object):
         SlideLayout_.assert_called_once_with(sldLayout, slide_layout_part)
         assert slide_layout is slide_layout_
 
+    def it_keeps_the_placeholders_of_a_new_slide_ready(self):
+        prs = Presentation()
+        slide_layout = prs.slide_layouts[1]
+        slide_layout_part = slide_layout.part
+        spTree = CT_Slide.new().cSld.spTree
+        shapes = SlideShapes(spTree, None)
+        for placeholder in slide_layout.iter_cloneable_placeholders():
+            shapes.clone_placeholder(placeholder)
+        new_spTree = CT_Slide.new().cSld.spTree
+
+        sps = slide_layout_part.new_placeholder_sps()
+
+        new_spTree.extend(sps)
+        assert new_spTree.xml == spTree.xml
+        assert len(sps) == 2
+        assert slide_layout_part.new_placeholder_sps()[0] is not sps[0]
+
+    def and_it_clones_them_again_when_a_layout_placeholder_changes(self):
+        prs = Presentation()
+        slide_layout = prs.slide_layouts[1]
+        slide_layout_part = slide_layout.part
+        slide_layout_part.new_placeholder_sps()
+
+        slide_layout.placeholders[1].element.ph.idx = 42
+        sps = slide_layout_part.new_placeholder_sps()
+
+        assert sps[1].ph_idx == 42
+        slide_layout.placeholders[1].element.getparent().remove(
+            slide_layout.placeholders[1].element
+        )
+        assert len(slide_layout_part.new_placeholder_sps()) == 1
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -760,6 +802,36 @@ class DescribeSlideMasterPart(object):
         getitem_.assert_called_once_with(rId)
         assert slide_layout is slide_layout_
 
+    def it_indexes_its_slide_layouts_by_name_and_position(self):
+        prs = Presentation()
+        slide_master = prs.slide_masters[0]
+        slide_master_part = slide_master.part
+        slide_layouts = list(slide_master.slide_layouts)
+
+        assert slide_master_part.slide_layout_named("Title Only") == slide_layouts[5]
+        assert slide_master_part.slide_layout_named("Foobar") is None
+        assert slide_master_part.slide_layout_position(slide_layouts[3].part) == 3
+
+        slide_layouts[3].name = "Foobar"
+        slide_master.slide_layouts.remove(slide_layouts[0])
+
+        assert slide_master_part.slide_layout_named("Foobar") == slide_layouts[3]
+        assert slide_master_part.slide_layout_position(slide_layouts[3].part) == 2
+        assert slide_master_part.slide_layout_position(slide_layouts[0].part) is None
+
+    def and_it_finds_slide_layouts_renamed_through_their_xml(self):
+        prs = Presentation()
+        slide_master_part = prs.slide_masters[0].part
+        slide_layouts = list(prs.slide_layouts)
+        assert slide_master_part.slide_layout_named("Bar") is None
+        assert slide_master_part.slide_layout_named("Title Only") == slide_layouts[5]
+
+        slide_layouts[2]._element.cSld.name = "Bar"
+        slide_layouts[5]._element.cSld.name = "Baz"
+
+        assert slide_master_part.slide_layout_named("Bar") == slide_layouts[2]
+        assert slide_master_part.slide_layout_named("Title Only") is None
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
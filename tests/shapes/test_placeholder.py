@@ -8,6 +8,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from pptx.api import Presentation
 from pptx.chart.data import ChartData
 from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
 from pptx.oxml.shapes.shared import ST_Direction, ST_PlaceholderSize
@@ -24,6 +25,7 @@ from pptx.shapes.placeholder import (
     PicturePlaceholder,
     PlaceholderGraphicFrame,
     PlaceholderPicture,
+    resolve_geometry,
     TablePlaceholder,
 )
 from pptx.shapes.shapetree import NotesSlidePlaceholders
@@ -652,3 +654,31 @@ class DescribeTablePlaceholder(object):
     @pytest.fixture
     def _replace_placeholder_with_(self, request):
         return method_mock(request, TablePlaceholder, "_replace_placeholder_with")
+
+
+class Describe_resolve_geometry(object):
+    def it_resolves_the_geometry_of_each_placeholder_of_each_slide(self):
+        prs = Presentation()
+        slides = [prs.slides.add_slide(prs.slide_layouts[idx]) for idx in (1, 1, 5)]
+        slides[1].placeholders[1].left = 42
+        slides[1].placeholders[1].width = 24
+
+        geometries = resolve_geometry(slides)
+
+        assert geometries == [
+            dict(
+                (ph.placeholder_format.idx, (ph.left, ph.top, ph.width, ph.height))
+                for ph in slide.placeholders
+            )
+            for slide in slides
+        ]
+        assert geometries[1][1][0] == 42
+        assert geometries[1][1][2] == 24
+        layout_body = prs.slide_layouts[1].placeholders.get(1)
+        assert geometries[0][1] == (
+            layout_body.left,
+            layout_body.top,
+            layout_body.width,
+            layout_body.height,
+        )
+        assert len(geometries[2]) == 1
@@ -10,6 +10,7 @@ from pptx.compat import BytesIO
 from pptx.chart.data import ChartData
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_CONNECTOR, PP_PLACEHOLDER
 from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.groupshape import CT_GroupShape
 from pptx.oxml.shapes.picture import CT_Picture
@@ -51,8 +52,9 @@ from pptx.shapes.shapetree import (
     SlideShapeFactory,
     SlideShapes,
 )
-from pptx.slide import SlideLayout, SlideMaster
+from pptx.slide import Slide, SlideLayout, SlideMaster
 from pptx.table import Table
+from pptx.virtual.table import Table as VirtualTable
 
 from ..oxml.unitdata.shape import a_ph, a_pic, an_nvPr, an_nvSpPr, an_sp
 from ..unitutil.cxml import element, xml
@@ -1254,11 +1256,70 @@ class DescribeSlideShapes(object):
         assert table is table_
         assert shapes._element.xml == expected_xml
 
+    @pytest.mark.parametrize("i, expected_idx", ((0, 2), (1, 3), (-1, 3), (9, 4)))
+    def it_can_insert_a_virtual_table(self, i, expected_idx):
+        spTree = element(
+            "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:grpSpPr,p:sp/p:nvSpPr/p:cNvP"
+            "r{id=2},p:sp/p:nvSpPr/p:cNvPr{id=3},p:extLst)"
+        )
+        shapes = SlideShapes(spTree, None)
+
+        graphic_frame = shapes.insert_table(i, VirtualTable(2, 2, 0, 0, 100, 100))
+
+        assert spTree.index(graphic_frame._element) == expected_idx
+        assert spTree[-1].tag == qn("p:extLst")
+        assert graphic_frame.has_table
+        assert (graphic_frame.shape_id, graphic_frame.name) == (4, "Table 3")
+
+    def it_can_insert_a_copy_of_a_table_graphic_frame(self):
+        spTree = element("p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:grpSpPr)")
+        shapes = SlideShapes(spTree, None)
+        table = shapes.add_table(2, 2, 0, 0, 100, 100)
+
+        graphic_frame = shapes.insert_table(0, table)
+
+        assert spTree[2] is graphic_frame._element
+        assert spTree[3] is table._element
+        assert (graphic_frame.shape_id, graphic_frame.name) == (3, "Table 2")
+
+    def it_can_append_a_virtual_table(self, request):
+        spTree = element(
+            "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:grpSpPr,p:sp/p:nvSpPr/p:cNvP"
+            "r{id=7},p:extLst)"
+        )
+        slide_ = instance_mock(request, Slide)
+        slide_.shapes = SlideShapes(spTree, None)
+
+        graphic_frame = VirtualTable(1, 3, 0, 0, 300, 100).append_to(slide_)
+
+        assert spTree[3] is graphic_frame._element
+        assert spTree[4].tag == qn("p:extLst")
+        assert (graphic_frame.shape_id, graphic_frame.name) == (8, "Table 7")
+        assert len(graphic_frame.table.columns) == 3
+
     def it_can_clone_placeholder_shapes_from_a_layout(self, clone_fixture):
         shapes, slide_layout_, calls = clone_fixture
         shapes.clone_layout_placeholders(slide_layout_)
         assert shapes.clone_placeholder.call_args_list == calls
 
+    def it_copies_placeholders_ready_made_by_the_layout_to_a_blank_slide(
+        self, slide_layout_
+    ):
+        spTree = element("p:spTree/p:nvGrpSpPr/p:cNvPr{id=1}")
+        shapes = SlideShapes(spTree, None)
+        layout_part_ = slide_layout_.part
+        layout_part_.new_placeholder_sps.return_value = [
+            element("p:sp/p:nvSpPr/p:cNvPr{id=2,name=Title 1}")
+        ]
+
+        shapes.clone_layout_placeholders(slide_layout_)
+
+        layout_part_.new_placeholder_sps.assert_called_once_with()
+        assert spTree.xml == xml(
+            "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=2,name=T"
+            "itle 1})"
+        )
+
     def it_adds_a_video_timing_to_help(self, add_timing_fixture):
         shapes, pic, sld, expected_xml = add_timing_fixture
         shapes._add_video_timing(pic)
@@ -1285,7 +1346,7 @@ class DescribeSlideShapes(object):
 
     @pytest.fixture
     def clone_fixture(self, slide_layout_, clone_placeholder_, placeholder_):
-        shapes = SlideShapes(None, None)
+        shapes = SlideShapes(element("p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2}"), None)
         calls = [call(shapes, placeholder_)]
         slide_layout_.iter_cloneable_placeholders.return_value = iter([placeholder_])
         return shapes, slide_layout_, calls
@@ -1546,11 +1607,71 @@ class DescribeLayoutPlaceholders(object):
         placeholders, default = default_fixture
         assert placeholders.get(42, default) is default
 
+    def it_iterates_its_placeholders_only_when_they_change(self, request):
+        sldLayout = element(
+            "p:sldLayout/p:cSld/p:spTree/(p:sp/p:nvSpPr/(p:cNvPr{id=2},p:cNvSpPr"
+            ",p:nvPr/p:ph{type=title}),p:sp/p:nvSpPr/(p:cNvPr{id=3},p:cNvSpPr,p:n"
+            "vPr/p:ph{idx=1}))"
+        )
+        placeholders = LayoutPlaceholders(sldLayout.cSld.spTree, None)
+        iter_ = method_mock(
+            request,
+            LayoutPlaceholders,
+            "__iter__",
+            side_effect=lambda *args: iter(
+                [LayoutPlaceholder(sp, None) for sp in sldLayout.cSld.spTree[:]]
+            ),
+        )
+
+        title = placeholders.get(0)
+        body = placeholders.get(1)
+        assert iter_.call_count == 1
+        assert title.element is sldLayout.cSld.spTree[0]
+        assert body.element is sldLayout.cSld.spTree[1]
+
+        body.element.ph.idx = 7
+
+        assert placeholders.get(1) is None
+        assert placeholders.get(7) is not None
+        assert iter_.call_count == 2
+
+    def and_it_notices_placeholders_removed_or_added(self):
+        sldLayout = element(
+            "p:sldLayout/p:cSld/p:spTree/(p:sp/p:nvSpPr/(p:cNvPr{id=2},p:cNvSpPr"
+            ",p:nvPr/p:ph{type=title}),p:sp/p:nvSpPr/(p:cNvPr{id=3},p:cNvSpPr,p:n"
+            "vPr/p:ph{idx=1}))"
+        )
+        spTree = sldLayout.cSld.spTree
+        placeholders = LayoutPlaceholders(spTree, None)
+        body = placeholders.get(1)
+
+        spTree.remove(body.element)
+
+        assert placeholders.get(1) is None
+
+        spTree.append(body.element)
+
+        assert placeholders.get(1).element is body.element
+
+    def and_it_notices_a_placeholder_given_the_idx_it_looked_for(self):
+        sldLayout = element(
+            "p:sldLayout/p:cSld/p:spTree/p:sp/p:nvSpPr/(p:cNvPr{id=2},p:cNvSpPr,p:"
+            "nvPr/p:ph{idx=1})"
+        )
+        placeholders = LayoutPlaceholders(sldLayout.cSld.spTree, None)
+        assert placeholders.get(5) is None
+        body = placeholders.get(1)
+
+        body.element.ph.idx = 5
+
+        assert placeholders.get(5).element is body.element
+        assert placeholders.get(1) is None
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
     def default_fixture(self, _iter_):
-        placeholders = LayoutPlaceholders(None, None)
+        placeholders = LayoutPlaceholders(element("p:spTree"), None)
         default = "barfoo"
         return placeholders, default
 
@@ -1563,9 +1684,12 @@ class DescribeLayoutPlaceholders(object):
     @pytest.fixture(params=[0, 1])
     def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
         idx = request.param
-        layout_placeholders = LayoutPlaceholders(None, None)
+        spTree = element("p:spTree")
+        layout_placeholders = LayoutPlaceholders(spTree, None)
         _placeholder_ = (placeholder_, placeholder_2_)[idx]
         placeholder_.element.ph_idx, placeholder_2_.element.ph_idx = 0, 1
+        for ph_ in (placeholder_, placeholder_2_):
+            ph_.element.getparent.return_value = spTree
         return layout_placeholders, idx, _placeholder_
 
     # fixture components ---------------------------------------------
@@ -1714,7 +1838,7 @@ class DescribeMasterPlaceholders(object):
 
     @pytest.fixture
     def default_fixture(self, _iter_):
-        placeholders = MasterPlaceholders(None, None)
+        placeholders = MasterPlaceholders(element("p:spTree"), None)
         default = "barfoo"
         return placeholders, default
 
@@ -1727,8 +1851,11 @@ class DescribeMasterPlaceholders(object):
     @pytest.fixture(params=["title", "body"])
     def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
         ph_type = request.param
-        placeholders = MasterPlaceholders(None, None)
+        spTree = element("p:spTree")
+        placeholders = MasterPlaceholders(spTree, None)
         _placeholder_ = {"title": placeholder_, "body": placeholder_2_}[ph_type]
+        for ph_ in (placeholder_, placeholder_2_):
+            ph_.element.getparent.return_value = spTree
         return placeholders, ph_type, _placeholder_
 
     # fixture components ---------------------------------------------
@@ -8,12 +8,15 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import os
 
+from io import BytesIO
+
 import pytest
 
-from pptx.api import Presentation
+from pptx.api import build_sharded, merge, Presentation
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.parts.presentation import PresentationPart
 
+from .unitutil.file import testfile
 from .unitutil.mock import class_mock, instance_mock
 
 
@@ -21,7 +24,7 @@ class DescribePresentation(object):
     def it_opens_default_template_on_no_path_provided(self, call_fixture):
         Package_, path, prs_ = call_fixture
         prs = Presentation()
-        Package_.open.assert_called_once_with(path)
+        Package_.open.assert_called_once_with(path, workers=None)
         assert prs is prs_
 
     # fixtures -------------------------------------------------------
@@ -51,3 +54,56 @@ class DescribePresentation(object):
     @pytest.fixture
     def prs_part_(self, request):
         return instance_mock(request, PresentationPart)
+
+
+class DescribeMerge(object):
+    def it_writes_the_slides_of_each_presentation_in_order(self):
+        sources = []
+        for title in ("first", "second"):
+            src = Presentation()
+            slide = src.slides.add_slide(src.slide_layouts[1])
+            slide.shapes.title.text = title
+            slide.shapes.add_picture(testfile("monty-truth.png"), 0, 0)
+            slide.notes_slide.notes_text_frame.text = "%s notes" % title
+            stream = BytesIO()
+            src.save(stream)
+            sources.append(stream)
+        out = BytesIO()
+
+        merge(sources, out)
+
+        prs = Presentation(out)
+        slides = list(prs.slides)
+        assert [slide.shapes.title.text for slide in slides] == ["first", "second"]
+        assert [slide.notes_slide.notes_text_frame.text for slide in slides] == [
+            "first notes",
+            "second notes",
+        ]
+        assert len(prs.slide_masters) == 1
+        assert slides[0].shapes[-1].image.sha1 == slides[1].shapes[-1].image.sha1
+        assert slides[0].shapes[-1]._pic.blip_rId in slides[0].part.rels
+
+
+class DescribeBuildSharded(object):
+    def it_builds_slides_on_worker_processes(self):
+        prs = build_sharded(_build_titled_slides, 5, processes=2, shard_size=2)
+
+        slides = list(prs.slides)
+        assert [slide.shapes.title.text for slide in slides] == [
+            "slide %d" % idx for idx in range(5)
+        ]
+        assert [slide.part.partname for slide in slides] == [
+            "/ppt/slides/slide%d.xml" % idx for idx in range(1, 6)
+        ]
+        image_parts = set(slide.shapes[-1].image.sha1 for slide in slides)
+        assert len(image_parts) == 1
+        assert slides[3].notes_slide.notes_text_frame.text == "notes 3"
+
+
+def _build_titled_slides(prs, start, stop):
+    for idx in range(start, stop):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = "slide %d" % idx
+        slide.shapes.add_picture(testfile("monty-truth.png"), 0, 0)
+        if idx % 2:
+            slide.notes_slide.notes_text_frame.text = "notes %d" % idx
@@ -0,0 +1,54 @@
+# encoding: utf-8
+
+"""Unit-test suite for pptx.instrument module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import io
+
+from pptx.instrument import (
+    _ATTR_BYTES,
+    _NODE_BYTES,
+    PackageSaveEvent,
+    PartSaveEvent,
+    TopPartsProfiler,
+    tree_memory_estimate,
+)
+
+from .unitutil.cxml import element
+
+
+class DescribeTopPartsProfiler(object):
+    def it_knows_the_costliest_parts(self):
+        profiler = TopPartsProfiler()
+        events = [
+            PartSaveEvent("/a.xml", "ct", 10, 5, 1.0, 1.0),
+            PartSaveEvent("/b.xml", "ct", 10, 5, 5.0, 0.5),
+            PartSaveEvent("/c.xml", "ct", 10, 5, 0.5, 3.0),
+        ]
+        for event in events:
+            profiler.part_saved(event)
+
+        assert [e.partname for e in profiler.top(2)] == ["/b.xml", "/c.xml"]
+
+    def it_can_print_a_report(self):
+        profiler = TopPartsProfiler()
+        profiler.part_saved(PartSaveEvent("/a.xml", "ct", 1000, 400, 1.5, 0.25))
+        profiler.package_saved(PackageSaveEvent(1, 0.5, 3.0))
+        file = io.StringIO()
+
+        profiler.print_report(n=5, file=file)
+
+        lines = file.getvalue().splitlines()
+        assert lines[1].split() == ["/a.xml", "1000", "400", "1.50", "0.25"]
+        assert lines[2] == "1 parts in 1 saves, 0.5 ms marshal, 3.0 ms total"
+
+
+class Describe_tree_memory_estimate(object):
+    def it_counts_elements_and_estimates_bytes(self):
+        sld = element(
+            'p:sld/p:cSld{name=foo}/p:spTree/p:sp/p:txBody/a:p/a:r/a:t"bar"'
+        )
+        element_count, approx_bytes = tree_memory_estimate(sld)
+        assert element_count == 8
+        assert approx_bytes == 9 * _NODE_BYTES + _ATTR_BYTES + 3
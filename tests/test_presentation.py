@@ -77,10 +77,15 @@ class DescribePresentation(object):
         assert slide_masters is slide_masters_
         assert prs._element.xml == expected_xml
 
+    def it_provides_access_to_its_package(self, prs_part_):
+        prs = Presentation(None, prs_part_)
+        assert prs.package is prs_part_.package
+
     def it_can_save_the_presentation_to_a_file(self, save_fixture):
         prs, file_, prs_part_ = save_fixture
-        prs.save(file_)
-        prs_part_.save.assert_called_once_with(file_)
+        report = prs.save(file_, optimize=True, profiler=42, collect_garbage=True)
+        prs_part_.save.assert_called_once_with(file_, True, 42, True)
+        assert report is prs_part_.save.return_value
 
     # fixtures -------------------------------------------------------
 
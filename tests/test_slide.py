@@ -11,7 +11,6 @@ from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.package import Package
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import SlideLayoutPart, SlideMasterPart, SlidePart
-from pptx.presentation import Presentation
 from pptx.shapes.base import BaseShape
 from pptx.shapes.placeholder import LayoutPlaceholder, NotesSlidePlaceholder
 from pptx.shapes.shapetree import (
@@ -40,7 +39,14 @@ from pptx.slide import (
 from pptx.text.text import TextFrame
 
 from .unitutil.cxml import element, xml
-from .unitutil.mock import call, class_mock, instance_mock, method_mock, property_mock
+from .unitutil.mock import (
+    call,
+    class_mock,
+    instance_mock,
+    method_mock,
+    Mock,
+    property_mock,
+)
 
 
 class Describe_BaseSlide(object):
@@ -470,15 +476,98 @@ class DescribeSlides(object):
         with pytest.raises(IndexError):
             slides[2]
 
-    def it_knows_the_index_of_a_slide_it_contains(self, index_fixture):
-        slides, slide, expected_value = index_fixture
-        index = slides.index(slide)
-        assert index == expected_value
+    def it_knows_the_index_of_a_slide_it_contains(self, part_prop_, slide_):
+        prs_part_ = part_prop_.return_value
+        prs_part_.slide_position.return_value = 1
+        slides = Slides(element("p:sldIdLst"), None)
+
+        index = slides.index(slide_)
 
-    def it_raises_on_slide_not_in_collection(self, raises_fixture):
-        slides, slide = raises_fixture
+        prs_part_.slide_position.assert_called_once_with(slide_.part)
+        assert index == 1
+
+    def it_raises_on_slide_not_in_collection(self, part_prop_, slide_):
+        part_prop_.return_value.slide_position.side_effect = ValueError
+        slides = Slides(element("p:sldIdLst"), None)
         with pytest.raises(ValueError):
-            slides.index(slide)
+            slides.index(slide_)
+
+    def it_can_reorder_its_slides(self, part_prop_):
+        sldIdLst = element(
+            "p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b},p:sldId{r:id=c})"
+        )
+        slides = Slides(sldIdLst, None)
+
+        slides.reorder(iter([1, 2, 0]))
+
+        assert [sldId.rId for sldId in sldIdLst] == ["b", "c", "a"]
+        part_prop_.return_value.slides_reordered.assert_called_once_with()
+
+    @pytest.mark.parametrize("permutation", ([0, 1], [0, 1, 1], [0, 1, 3]))
+    def it_raises_on_reorder_not_a_permutation(self, part_prop_, permutation):
+        slides = Slides(
+            element("p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b},p:sldId{r:id=c})"),
+            None,
+        )
+        with pytest.raises(ValueError):
+            slides.reorder(permutation)
+
+    @pytest.mark.parametrize(
+        "src_indices, dst, expected_order",
+        (
+            ([3, 4], 0, [3, 4, 0, 1, 2]),
+            ([0], 4, [1, 2, 3, 4, 0]),
+            ([4, 1], 1, [0, 4, 1, 2, 3]),
+            ([-1], 2, [0, 1, 4, 2, 3]),
+        ),
+    )
+    def it_can_move_slides(self, reorder_, src_indices, dst, expected_order):
+        slides = Slides(element("p:sldIdLst/(%s)" % ",".join(["p:sldId"] * 5)), None)
+        slides.move(src_indices, dst)
+        reorder_.assert_called_once_with(slides, expected_order)
+
+    @pytest.mark.parametrize(
+        "src_indices, dst, exception",
+        (
+            ([5], 0, IndexError),
+            ([0, 1], 4, IndexError),
+            ([0], -1, IndexError),
+            ([1, 1], 0, ValueError),
+        ),
+    )
+    def it_raises_on_move_out_of_range(self, src_indices, dst, exception):
+        slides = Slides(element("p:sldIdLst/(%s)" % ",".join(["p:sldId"] * 5)), None)
+        with pytest.raises(exception):
+            slides.move(src_indices, dst)
+
+    def it_can_import_slides_from_another_presentation(self, request, part_prop_):
+        src_slides = [instance_mock(request, Slide) for _ in range(3)]
+        src_prs = Mock(name="src_prs", slides=src_slides)
+        prs_part_ = part_prop_.return_value
+        prs_part_.import_slides.return_value = [("rId7", "slide-7")]
+        sldIdLst = element("p:sldIdLst/p:sldId{r:id=rId1,id=256}")
+        slides = Slides(sldIdLst, None)
+
+        imported = slides.import_from(src_prs, [2])
+
+        prs_part_.import_slides.assert_called_once_with([src_slides[2].part])
+        assert sldIdLst[1].rId == "rId7"
+        prs_part_.slide_appended.assert_called_once_with(sldIdLst[1])
+        assert imported == ["slide-7"]
+
+    def it_can_import_slides_serialized_in_shards(self, part_prop_):
+        prs_part_ = part_prop_.return_value
+        prs_part_.import_shards.return_value = [("rId3", "slide-3")]
+        sldIdLst = element("p:sldIdLst/p:sldId{r:id=rId1,id=256}")
+        slides = Slides(sldIdLst, None)
+
+        imported = slides.import_shards(["shard"])
+
+        prs_part_.import_shards.assert_called_once_with(["shard"])
+        assert sldIdLst[1].rId == "rId3"
+        assert sldIdLst[1].id == 257
+        prs_part_.slide_appended.assert_called_once_with(sldIdLst[1])
+        assert imported == ["slide-3"]
 
     def it_can_iterate_its_slides(self, iter_fixture):
         slides, related_slide_, calls, expected_value = iter_fixture
@@ -547,15 +636,6 @@ class DescribeSlides(object):
         slides = Slides(sldIdLst, None)
         return slides
 
-    @pytest.fixture(params=[0, 1])
-    def index_fixture(self, request, part_prop_):
-        idx = request.param
-        sldIdLst = element("p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})")
-        slides = Slides(sldIdLst, None)
-        _slides = [Slide(element("p:sld"), None), Slide(element("p:sld"), None)]
-        part_prop_.return_value.related_slide.side_effect = _slides
-        return slides, _slides[idx], idx
-
     @pytest.fixture
     def iter_fixture(self, part_prop_, slide_):
         sldIdLst = element("p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})")
@@ -578,12 +658,6 @@ class DescribeSlides(object):
         slides = Slides(element(sldIdLst_cxml), None)
         return slides, expected_value
 
-    @pytest.fixture
-    def raises_fixture(self):
-        slides = Slides(element("p:sldIdLst"), None)
-        slide = Slide(element("p:sld"), None)
-        return slides, slide
-
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -594,6 +668,10 @@ class DescribeSlides(object):
     def prs_part_(self, request):
         return instance_mock(request, PresentationPart)
 
+    @pytest.fixture
+    def reorder_(self, request):
+        return method_mock(request, Slides, "reorder", autospec=True)
+
     @pytest.fixture
     def slide_(self, request):
         return instance_mock(request, Slide)
@@ -644,23 +722,30 @@ class DescribeSlideLayout(object):
         assert slide_master is slide_master_
 
     def it_knows_which_slides_are_based_on_it(
-        self,
-        used_by_fixture,
-        part_prop_,
-        slide_layout_part_,
-        package_,
-        presentation_part_,
-        presentation_,
+        self, part_prop_, slide_layout_part_, package_, presentation_part_, slide_
     ):
-        presentation_, slide_layout, expected_value = used_by_fixture
         part_prop_.return_value = slide_layout_part_
         slide_layout_part_.package = package_
         package_.presentation_part = presentation_part_
-        presentation_part_.presentation = presentation_
+        presentation_part_.slides_using.return_value = (slide_,)
+        slide_layout = SlideLayout(None, None)
 
         used_by_slides = slide_layout.used_by_slides
 
-        assert used_by_slides == expected_value
+        presentation_part_.slides_using.assert_called_once_with(slide_layout_part_)
+        assert used_by_slides == (slide_,)
+
+    def it_tells_its_slide_master_when_it_is_renamed(
+        self, part_prop_, slide_layout_part_, slide_master_, slide_master_part_
+    ):
+        slide_layout_part_.slide_master = slide_master_
+        slide_master_.part = slide_master_part_
+        slide_layout = SlideLayout(element("p:sldLayout/p:cSld"), None)
+
+        slide_layout.name = "Foobar"
+
+        assert slide_layout.name == "Foobar"
+        slide_master_part_.slide_layout_renamed.assert_called_once_with()
 
     # fixtures -------------------------------------------------------
 
@@ -684,17 +769,6 @@ class DescribeSlideLayout(object):
         placeholders_prop_.return_value = _placeholders
         return slide_layout, expected_placeholders
 
-    @pytest.fixture(params=[(), (0,), (1,), (0, 1)])
-    def used_by_fixture(self, request, presentation_, slide_, slide_2_):
-        used_by_idxs = request.param
-        slides = (slide_, slide_2_)
-        slide_layout = SlideLayout(None, None)
-        for idx, s in enumerate(slides):
-            s.slide_layout = slide_layout if idx in used_by_idxs else None
-        presentation_.slides = slides
-        expected_value = tuple(s for i, s in enumerate(slides) if i in used_by_idxs)
-        return presentation_, slide_layout, expected_value
-
     # fixture components -----------------------------------
 
     @pytest.fixture
@@ -735,10 +809,6 @@ class DescribeSlideLayout(object):
             request, SlideLayout, "placeholders", return_value=placeholders_
         )
 
-    @pytest.fixture
-    def presentation_(self, request):
-        return instance_mock(request, Presentation)
-
     @pytest.fixture
     def presentation_part_(self, request):
         return instance_mock(request, PresentationPart)
@@ -751,10 +821,6 @@ class DescribeSlideLayout(object):
     def slide_(self, request):
         return instance_mock(request, Slide)
 
-    @pytest.fixture
-    def slide_2_(self, request):
-        return instance_mock(request, Slide)
-
     @pytest.fixture
     def slide_layout_part_(self, request):
         return instance_mock(request, SlideLayoutPart)
@@ -763,6 +829,10 @@ class DescribeSlideLayout(object):
     def slide_master_(self, request):
         return instance_mock(request, SlideMaster)
 
+    @pytest.fixture
+    def slide_master_part_(self, request):
+        return instance_mock(request, SlideMasterPart)
+
 
 class DescribeSlideLayouts(object):
     def it_supports_len(self, len_fixture):
@@ -807,21 +877,22 @@ class DescribeSlideLayouts(object):
             slide_layouts[1]
 
     def it_can_find_a_slide_layout_by_name(
-        self, _iter_, slide_layout_, slide_layout_2_
+        self, part_prop_, slide_master_part_, slide_layout_
     ):
-        _iter_.return_value = iter((slide_layout_, slide_layout_2_))
-        slide_layout_2_.name = "pick me!"
+        part_prop_.return_value = slide_master_part_
+        slide_master_part_.slide_layout_named.return_value = slide_layout_
         slide_layouts = SlideLayouts(None, None)
 
         slide_layout = slide_layouts.get_by_name("pick me!")
 
-        assert slide_layout is slide_layout_2_
+        slide_master_part_.slide_layout_named.assert_called_once_with("pick me!")
+        assert slide_layout is slide_layout_
 
     def but_it_returns_the_default_value_when_no_layout_has_that_name(
-        self, _iter_, slide_layout_, slide_layout_2_
+        self, part_prop_, slide_master_part_
     ):
-        _iter_.return_value = iter((slide_layout_, slide_layout_2_))
-        slide_layout_2_.name = "not the droid you're looking for"
+        part_prop_.return_value = slide_master_part_
+        slide_master_part_.slide_layout_named.return_value = None
         slide_layouts = SlideLayouts(None, None)
 
         # ---default-default is None---
@@ -833,23 +904,28 @@ class DescribeSlideLayouts(object):
         assert slide_layout == "default-value"
 
     def it_knows_the_index_of_each_of_its_slide_layouts(
-        self, _iter_, slide_layout_, slide_layout_2_
+        self, part_prop_, slide_master_part_, slide_layout_
     ):
-        _iter_.return_value = iter((slide_layout_, slide_layout_2_))
+        part_prop_.return_value = slide_master_part_
+        slide_master_part_.slide_layout_position.return_value = 1
         slide_layouts = SlideLayouts(None, None)
 
-        index = slide_layouts.index(slide_layout_2_)
+        index = slide_layouts.index(slide_layout_)
 
+        slide_master_part_.slide_layout_position.assert_called_once_with(
+            slide_layout_.part
+        )
         assert index == 1
 
     def but_it_raises_on_slide_layout_not_in_collection(
-        self, _iter_, slide_layout_, slide_layout_2_
+        self, part_prop_, slide_master_part_, slide_layout_
     ):
-        _iter_.return_value = iter((slide_layout_,))
+        part_prop_.return_value = slide_master_part_
+        slide_master_part_.slide_layout_position.return_value = None
         slide_layouts = SlideLayouts(None, None)
 
         with pytest.raises(ValueError) as e:
-            slide_layouts.index(slide_layout_2_)
+            slide_layouts.index(slide_layout_)
         assert str(e.value) == "layout not in this SlideLayouts collection"
 
     def it_can_remove_an_unused_slide_layout(
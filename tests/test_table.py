@@ -4,6 +4,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import io
+
 import pytest
 
 from pptx.dml.fill import FillFormat
@@ -20,10 +22,12 @@ from pptx.table import (
     _RowCollection,
     Table,
 )
+from pptx.text.layout import FontMetrics
 from pptx.text.text import TextFrame
 from pptx.util import Inches, Length, Pt
 
 from .unitutil.cxml import element, xml
+from .unitutil.file import testfile
 from .unitutil.mock import call, class_mock, instance_mock, property_mock
 
 
@@ -71,6 +75,213 @@ class DescribeTable(object):
         table.notify_height_changed()
         assert table._graphic_frame.height == expected_height
 
+    def it_can_style_a_range_of_cells(self):
+        tbl = element(
+            "a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),"
+            "a:tr/(a:tc/a:txBody/a:p/a:r,a:tc),a:tr/(a:tc,a:tc))"
+        )
+        table = Table(tbl, None)
+
+        table.style_range(
+            rows=slice(0, 1), fill="FF0000", border="0000FF", font={"bold": True}
+        )
+
+        tc_lst = tbl.tr_lst[0].tc_lst
+        for tc in tc_lst:
+            assert tc.tcPr.solidFill.srgbClr.val == "FF0000"
+            assert tc.tcPr.lnL is not None and tc.tcPr.lnB is not None
+        assert tc_lst[0].xpath("./a:txBody/a:p/a:r/a:rPr/@b") == ["1"]
+        assert tbl.tr_lst[1].tc_lst[0].tcPr is None
+
+    def it_can_outline_or_grid_a_range_of_cells(self):
+        tbl = element(
+            "a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))"
+        )
+        table = Table(tbl, None)
+
+        table.style_range(border="000000", border_mode="outer")
+        top_left = tbl.tr_lst[0].tc_lst[0].tcPr
+        assert [top_left.lnL, top_left.lnT] != [None, None]
+        assert (top_left.lnR, top_left.lnB) == (None, None)
+
+        table.style_range(border="000000", border_mode="inner")
+        bottom_right = tbl.tr_lst[1].tc_lst[1].tcPr
+        assert bottom_right.lnL is not None and bottom_right.lnT is not None
+
+    def it_resolves_the_cell_covering_a_grid_position(self):
+        tbl = element(
+            "a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))"
+        )
+        table = Table(tbl, None)
+        table.cell(0, 0).merge(table.cell(1, 0))
+
+        assert table.origin_cell(1, 0)._tc is tbl.tc(0, 0)
+        assert table.origin_cell(1, 1)._tc is tbl.tc(1, 1)
+        assert [c._tc for c in table.iter_real_cells()] == [
+            tbl.tc(0, 0), tbl.tc(0, 1), tbl.tc(1, 1)
+        ]
+        with pytest.raises(ValueError):
+            table.cell(0, 1).merge(table.cell(1, 0))
+
+        table.cell(0, 0).split()
+
+        assert table.origin_cell(1, 0)._tc is tbl.tc(1, 0)
+        assert len(list(table.iter_real_cells())) == 4
+
+    def it_sees_cells_merged_through_its_rows(self):
+        tbl = CT_Table.new_tbl(3, 3, 300, 300)
+        table = Table(tbl, None)
+        assert len(list(table.iter_real_cells())) == 9
+
+        table.rows[0].cells[0].merge(table.rows[1].cells[1])
+
+        assert len(list(table.iter_real_cells())) == 6
+        assert table.origin_cell(1, 1)._tc is tbl.tc(0, 0)
+        assert table.cell_idx(table.cell(2, 2)) == (2, 2)
+
+        table.rows[0].cells[0].split()
+
+        assert len(list(table.iter_real_cells())) == 9
+
+    def it_sees_cells_merged_through_another_table(self):
+        tbl = CT_Table.new_tbl(3, 3, 300, 300)
+        table, other_table = Table(tbl, None), Table(tbl, None)
+        assert len(list(table.iter_real_cells())) == 9
+
+        other_table.cell(0, 0).merge(other_table.cell(0, 1))
+        other_table.cell(0, 0).split()
+        other_table.cell(1, 0).merge(other_table.cell(1, 1))
+
+        assert table.origin_cell(1, 1)._tc is tbl.tc(1, 0)
+        assert table.origin_cell(0, 1)._tc is tbl.tc(0, 1)
+        assert [table.cell_idx(c) for c in table.iter_real_cells()] == [
+            (0, 0), (0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1), (2, 2)
+        ]
+
+    def it_keeps_its_span_map_across_merges_and_splits(self):
+        table = Table(CT_Table.new_tbl(3, 3, 300, 300), None)
+        span_map = table._span_map
+
+        table.cell(0, 0).merge(table.cell(1, 1))
+        table.rows[2].cells[0].merge(table.rows[2].cells[2])
+        table.cell(0, 0).split()
+
+        assert table._span_map is span_map
+        assert table.origin_cell(2, 2)._tc is table.cell(2, 0)._tc
+
+    def it_rebuilds_its_span_map_when_rows_change_through_another_proxy(self):
+        tbl = CT_Table.new_tbl(3, 2, 300, 300)
+        table, other_table = Table(tbl, None), Table(tbl, None)
+        list(table.iter_real_cells())
+
+        other_table.delete_row(0)
+        other_table.add_row()
+
+        assert [c._tc for c in table.iter_real_cells()] == list(tbl.iter_tcs())
+        assert table.cell_idx(table.cell(0, 0)) == (0, 0)
+
+    def it_can_extend_its_rows_in_chunks(self, graphic_frame_):
+        tbl = element("a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr{h=10})")
+        table = Table(tbl, graphic_frame_)
+        progress = []
+
+        added = table.extend_rows(
+            ((str(i), i) for i in range(7)),
+            chunk_size=3,
+            max_rows=5,
+            progress=progress.append,
+        )
+
+        assert added == 5
+        assert progress == [3, 5]
+        assert [tr.h for tr in tbl.tr_lst] == [10] * 6
+        assert [tc.text for tc in tbl.tr_lst[-1].tc_lst] == ["4", "4"]
+        assert graphic_frame_.height == 60
+
+    def but_it_needs_a_row_height_to_extend_a_table_having_no_rows(self):
+        tbl = element("a:tbl/a:tblGrid/(a:gridCol,a:gridCol)")
+        table = Table(tbl, None)
+
+        with pytest.raises(ValueError):
+            table.extend_rows([("a", "b")])
+        added = table.extend_rows([("a", "b")], height=Length(10))
+
+        assert added == 1
+        assert [tr.h for tr in tbl.tr_lst] == [10]
+
+    def it_can_extend_its_rows_from_csv(self):
+        tbl = element("a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr{h=10})")
+        table = Table(tbl, None)
+        csv_file = io.StringIO("name,qty\nfoo,1\nbar,\n")
+
+        added = table.extend_rows_from_csv(csv_file, skip_header=True)
+
+        assert added == 2
+        assert [tc.text for tc in tbl.tr_lst[2].tc_lst] == ["bar", ""]
+
+    def it_can_extend_its_rows_from_arrow_record_batches(self):
+        class Column(list):
+            def to_pylist(self):
+                return list(self)
+
+        class RecordBatch(object):
+            num_rows = 2
+            columns = [Column(["x", "y"]), Column([1, None])]
+
+        tbl = element("a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr{h=10})")
+        table = Table(tbl, None)
+
+        added = table.extend_rows_from_arrow(RecordBatch())
+
+        assert added == 2
+        assert [tc.text for tc in tbl.tr_lst[1].tc_lst] == ["x", "1"]
+        assert [tc.text for tc in tbl.tr_lst[2].tc_lst] == ["y", ""]
+
+    def it_can_size_rows_and_columns_to_their_text(self):
+        tbl = element(
+            "a:tbl/(a:tblGrid/(a:gridCol{w=10},a:gridCol{w=20}),"
+            "a:tr{h=5}/(a:tc/a:txBody/a:p/a:r/a:t\"foo bar baz\",a:tc),"
+            "a:tr{h=5}/(a:tc/a:txBody/a:p/a:r/a:t\"foo\",a:tc))"
+        )
+        table = Table(tbl, None)
+        font_file = testfile("calibriz.ttf")
+        metrics = FontMetrics.for_font(font_file, 18)
+        margins = 91440 + 91440
+        max_col_width = metrics.text_width("foo bar") + margins
+
+        table.autofit(font_file=font_file, max_col_width=max_col_width)
+
+        assert [gridCol.w for gridCol in tbl.tblGrid.gridCol_lst] == [
+            max_col_width, 20
+        ]
+        assert [tr.h for tr in tbl.tr_lst] == [
+            2 * metrics.line_height + 45720 * 2,
+            metrics.line_height + 45720 * 2,
+        ]
+
+    def but_it_raises_on_an_unknown_border_mode(self):
+        table = Table(element("a:tbl/a:tblGrid/a:gridCol"), None)
+        with pytest.raises(ValueError):
+            table.style_range(border="000000", border_mode="diagonal")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        (
+            {"fill": "FF00"},
+            {"border": "GG0000"},
+            {"border": ("12345", Pt(2))},
+            {"font": {"color": "#FF0000"}},
+        ),
+    )
+    def and_it_raises_on_an_invalid_color(self, kwargs):
+        tbl = element("a:tbl/(a:tblGrid/a:gridCol,a:tr/a:tc)")
+        table = Table(tbl, None)
+
+        with pytest.raises(ValueError):
+            table.style_range(**kwargs)
+
+        assert tbl.tr_lst[0].tc_lst[0].tcPr is None
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
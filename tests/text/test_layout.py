@@ -8,7 +8,15 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
-from pptx.text.layout import _BinarySearchTree, _Line, _LineSource, TextFitter
+from pptx.text.layout import (
+    _BinarySearchTree,
+    _Line,
+    _LineSource,
+    FontMetrics,
+    TextFitter,
+)
+
+from ..unitutil.file import testfile
 
 from ..unitutil.mock import (
     call,
@@ -229,6 +237,38 @@ class DescribeTextFitter(object):
         return method_mock(request, TextFitter, "_wrap_lines")
 
 
+class DescribeFontMetrics(object):
+    def it_measures_text_from_cached_glyph_widths(self, metrics):
+        width = metrics.text_width("abba")
+
+        assert width == 2 * metrics.text_width("ab") > 0
+        assert sorted(metrics._widths) == ["a", "b"]
+
+    def it_knows_the_height_of_a_line(self, metrics):
+        assert 12700 * 18 <= metrics.line_height <= 12700 * 18 * 1.5
+
+    def it_counts_the_lines_of_wrapped_text(self, metrics):
+        width = metrics.text_width("foo bar")
+
+        assert metrics.line_count("", width) == 1
+        assert metrics.line_count("foo bar", width) == 1
+        assert metrics.line_count("foo bar baz", width) == 2
+        assert metrics.line_count("foo\nbar\vbaz", width * 10) == 3
+        assert metrics.line_count("foobarfoobar", width) == 2
+
+    def it_shares_one_instance_per_font_and_size(self):
+        font_file = testfile("calibriz.ttf")
+        metrics = FontMetrics.for_font(font_file, 12)
+        assert FontMetrics.for_font(font_file, 12) is metrics
+        assert FontMetrics.for_font(font_file, 14) is not metrics
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def metrics(self):
+        return FontMetrics(testfile("calibriz.ttf"), 18)
+
+
 class Describe_BinarySearchTree(object):
     def it_can_construct_from_an_ordered_sequence(self):
         bst = _BinarySearchTree.from_ordered_sequence(range(10))
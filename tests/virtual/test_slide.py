@@ -0,0 +1,121 @@
+# encoding: utf-8
+
+"""Unit-test suite for pptx.virtual.slide module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import threading
+
+import pytest
+
+from pptx import Presentation
+from pptx.virtual.slide import Slide, append_slides
+
+from ..unitutil.file import testfile
+
+
+class DescribeSlide(object):
+    def it_starts_with_the_placeholders_of_its_layout(self):
+        slide = Slide(1)
+        other = Slide(1)
+
+        assert slide.slide_layout.name == "Title and Content"
+        assert [p.placeholder_format.idx for p in slide.placeholders] == [0, 1]
+        assert slide._element is not other._element
+        assert slide.shapes[0]._element is not other.shapes[0]._element
+        assert slide.element.xml == Slide._skeletons[1].xml
+
+    def it_delegates_to_the_slide_it_wraps(self):
+        slide = Slide(6)
+
+        assert slide.shapes is slide._slide.shapes
+        with pytest.raises(AttributeError):
+            slide.foobar
+
+    def it_can_be_created_on_several_threads(self):
+        Slide._skeletons = None
+        slides = []
+
+        def create():
+            for _ in range(20):
+                slides.append(Slide(1))
+
+        threads = [threading.Thread(target=create) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(slides) == 80
+        assert all(len(slide.placeholders) == 2 for slide in slides)
+
+    def and_it_copies_a_skeleton_without_holding_the_lock(self):
+        Slide(6)
+        slides = []
+
+        with Slide._skeletons_lock:
+            thread = threading.Thread(target=lambda: slides.append(Slide(6)))
+            thread.daemon = True
+            thread.start()
+            thread.join(5)
+            assert len(slides) == 1
+
+    def it_can_append_itself_to_a_presentation(self):
+        prs = Presentation()
+        slide = Slide(1)
+        slide.shapes.title.text = "foo"
+
+        new_slide = slide.append_to(prs)
+
+        assert list(prs.slides) == [new_slide]
+        assert new_slide.shapes.title.text == "foo"
+        assert new_slide.slide_layout == prs.slide_layouts[1]
+
+
+class Describe_append_slides(object):
+    def it_adds_copies_of_the_slides_in_order(self):
+        prs = Presentation()
+        prs.slides.add_slide(prs.slide_layouts[6])
+        slides = [Slide(idx) for idx in (1, 6)]
+        slides[0].shapes.title.text = "title"
+        slides[1].shapes.add_picture(testfile("monty-truth.png"), 0, 0)
+        slides[1].notes_slide.notes_text_frame.text = "notes"
+        layout_count = len(prs.slide_layouts)
+
+        new_slides = append_slides(prs, slides)
+
+        assert list(prs.slides)[1:] == new_slides
+        assert new_slides[0].shapes.title.text == "title"
+        assert new_slides[1].shapes[0].image.filename.startswith("image")
+        assert new_slides[1].part.package is prs.part.package
+        assert new_slides[1].notes_slide.notes_text_frame.text == "notes"
+        assert len(prs.slide_layouts) == layout_count
+
+    def it_can_add_the_same_slide_twice(self):
+        prs = Presentation()
+        slide = Slide(1)
+        slide.notes_slide.notes_text_frame.text = "notes"
+
+        new_slides = append_slides(prs, [slide, slide])
+
+        notes_slides = [new_slide.notes_slide for new_slide in new_slides]
+        assert notes_slides[0].part is not notes_slides[1].part
+        assert [n.notes_text_frame.text for n in notes_slides] == ["notes"] * 2
+
+    def it_uses_the_layout_having_the_same_name(self):
+        prs = Presentation()
+        prs.slide_layouts[1].name = "Renamed"
+        prs.slide_layouts[3].name = "Title and Content"
+
+        new_slides = append_slides(prs, [Slide(1), Slide(6)])
+
+        assert new_slides[0].slide_layout == prs.slide_layouts[3]
+        assert new_slides[1].slide_layout == prs.slide_layouts[6]
+
+    def but_it_uses_the_first_layout_when_none_has_that_name(self):
+        prs = Presentation()
+        prs.slide_layouts[6].name = "Renamed"
+
+        (new_slide,) = append_slides(prs, [Slide(6)])
+
+        assert new_slide.slide_layout == prs.slide_layouts[0]
@@ -0,0 +1,111 @@
+# encoding: utf-8
+
+"""Unit-test suite for pptx.virtual.table module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from pptx.dml.color import RGBColor
+from pptx.enum.text import MSO_ANCHOR
+from pptx.oxml.ns import qn
+from pptx.util import Emu, Pt
+from pptx.virtual.table import Table
+
+
+class DescribeTable(object):
+    def it_distributes_its_size_over_rows_and_columns(self):
+        table = Table(3, 2, 0, 0, 1001, 100)
+
+        assert (table.row_count, table.col_count) == (3, 2)
+        assert list(table._col_widths) == [500, 501]
+        assert list(table._row_heights) == [33, 33, 34]
+        assert (table.width, table.height) == (1001, 100)
+
+    @pytest.mark.parametrize("rows, cols", ((0, 2), (2, 0), (-1, 1)))
+    def it_raises_on_a_grid_with_no_cells(self, rows, cols):
+        with pytest.raises(ValueError):
+            Table(rows, cols, 0, 0, 100, 100)
+
+    def it_stores_cell_text_without_elements(self):
+        table = Table(2, 2, 0, 0, 100, 100)
+
+        table.cell(0, 1).text = "foo"
+        table.cell(-1, -1).text = "foo"
+
+        assert table.cell(0, 1).text == "foo"
+        assert table.cell(1, 1).text == "foo"
+        assert table.cell(0, 0).text == ""
+        assert len(table._strings) == 2
+
+    def it_raises_on_cell_out_of_range(self):
+        table = Table(2, 2, 0, 0, 100, 100)
+        with pytest.raises(IndexError):
+            table.cell(2, 0)
+
+    def it_interns_equal_cell_styles(self):
+        table = Table(2, 2, 0, 0, 100, 100)
+
+        table.cell(0, 0).set_style(bold=True, fill=RGBColor(1, 2, 3))
+        table.cell(1, 1).set_style(fill="010203", bold=True)
+        table.cell(1, 0).set_style(bold=True)
+        table.cell(1, 0).set_style(bold=None)
+
+        assert table._style_ids[0] == table._style_ids[3]
+        assert table._style_ids[2] == 0
+        assert table.cell(0, 0).style == {"bold": True, "fill": "010203"}
+
+    def it_raises_on_unsupported_style_property(self):
+        table = Table(1, 1, 0, 0, 100, 100)
+        with pytest.raises(ValueError):
+            table.cell(0, 0).set_style(underline=True)
+
+    @pytest.mark.parametrize(
+        "props", ({"fill": "12345"}, {"fill": "GG0000"}, {"color": "00FF00FF"})
+    )
+    def and_it_raises_on_an_invalid_color(self, props):
+        table = Table(1, 1, 0, 0, 100, 100)
+        with pytest.raises(ValueError):
+            table.cell(0, 0).set_style(**props)
+        assert table.cell(0, 0).style == {}
+
+    def it_can_grow_rows_and_columns(self):
+        table = Table(2, 2, 0, 0, 100, 100)
+        table.cell(1, 1).text = "x"
+
+        table.add_row()
+        table.add_column(Emu(7))
+
+        assert (table.row_count, table.col_count) == (3, 3)
+        assert table.cell(1, 1).text == "x"
+        assert table.cell(1, 2).text == ""
+        assert list(table._col_widths) == [50, 50, 7]
+        assert list(table._row_heights) == [50, 50, 50]
+
+    def it_materializes_a_graphicFrame(self):
+        table = Table(2, 2, 10, 20, 100, 60)
+        table.cell(0, 0).text = "a&b\nc\vd"
+        table.cell(1, 1).set_style(
+            fill=RGBColor(255, 0, 0),
+            color="00FF00",
+            size=Pt(12),
+            italic=True,
+            anchor=MSO_ANCHOR.MIDDLE,
+            margin_left=Emu(5),
+        )
+
+        graphicFrame = table.new_graphicFrame(42, "Table 41")
+
+        assert graphicFrame.shape_id == 42
+        assert graphicFrame.shape_name == "Table 41"
+        assert (graphicFrame.x, graphicFrame.y) == (10, 20)
+        assert (graphicFrame.cx, graphicFrame.cy) == (100, 60)
+        tbl = graphicFrame.graphic.graphicData.tbl
+        assert [gridCol.w for gridCol in tbl.tblGrid.gridCol_lst] == [50, 50]
+        assert tbl.tc(0, 0).text == "a&b\nc\vd"
+        tc = tbl.tc(1, 1)
+        assert tc.marL == 5
+        assert tc.anchor == MSO_ANCHOR.MIDDLE
+        assert tc.tcPr.find(qn("a:solidFill")) is not None
+        assert tc.txBody.find(qn("a:p")) is not None
+        assert tbl.tc(0, 1).tcPr is not None